@@ -24,40 +24,87 @@ import json
 import socket
 import threading
 import traceback
-import inspect
-
-try:
-    import Queue as queue  # Python 2 fallback
-except ImportError:
-    import queue
+import itertools
+import selectors
+import time
+from collections import deque
 
 from .liveapi_tools import LiveAPITools
 from .action_registry import build_registry
 from .action_validation import validate_payload
 
-try:
-    JSONDecodeError = json.JSONDecodeError
-except AttributeError:  # Python 2 compatibility
-    JSONDecodeError = ValueError
-
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 8001
 SOCKET_TIMEOUT = 30.0
 COMMAND_TIMEOUT = 25.0
+TICK_BUDGET_SECONDS = 0.002
+RECV_BUFFER_SIZE = 65536
+REACTOR_POLL_INTERVAL = 0.1
+# Per-connection backpressure: a client stops being read while this many of
+# its requests are unanswered or this many response bytes await the socket,
+# and resumes once the backlog drains.
+MAX_PENDING_REQUESTS = 16
+MAX_OUTBUF_BYTES = 262144
+# A request line longer than this without a newline closes the connection.
+MAX_LINE_BYTES = 4194304
 
 ERROR_INVALID_PARAMS = "ERR_INVALID_PARAMS"
 ERROR_NOT_FOUND = "ERR_NOT_FOUND"
 ERROR_EXECUTION_FAILED = "ERR_EXECUTION_FAILED"
 BUILTIN_ACTIONS = ("ping", "health_check", "list_tools", "get_available_tools")
 
+# ensure_ascii keeps the output pure ASCII, so encoding to bytes can never
+# fail on stray surrogates and needs no UTF-8 work.
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _encode_response(response):
+    """Serialise a response dict to one newline-terminated wire line."""
+    return (_encode_json(response) + "\n").encode("ascii")
+
+
+_PING_RESPONSE_BYTES = _encode_response(
+    {
+        "ok": True,
+        "message": "GatewayRemote online",
+        "script": "Gateway_Remote",
+    }
+)
+
+
+class _ClientConnection(object):
+    """Reactor-side state for one connected client socket."""
+
+    __slots__ = ("sock", "address", "inbuf", "scan_start", "outbuf", "pending", "last_active", "closed", "events")
+
+    def __init__(self, sock, address, now):
+        self.sock = sock
+        self.address = address
+        self.inbuf = bytearray()
+        self.scan_start = 0
+        self.outbuf = bytearray()
+        # Responses must leave in request order, so every request on this
+        # connection gets an entry [request_id, deadline, response] here and
+        # entries are flushed from the head once their response is known.
+        self.pending = deque()
+        self.last_active = now
+        self.closed = False
+        # Selector interest currently registered; 0 while reads are paused
+        # with nothing left to write.
+        self.events = selectors.EVENT_READ
+
 
 class GatewayRemote:
     """
     Standalone gateway that routes JSON commands to LiveAPITools.
 
-    The socket listener runs on a worker thread, while Ableton invokes
-    `update_display()` on the main thread. We leverage a pair of queues
-    (command + response) to keep all Live API calls on the main thread.
+    A single reactor thread multiplexes the listener and every client socket
+    with `selectors`, while Ableton invokes `update_display()` on the main
+    thread. Parsed commands are appended to a shared deque (append/popleft are
+    atomic in CPython, so no Python-level lock is taken), the main thread
+    routes them and posts the responses to an outbox deque, and a wakeup
+    socket tells the reactor to write them back. All Live API calls therefore
+    stay on the main thread and no thread is spawned per connection.
     """
 
     def __init__(self, c_instance, host=DEFAULT_HOST, port=DEFAULT_PORT):
@@ -69,15 +116,34 @@ class GatewayRemote:
 
         self.tools = LiveAPITools(self.song, self.c_instance)
         self.action_registry = build_registry(self.tools)
+        # The registry is fixed for the lifetime of the script, so the sorted
+        # action list is built once and shared (immutable) by every response.
+        self._available_actions_cached = tuple(sorted(set(BUILTIN_ACTIONS).union(self.action_registry)))
+        self._list_tools_bytes = _encode_response({"ok": True, "tools": self._available_actions_cached})
+        self._health_prefix, self._health_suffix = self._health_template()
+        # None of the built-ins touch Live state; each returns encoded bytes.
+        self._builtin_handlers = {
+            "ping": self._ping_response,
+            "health_check": self._health_payload,
+            "list_tools": self._list_tools_response,
+            "get_available_tools": self._list_tools_response,
+        }
 
-        self.command_queue = queue.Queue()
-        self.response_queues = {}
-        self.request_lock = threading.Lock()
-        self.request_counter = 0
+        self.command_queue = deque()
+        self._outbox = deque()
+        self._failures = deque()
+        self._request_ids = itertools.count()
+        self._connections = {}
+        # Only the reactor thread reads, so one receive buffer serves every
+        # connection and recv() never allocates a fresh bytes object.
+        self._recv_view = memoryview(bytearray(RECV_BUFFER_SIZE))
 
         self.server_socket = None
         self.listener_thread = None
         self.running = False
+        self._selector = None
+        self._wake_r = None
+        self._wake_w = None
 
         self._start_gateway()
         self.log("GatewayRemote initialized on {}:{}".format(self.host, self.port))
@@ -97,16 +163,25 @@ class GatewayRemote:
     # Socket server lifecycle
     # --------------------------------------------------------------------- #
     def _start_gateway(self):
-        """Create the TCP listener and spawn its background thread."""
+        """Create the TCP listener and spawn the reactor thread."""
         try:
             self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self.server_socket.bind((self.host, self.port))
             self.server_socket.listen(5)
+            self.server_socket.setblocking(False)
+
+            self._wake_r, self._wake_w = socket.socketpair()
+            self._wake_r.setblocking(False)
+            self._wake_w.setblocking(False)
+
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self.server_socket, selectors.EVENT_READ, None)
+            self._selector.register(self._wake_r, selectors.EVENT_READ, self._wake_r)
 
             self.running = True
             self.listener_thread = threading.Thread(
-                target=self._socket_listener, name="GatewayRemoteListener", daemon=True
+                target=self._reactor_loop, name="GatewayRemoteListener", daemon=True
             )
             self.listener_thread.start()
         except Exception as exc:
@@ -114,97 +189,300 @@ class GatewayRemote:
             self.log(traceback.format_exc())
             raise
 
-    def _socket_listener(self):
-        """Accept incoming client connections."""
-        while self.running:
-            try:
-                client_socket, address = self.server_socket.accept()
-                self.log("Client connected from {}".format(address))
-                handler = threading.Thread(
-                    target=self._handle_client,
-                    args=(client_socket,),
-                    name="GatewayRemoteClient",
-                    daemon=True,
-                )
-                handler.start()
-            except OSError:
-                # Socket closed as part of shutdown sequence
-                break
-            except Exception as exc:
-                if self.running:
-                    self.log("Listener error: {}".format(exc))
-
-    def _handle_client(self, client_socket):
-        """Read newline-delimited JSON messages from a socket."""
-        buffer = ""
+    def _reactor_loop(self):
+        """Serve the listener and all client sockets from one thread."""
+        selector = self._selector
         try:
-            client_socket.settimeout(SOCKET_TIMEOUT)
             while self.running:
-                chunk = client_socket.recv(4096)
-                if not chunk:
+                try:
+                    events = selector.select(REACTOR_POLL_INTERVAL)
+                except OSError as exc:
+                    if self.running:
+                        self.log("Reactor select error: {}".format(exc))
                     break
 
-                buffer += chunk.decode("utf-8")
-
-                while "\n" in buffer:
-                    raw_message, buffer = buffer.split("\n", 1)
-                    raw_message = raw_message.strip()
-                    if not raw_message:
-                        continue
-
-                    response = self._enqueue_command(raw_message)
-                    client_socket.sendall((json.dumps(response) + "\n").encode("utf-8"))
-
-        except socket.timeout:
-            pass
+                for key, mask in events:
+                    data = key.data
+                    if data is None:
+                        self._accept_client()
+                    elif data is self._wake_r:
+                        self._drain_wakeups()
+                    else:
+                        if mask & selectors.EVENT_READ:
+                            self._read_client(data)
+                        if mask & selectors.EVENT_WRITE and not data.closed:
+                            self._flush_client(data)
+
+                self._deliver_responses()
+                self._expire_requests()
+                if self._failures:
+                    self._log_failures()
         except Exception as exc:
-            self.log("Client handler error: {}".format(exc))
+            self.log("Reactor error: {}".format(exc))
+            self.log(traceback.format_exc())
         finally:
-            try:
-                client_socket.close()
-            except Exception:
-                pass
+            self._close_reactor()
 
-    def _enqueue_command(self, raw_message):
-        """Parse a JSON command and wait for the response from the main thread."""
+    def _accept_client(self):
+        """Accept one pending connection and register it with the selector."""
         try:
-            command = json.loads(raw_message)
-        except JSONDecodeError as exc:
-            return {
-                "ok": False,
-                "error_code": ERROR_INVALID_PARAMS,
-                "error": "Invalid JSON: {}".format(exc),
-            }
+            client_socket, address = self.server_socket.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as exc:
+            if self.running:
+                self.log("Listener error: {}".format(exc))
+            return
+
+        client_socket.setblocking(False)
+        self._configure_client_socket(client_socket)
+        conn = _ClientConnection(client_socket, address, time.monotonic())
+        self._connections[client_socket.fileno()] = conn
+        self._selector.register(client_socket, selectors.EVENT_READ, conn)
+        self.log("Client connected from {}".format(address))
+
+    def _configure_client_socket(self, client_socket):
+        """Tune an accepted socket for small request/response messages."""
+        try:
+            # Responses are small JSON lines; don't let Nagle hold them back
+            # waiting for the client's delayed ACK.
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except (OSError, AttributeError) as exc:
+            self.log("Unable to set client socket options: {}".format(exc))
+
+    def _read_client(self, conn):
+        """Read available bytes and dispatch every complete JSON line."""
+        view = self._recv_view
+        try:
+            received = conn.sock.recv_into(view)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as exc:
+            self.log("Client handler error: {}".format(exc))
+            self._close_client(conn)
+            return
+
+        if not received:
+            self._close_client(conn)
+            return
+
+        conn.last_active = time.monotonic()
+        conn.inbuf.extend(view[:received])
+        self._process_input(conn)
+
+    def _process_input(self, conn):
+        """Dispatch buffered JSON lines until the connection's backlog is full.
 
-        request_id, response_queue = self._register_request()
-        self.command_queue.put((request_id, command))
+        Lines left in `inbuf` while backlogged are dispatched once responses
+        drain; reads stay paused until then.
+        """
+        buffer = conn.inbuf
+        while not conn.closed and not self._backlogged(conn):
+            # Only scan bytes that arrived since the last miss.
+            newline = buffer.find(b"\n", conn.scan_start)
+            if newline < 0:
+                conn.scan_start = len(buffer)
+                if len(buffer) > MAX_LINE_BYTES:
+                    self.log("Client {} sent a line over {} bytes".format(conn.address, MAX_LINE_BYTES))
+                    self._close_client(conn)
+                break
+            raw_line = bytes(buffer[:newline]).strip()
+            del buffer[: newline + 1]
+            conn.scan_start = 0
+            if raw_line:
+                self._enqueue_command(conn, raw_line)
+        self._update_interest(conn)
+
+    def _backlogged(self, conn):
+        return len(conn.pending) >= MAX_PENDING_REQUESTS or len(conn.outbuf) >= MAX_OUTBUF_BYTES
+
+    def _update_interest(self, conn):
+        """Poll for reads only below the backlog limits, for writes while output is queued."""
+        if conn.closed:
+            return
+        events = 0 if self._backlogged(conn) else selectors.EVENT_READ
+        if conn.outbuf:
+            events |= selectors.EVENT_WRITE
+        if events == conn.events:
+            return
+        # Selectors reject an empty event mask, so a fully paused socket is
+        # unregistered and registered again on resume.
+        if not events:
+            self._selector.unregister(conn.sock)
+        elif not conn.events:
+            self._selector.register(conn.sock, events, conn)
+        else:
+            self._selector.modify(conn.sock, events, conn)
+        conn.events = events
 
+    def _enqueue_command(self, conn, raw_message):
+        """Parse a JSON command and queue it for the Ableton main thread.
+
+        `raw_message` is the raw line as bytes; json.loads decodes UTF-8 itself,
+        so no intermediate str copy of the message is built.
+        """
         try:
-            response = response_queue.get(timeout=COMMAND_TIMEOUT)
-        except queue.Empty:
-            response = {
-                "ok": False,
-                "error_code": ERROR_EXECUTION_FAILED,
-                "error": "Gateway timeout while waiting for Ableton main thread",
-            }
-        finally:
-            self._release_request(request_id)
+            command = json.loads(raw_message)
+        except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+            self._respond_local(
+                conn,
+                {
+                    "ok": False,
+                    "error_code": ERROR_INVALID_PARAMS,
+                    "error": "Invalid JSON: {}".format(exc),
+                },
+            )
+            return
+
+        # Built-in actions touch no Live state, so they are answered here
+        # instead of waiting a frame for the main thread.
+        if isinstance(command, dict):
+            action = command.get("action")
+            if isinstance(action, str):
+                builtin = self._builtin_handlers.get(action)
+                if builtin is not None:
+                    self._respond_local(conn, builtin())
+                    return
+
+        request_id = next(self._request_ids)
+        conn.pending.append([request_id, time.monotonic() + COMMAND_TIMEOUT, None])
+        self.command_queue.append((request_id, conn, command))
+
+    def _respond_local(self, conn, response):
+        """Answer on the reactor thread without overtaking queued requests."""
+        if conn.pending:
+            conn.pending.append([None, 0.0, response])
+        else:
+            self._send_response(conn, response)
+
+    def _deliver_responses(self):
+        """Hand responses posted by the main thread to their connections."""
+        outbox = self._outbox
+        while outbox:
+            conn, request_id, response = outbox.popleft()
+            if conn.closed:
+                continue
+            for entry in conn.pending:
+                if entry[0] == request_id and entry[2] is None:
+                    entry[2] = response
+                    break
+            else:
+                # Already answered with a timeout; drop the late response.
+                continue
+            self._flush_ready(conn)
+
+    def _log_failures(self):
+        """Log tool exceptions captured on the main thread."""
+        failures = self._failures
+        while failures:
+            action, exc = failures.popleft()
+            self.log("Tool '{}' raised: {}".format(action, exc))
+            self.log("".join(traceback.format_exception(type(exc), exc, exc.__traceback__)))
+
+    def _expire_requests(self):
+        """Time out stalled requests and close idle connections."""
+        now = time.monotonic()
+        for conn in list(self._connections.values()):
+            if conn.pending:
+                expired = False
+                for entry in conn.pending:
+                    if entry[2] is None and entry[1] <= now:
+                        entry[2] = {
+                            "ok": False,
+                            "error_code": ERROR_EXECUTION_FAILED,
+                            "error": "Gateway timeout while waiting for Ableton main thread",
+                        }
+                        expired = True
+                if expired:
+                    self._flush_ready(conn)
+            elif not conn.outbuf and now - conn.last_active > SOCKET_TIMEOUT:
+                self._close_client(conn)
+
+    def _flush_ready(self, conn):
+        """Send every answered request at the head of the connection queue."""
+        pending = conn.pending
+        while pending and pending[0][2] is not None and not conn.closed:
+            self._send_response(conn, pending.popleft()[2])
+        self._process_input(conn)
+
+    def _send_response(self, conn, response):
+        data = response if isinstance(response, bytes) else _encode_response(response)
+        if conn.outbuf:
+            conn.outbuf.extend(data)
+            return
+        try:
+            sent = conn.sock.send(data)
+        except (BlockingIOError, InterruptedError):
+            sent = 0
+        except OSError as exc:
+            self.log("Client handler error: {}".format(exc))
+            self._close_client(conn)
+            return
+        if sent < len(data):
+            conn.outbuf.extend(data[sent:])
+            self._update_interest(conn)
+
+    def _flush_client(self, conn):
+        """Continue writing a response the socket could not take at once."""
+        try:
+            sent = conn.sock.send(conn.outbuf)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as exc:
+            self.log("Client handler error: {}".format(exc))
+            self._close_client(conn)
+            return
+        del conn.outbuf[:sent]
+        self._process_input(conn)
+
+    def _close_client(self, conn):
+        if conn.closed:
+            return
+        conn.closed = True
+        conn.pending.clear()
+        self._connections.pop(conn.sock.fileno(), None)
+        try:
+            self._selector.unregister(conn.sock)
+        except Exception:
+            pass
+        try:
+            conn.sock.close()
+        except Exception:
+            pass
 
-        return response
+    def _wake_reactor(self):
+        try:
+            self._wake_w.send(b"\0")
+        except (BlockingIOError, InterruptedError):
+            # Wakeup buffer already full; the reactor is due to run anyway.
+            pass
+        except Exception:
+            pass
 
-    def _register_request(self):
-        """Reserve a response queue for one request."""
-        with self.request_lock:
-            request_id = self.request_counter
-            self.request_counter += 1
-            response_queue = queue.Queue()
-            self.response_queues[request_id] = response_queue
-            return request_id, response_queue
+    def _drain_wakeups(self):
+        try:
+            while self._wake_r.recv(4096):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+        except OSError:
+            pass
 
-    def _release_request(self, request_id):
-        """Remove the response queue once a response is delivered."""
-        with self.request_lock:
-            self.response_queues.pop(request_id, None)
+    def _close_reactor(self):
+        for conn in list(self._connections.values()):
+            self._close_client(conn)
+        for sock in (self.server_socket, self._wake_r, self._wake_w):
+            if sock is None:
+                continue
+            try:
+                sock.close()
+            except Exception:
+                pass
+        try:
+            self._selector.close()
+        except Exception:
+            pass
 
     # --------------------------------------------------------------------- #
     # Command routing
@@ -214,7 +492,8 @@ class GatewayRemote:
         Dispatch a parsed command dict.
 
         Built-in actions are handled here, and external actions dispatch through
-        an explicit action registry.
+        an explicit action registry. Returns a response dict, or the encoded
+        response bytes for constant replies.
         """
         if not isinstance(command, dict):
             return {
@@ -223,7 +502,9 @@ class GatewayRemote:
                 "error": "Action payload must be a JSON object",
             }
 
-        action = command.get("action")
+        # The parsed dict is owned by this request, so "action" is popped off
+        # and the rest is passed to the handler as keyword arguments directly.
+        action = command.pop("action", None)
         if not action:
             return {
                 "ok": False,
@@ -239,36 +520,45 @@ class GatewayRemote:
                 "error": "Action must be a non-empty string",
             }
 
-        if action == "ping":
-            return {
-                "ok": True,
-                "message": "GatewayRemote online",
-                "script": "Gateway_Remote",
-            }
+        builtin = self._builtin_handlers.get(action)
+        if builtin is not None:
+            return builtin()
 
-        if action == "health_check":
-            return self._health_payload()
+        return self._invoke_registry_action(action, command)
 
-        if action in ("list_tools", "get_available_tools"):
-            return {"ok": True, "tools": self._available_actions()}
+    def _ping_response(self):
+        return _PING_RESPONSE_BYTES
 
-        return self._invoke_registry_action(action, command)
+    def _list_tools_response(self):
+        return self._list_tools_bytes
 
-    def _health_payload(self):
-        """Gather runtime information for diagnostics."""
+    def _health_template(self):
+        """Pre-encode the constant parts of the health_check response.
+
+        The Live version cannot change while the script is loaded, so it is
+        read once here on the main thread and never again per probe.
+        """
         try:
             app = Live.Application.get_application()
             ableton_version = "{}".format(app.get_major_version())
         except Exception:
             ableton_version = "unknown"
 
-        return {
-            "ok": True,
-            "message": "GatewayRemote running",
-            "tool_count": len(self.action_registry),
-            "queue_depth": self.command_queue.qsize(),
-            "ableton_version": ableton_version,
-        }
+        prefix = _encode_json(
+            {
+                "ok": True,
+                "message": "GatewayRemote running",
+                "tool_count": len(self.action_registry),
+            }
+        )[:-1] + ',"queue_depth":'
+        suffix = ',"ableton_version":{}}}\n'.format(_encode_json(ableton_version))
+        return prefix.encode("ascii"), suffix.encode("ascii")
+
+    def _health_payload(self):
+        """Encoded runtime diagnostics; only the queue depth is live."""
+        return b"".join(
+            (self._health_prefix, str(len(self.command_queue)).encode("ascii"), self._health_suffix)
+        )
 
     def _invoke_registry_action(self, action, command):
         """Call a registered LiveAPI action with payload validation."""
@@ -285,20 +575,18 @@ class GatewayRemote:
         if validation_error:
             return validation_error
 
-        kwargs = {k: v for k, v in command.items() if k != "action"}
-
         try:
-            response = spec.handler(**kwargs)
+            response = spec.handler(**command)
         except TypeError as exc:
             return {
                 "ok": False,
                 "error_code": ERROR_INVALID_PARAMS,
                 "error": "Invalid parameters for '{}': {}".format(action, exc),
-                "expected_signature": self._tool_signature(spec.handler),
+                "expected_signature": spec.signature_text,
             }
         except Exception as exc:
-            self.log("Tool '{}' raised: {}".format(action, exc))
-            self.log(traceback.format_exc())
+            # Formatting the traceback is left to the reactor thread.
+            self._failures.append((action, exc))
             return {
                 "ok": False,
                 "error_code": ERROR_EXECUTION_FAILED,
@@ -308,27 +596,23 @@ class GatewayRemote:
         return self._normalize_action_response(action, response)
 
     def _normalize_action_response(self, action, response):
-        """Ensure every action response conforms to FlowState's error envelope."""
-        if isinstance(response, dict):
-            normalized = dict(response)
-        else:
-            normalized = {"ok": True, "result": response}
-
-        if "ok" not in normalized:
-            normalized["ok"] = True
+        """Ensure every action response conforms to FlowState's error envelope.
 
-        if normalized.get("ok") is False:
-            if not normalized.get("error"):
-                normalized["error"] = normalized.get(
-                    "message", "Action '{}' failed".format(action)
-                )
-            normalized.setdefault("error_code", ERROR_EXECUTION_FAILED)
-        return normalized
+        Tool handlers return a fresh dict per call, so it is normalized in
+        place rather than copied.
+        """
+        if not isinstance(response, dict):
+            return {"ok": True, "result": response}
+
+        ok = response.setdefault("ok", True)
+        if ok is False:
+            if not response.get("error"):
+                response["error"] = response.get("message", "Action '{}' failed".format(action))
+            response.setdefault("error_code", ERROR_EXECUTION_FAILED)
+        return response
 
     def _available_actions(self):
-        actions = set(BUILTIN_ACTIONS)
-        actions.update(self.action_registry.keys())
-        return sorted(actions)
+        return self._available_actions_cached
 
     # --------------------------------------------------------------------- #
     # Ableton Remote Script hooks
@@ -336,22 +620,25 @@ class GatewayRemote:
     def update_display(self):
         """
         Called once per frame on Ableton's main thread.
-        We process a small batch of queued commands here.
+        We drain queued commands here until TICK_BUDGET_SECONDS is spent,
+        always handling at least one so progress is guaranteed.
         """
-        processed = 0
-        max_per_tick = 8
-
-        while processed < max_per_tick:
-            try:
-                request_id, command = self.command_queue.get_nowait()
-            except queue.Empty:
+        command_queue = self.command_queue
+        if not command_queue:
+            return
+
+        # The main thread is the only consumer, so once the queue is seen
+        # non-empty every popleft() below is guaranteed to succeed.
+        popleft = command_queue.popleft
+        post = self._outbox.append
+        monotonic = time.monotonic
+        deadline = monotonic() + TICK_BUDGET_SECONDS
+        while True:
+            request_id, conn, command = popleft()
+            post((conn, request_id, self._route_command(command)))
+            if not command_queue or monotonic() >= deadline:
                 break
-
-            response = self._route_command(command)
-            response_queue = self.response_queues.get(request_id)
-            if response_queue:
-                response_queue.put(response)
-            processed += 1
+        self._wake_reactor()
 
     def connect_script_instances(self, instantiated_scripts):
         """Required by Ableton Remote Script API."""
@@ -373,28 +660,13 @@ class GatewayRemote:
         """Stop the TCP server when Ableton unloads the script."""
         self.log("Shutting down GatewayRemote")
         self.running = False
-
-        if self.server_socket:
-            try:
-                self.server_socket.close()
-            except Exception:
-                pass
+        self._wake_reactor()
 
         if self.listener_thread and self.listener_thread.is_alive():
             self.listener_thread.join(timeout=1.0)
 
         self.log("GatewayRemote stopped")
 
-    def _tool_signature(self, tool):
-        """Best-effort textual representation of a callable signature."""
-        try:
-            return str(inspect.signature(tool))
-        except Exception:
-            try:
-                return str(inspect.getfullargspec(tool))
-            except Exception:
-                return "unknown"
-
 
 def create_instance(c_instance):
     """Ableton entry point."""
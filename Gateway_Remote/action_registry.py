@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import inspect
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional, Tuple
 
 SCHEMA_PATH = Path(__file__).resolve().parents[1] / "schema" / "seed_actions.json"
 
@@ -18,26 +18,63 @@ class ActionSpec:
     route: str = "api"
     destructive: bool = False
     allow_extra: bool = False
+    signature_text: str = "unknown"
+    required_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    allowed_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Precomputed for validate_payload, which runs on every command.
+        object.__setattr__(self, "required_set", frozenset(self.required))
+        object.__setattr__(self, "allowed_set", frozenset(self.required + self.optional + ("action",)))
+
+
+def action(
+    required: Tuple[str, ...] = (),
+    optional: Tuple[str, ...] = (),
+    allow_extra: bool = False,
+) -> Callable[[Callable[..., Dict[str, Any]]], Callable[..., Dict[str, Any]]]:
+    """Record a handler's payload contract at definition time.
+
+    build_registry uses the recorded contract instead of calling
+    inspect.signature on the handler.
+    """
+
+    def decorate(handler: Callable[..., Dict[str, Any]]) -> Callable[..., Dict[str, Any]]:
+        handler._action_contract = (tuple(required), tuple(optional), bool(allow_extra))
+        return handler
+
+    return decorate
+
+
+_SCHEMA_CACHE: Optional[Tuple[Tuple[int, int], Dict[str, Dict[str, Any]]]] = None
 
 
 def _load_schema_actions() -> Dict[str, Dict[str, Any]]:
-    if not SCHEMA_PATH.exists():
+    global _SCHEMA_CACHE
+    try:
+        stat = SCHEMA_PATH.stat()
+    except OSError:
         return {}
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    if _SCHEMA_CACHE is not None and _SCHEMA_CACHE[0] == stamp:
+        return _SCHEMA_CACHE[1]
+
     try:
-        payload = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+        payload = json.loads(SCHEMA_PATH.read_bytes())
     except Exception:
         return {}
     actions = payload.get("actions")
     if not isinstance(actions, dict):
         return {}
-    return {str(k): v for k, v in actions.items() if isinstance(v, dict)}
+    loaded = {str(k): v for k, v in actions.items() if isinstance(v, dict)}
+    _SCHEMA_CACHE = (stamp, loaded)
+    return loaded
 
 
-def _signature_contract(handler: Callable[..., Dict[str, Any]]) -> Tuple[Tuple[str, ...], Tuple[str, ...], bool]:
+def _signature_contract(signature: inspect.Signature) -> Tuple[Tuple[str, ...], Tuple[str, ...], bool]:
     required = []
     optional = []
     allow_extra = False
-    signature = inspect.signature(handler)
     for parameter in signature.parameters.values():
         if parameter.kind == inspect.Parameter.VAR_KEYWORD:
             allow_extra = True
@@ -56,6 +93,14 @@ def _signature_contract(handler: Callable[..., Dict[str, Any]]) -> Tuple[Tuple[s
     return tuple(required), tuple(optional), allow_extra
 
 
+def _contract_signature_text(required: Tuple[str, ...], optional: Tuple[str, ...], allow_extra: bool) -> str:
+    parts = list(required)
+    parts.extend("{}=...".format(name) for name in optional)
+    if allow_extra:
+        parts.append("**kwargs")
+    return "({})".format(", ".join(parts))
+
+
 def _schema_contract(schema_entry: Mapping[str, Any]) -> Optional[Tuple[Tuple[str, ...], Tuple[str, ...], bool, str, bool]]:
     required_raw = schema_entry.get("required", [])
     properties_raw = schema_entry.get("properties", {})
@@ -70,6 +115,10 @@ def _schema_contract(schema_entry: Mapping[str, Any]) -> Optional[Tuple[Tuple[st
 
 
 def _public_callable_names(tools: Any) -> Tuple[str, ...]:
+    exported = getattr(type(tools), "__exported_actions__", None)
+    if exported is not None:
+        return tuple(exported)
+
     names = []
     for attr in dir(tools):
         if attr.startswith("_"):
@@ -89,7 +138,15 @@ def build_registry(tools: Any) -> Dict[str, ActionSpec]:
         if not callable(handler):
             continue
 
-        required, optional, allow_extra = _signature_contract(handler)
+        contract = getattr(handler, "_action_contract", None)
+        if contract is not None:
+            required, optional, allow_extra = contract
+            signature_text = _contract_signature_text(required, optional, allow_extra)
+        else:
+            # Inspect once here; the text is reused in TypeError responses.
+            signature = inspect.signature(handler)
+            required, optional, allow_extra = _signature_contract(signature)
+            signature_text = str(signature)
         route = "api"
         destructive = False
 
@@ -107,6 +164,7 @@ def build_registry(tools: Any) -> Dict[str, ActionSpec]:
             route=route,
             destructive=destructive,
             allow_extra=allow_extra,
+            signature_text=signature_text,
         )
 
     return registry
@@ -3,10 +3,68 @@
 from __future__ import annotations
 
 import re
+import sys
 import time
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from .parameter_resolver import ResolutionTrace, normalize_query, resolve_parameter
+try:
+    import Live  # type: ignore
+except ModuleNotFoundError:
+    Live = None
+
+from .action_registry import action
+from .parameter_resolver import (
+    ResolutionTrace,
+    build_parameter_index,
+    is_eq_like,
+    normalize_query,
+    precompute_aliases,
+    resolve_parameter,
+)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_EQ_BAND_QUERY_RE = re.compile(r"^(?:band)?([1-8])(?:filter)?(type|frequency|freq|gain|q)$")
+_DISPLAY_NUMBER_RE = re.compile(r"[-+]?\d+\.?\d*")
+# Bound pattern methods for the resolve/verify hot paths.
+_TOKEN_FINDALL = _TOKEN_RE.findall
+_DISPLAY_NUMBER_SEARCH = _DISPLAY_NUMBER_RE.search
+MODE_ABSOLUTE = "absolute"
+MODE_DISPLAY_TEXT = "display_text"
+MODE_DISPLAY_TEXT_FALLBACK = "display_text_fallback"
+MODE_DISPLAY_VERIFY = "display_verify"
+
+
+def _seconds_from_display(value: float, display: str) -> float:
+    return value / 1000.0 if "ms" in display else value
+
+
+def _milliseconds_from_display(value: float, display: str) -> float:
+    if "ms" in display:
+        return value
+    if "sec" in display or "seconds" in display:
+        return value * 1000.0
+    return value
+
+
+def _percent_from_display(value: float, display: str) -> float:
+    if "%" not in display and -1.0 <= value <= 1.0:
+        return value * 100.0
+    return value
+
+
+def _hz_from_display(value: float, display: str) -> float:
+    return value * 1000.0 if "khz" in display or "k hz" in display else value
+
+
+# Display-number rescaling per normalized unit hint; other units pass through.
+_UNIT_CONVERTERS = {
+    "s": _seconds_from_display,
+    "ms": _milliseconds_from_display,
+    "%": _percent_from_display,
+    "hz": _hz_from_display,
+}
+
+_TRACK_DROP_TOKENS = frozenset({"a", "an", "the", "track", "to", "on", "for", "my", "this", "that"})
 
 
 class ChainTools:
@@ -48,12 +106,19 @@ class ChainTools:
         "trebleq": ("8 Q A", "8 Q"),
     }
 
-    _TOKEN_RE = re.compile(r"[a-z0-9]+")
-    _EQ_BAND_QUERY_RE = re.compile(r"^(?:band)?([1-8])(?:filter)?(type|frequency|freq|gain|q)$")
+    _CURATED_ALIAS_PAIRS = precompute_aliases(_CURATED_PARAMETER_ALIASES)
+
+    _DISPLAY_CACHE_LIMIT = 256
+    # Live's Application is a process-wide singleton, fetched on first use.
+    _live_application: Any = None
 
     def __init__(self, song: Any, c_instance: Any) -> None:
         self.song = song
         self.c_instance = c_instance
+        # id(param) -> (param, p_min, steps, normalized labels, label -> first step)
+        self._quantized_display_cache: Dict[int, Tuple[Any, float, int, List[str], Dict[str, int]]] = {}
+        # id(param) -> (param, unit, backend value, converted display number, ascending)
+        self._verify_warm_start: Dict[int, Tuple[Any, Optional[str], float, float, bool]] = {}
 
     def _log(self, message: str) -> None:
         try:
@@ -61,6 +126,7 @@ class ChainTools:
         except Exception:
             pass
 
+    @action(required=("steps",), optional=("target",))
     def build_device_chain(self, steps: list, target: dict | None = None) -> Dict[str, Any]:
         """Add one or more devices and apply parameter updates for each step."""
         start = time.perf_counter()
@@ -71,16 +137,18 @@ class ChainTools:
         track, track_index, resolve_error = self._resolve_track_target(target)
         if resolve_error:
             return self._error(resolve_error, elapsed_ms=start)
+        track_payload = self._track_payload(track, track_index)
 
         results: List[Dict[str, Any]] = []
         warnings: List[str] = []
+        browser_items: Dict[str, Tuple[str, Any]] = {}
 
         for idx, step in enumerate(steps):
             if not isinstance(step, dict):
                 return self._error(
                     "step {} must be an object".format(idx),
                     elapsed_ms=start,
-                    target_track=self._track_payload(track, track_index),
+                    target_track=track_payload,
                     steps_executed=results,
                 )
 
@@ -89,60 +157,55 @@ class ChainTools:
                 return self._error(
                     "step {} missing device_name".format(idx),
                     elapsed_ms=start,
-                    target_track=self._track_payload(track, track_index),
+                    target_track=track_payload,
                     steps_executed=results,
                 )
 
-            inserted, insert_error = self._insert_device(track, track_index, step)
+            inserted, insert_error = self._insert_device(track, track_index, step, browser_items)
             if insert_error:
                 return self._error(
                     "step {} failed: {}".format(idx, insert_error),
                     elapsed_ms=start,
-                    target_track=self._track_payload(track, track_index),
+                    target_track=track_payload,
                     steps_executed=results,
                 )
 
             device = inserted["device"]
-            device_result = {
-                "step_index": idx,
-                "device_name": str(getattr(device, "name", "")),
-                "device_class": self._device_class_name(device),
-                "device_index": int(inserted["device_index"]),
-                "position_applied": bool(inserted.get("position_applied", False)),
-                "position_message": inserted.get("position_message"),
-                "parameters_applied": [],
-                "unmatched_parameters": [],
-                "unmatched_parameter_details": [],
-            }
-
             apply_result = self._apply_parameter_updates(device, step.get("parameter_updates"))
             if not apply_result.get("ok"):
                 return self._error(
                     "step {} failed: {}".format(idx, apply_result.get("error") or "parameter update failed"),
                     elapsed_ms=start,
-                    target_track=self._track_payload(track, track_index),
+                    target_track=track_payload,
                     steps_executed=results,
                 )
 
-            device_result["parameters_applied"] = list(apply_result.get("parameters_applied") or [])
-            device_result["unmatched_parameters"] = list(apply_result.get("unmatched_parameters") or [])
-            device_result["unmatched_parameter_details"] = list(
-                apply_result.get("unmatched_parameter_details") or []
-            )
             warnings.extend(str(w) for w in (apply_result.get("warnings") or []))
-
-            results.append(device_result)
+            results.append(
+                {
+                    "step_index": idx,
+                    "device_name": str(getattr(device, "name", "")),
+                    "device_class": self._device_class_name(device),
+                    "device_index": int(inserted["device_index"]),
+                    "position_applied": bool(inserted.get("position_applied", False)),
+                    "position_message": inserted.get("position_message"),
+                    "parameters_applied": apply_result["parameters_applied"],
+                    "unmatched_parameters": apply_result["unmatched_parameters"],
+                    "unmatched_parameter_details": apply_result["unmatched_parameter_details"],
+                }
+            )
 
         payload = {
             "ok": True,
             "message": "chain built",
-            "target_track": self._track_payload(track, track_index),
+            "target_track": track_payload,
             "steps_executed": results,
             "warnings": warnings,
             "elapsed_ms": round((time.perf_counter() - start) * 1000.0, 2),
         }
         return payload
 
+    @action(required=("updates",), optional=("target",))
     def update_device_parameters(self, updates: list, target: dict | None = None) -> Dict[str, Any]:
         """Apply parameter updates to existing devices on a target track."""
         start = time.perf_counter()
@@ -153,90 +216,95 @@ class ChainTools:
         track, track_index, resolve_error = self._resolve_track_target(target)
         if resolve_error:
             return self._error(resolve_error, elapsed_ms=start)
+        track_payload = self._track_payload(track, track_index)
 
         results: List[Dict[str, Any]] = []
         warnings: List[str] = []
+        # Updates only change parameter values, so the device list and the
+        # normalized device names hold for every update in this call.
+        devices = list(getattr(track, "devices", []) or [])
+        device_keys = [self._normalize_name(getattr(device, "name", "")) for device in devices]
 
         for idx, item in enumerate(updates):
             if not isinstance(item, dict):
                 return self._error(
                     "update {} must be an object".format(idx),
                     elapsed_ms=start,
-                    target_track=self._track_payload(track, track_index),
+                    target_track=track_payload,
                     updates_executed=results,
                 )
 
-            device, device_index, device_error = self._resolve_existing_device(track, item)
+            device, device_index, device_error = self._resolve_existing_device(track, item, devices, device_keys)
             if device_error:
                 return self._error(
                     "update {} failed: {}".format(idx, device_error),
                     elapsed_ms=start,
-                    target_track=self._track_payload(track, track_index),
+                    target_track=track_payload,
                     updates_executed=results,
                 )
 
-            item_result = {
-                "update_index": idx,
-                "device_name": str(getattr(device, "name", "")),
-                "device_class": self._device_class_name(device),
-                "device_index": int(device_index),
-                "parameters_applied": [],
-                "unmatched_parameters": [],
-                "unmatched_parameter_details": [],
-            }
-
             apply_result = self._apply_parameter_updates(device, item.get("parameter_updates"))
             if not apply_result.get("ok"):
                 return self._error(
                     "update {} failed: {}".format(idx, apply_result.get("error") or "parameter update failed"),
                     elapsed_ms=start,
-                    target_track=self._track_payload(track, track_index),
+                    target_track=track_payload,
                     updates_executed=results,
                 )
 
-            item_result["parameters_applied"] = list(apply_result.get("parameters_applied") or [])
-            item_result["unmatched_parameters"] = list(apply_result.get("unmatched_parameters") or [])
-            item_result["unmatched_parameter_details"] = list(
-                apply_result.get("unmatched_parameter_details") or []
-            )
             warnings.extend(str(w) for w in (apply_result.get("warnings") or []))
-
-            results.append(item_result)
+            results.append(
+                {
+                    "update_index": idx,
+                    "device_name": str(getattr(device, "name", "")),
+                    "device_class": self._device_class_name(device),
+                    "device_index": int(device_index),
+                    "parameters_applied": apply_result["parameters_applied"],
+                    "unmatched_parameters": apply_result["unmatched_parameters"],
+                    "unmatched_parameter_details": apply_result["unmatched_parameter_details"],
+                }
+            )
 
         return {
             "ok": True,
             "message": "device parameters updated",
-            "target_track": self._track_payload(track, track_index),
+            "target_track": track_payload,
             "updates_executed": results,
             "warnings": warnings,
             "elapsed_ms": round((time.perf_counter() - start) * 1000.0, 2),
         }
 
+    @action(optional=("target", "include_parameters"))
     def inspect_track_chain(self, target: dict | None = None, include_parameters: bool = True) -> Dict[str, Any]:
         """Return the device chain for a target track with optional parameter details."""
         start = time.perf_counter()
         track, track_index, resolve_error = self._resolve_track_target(target)
         if resolve_error:
             return self._error(resolve_error, elapsed_ms=start)
+        track_payload = self._track_payload(track, track_index)
 
+        include_parameters = bool(include_parameters)
+        parameter_payload = self._parameter_payload
         devices = []
-        for idx, device in enumerate(list(getattr(track, "devices", []) or [])):
+        for idx, device in enumerate(getattr(track, "devices", None) or ()):
             item = {
                 "device_index": idx,
                 "device_name": str(getattr(device, "name", "")),
                 "device_class": self._device_class_name(device),
             }
-            if bool(include_parameters):
-                params = []
-                for pidx, param in enumerate(list(getattr(device, "parameters", []) or [])):
-                    params.append(self._parameter_payload(param, pidx, include_value=True))
-                item["parameters"] = params
+            if include_parameters:
+                # Iterate the LOM parameter collection directly; nothing here
+                # needs a copied list.
+                item["parameters"] = [
+                    parameter_payload(param, pidx, include_value=True)
+                    for pidx, param in enumerate(getattr(device, "parameters", None) or ())
+                ]
             devices.append(item)
 
         return {
             "ok": True,
             "message": "chain inspected",
-            "target_track": self._track_payload(track, track_index),
+            "target_track": track_payload,
             "devices": devices,
             "elapsed_ms": round((time.perf_counter() - start) * 1000.0, 2),
         }
@@ -267,7 +335,8 @@ class ChainTools:
                 idx = int(track_index)
             except Exception:
                 return None, -1, "Invalid track_index"
-            tracks = list(getattr(self.song, "tracks", []) or [])
+            # LOM collections support len() and indexing; no copy needed.
+            tracks = getattr(self.song, "tracks", None) or ()
             if idx < 0 or idx >= len(tracks):
                 return None, -1, "Invalid track_index"
             return tracks[idx], idx, None
@@ -289,25 +358,26 @@ class ChainTools:
         if not query:
             return None, -1
         tracks = list(getattr(self.song, "tracks", []) or [])
-
-        exact = [
-            (idx, tr)
-            for idx, tr in enumerate(tracks)
-            if str(getattr(tr, "name", "")).strip().lower() == query
-        ]
-        if len(exact) == 1:
-            idx, tr = exact[0]
-            return tr, idx
-        if len(exact) > 1:
-            return None, -1
+        # Read each LOM track name once for both the exact and scored passes.
+        names = [str(getattr(tr, "name", "")) for tr in tracks]
+
+        exact_idx = -1
+        for idx, name in enumerate(names):
+            if name.strip().lower() == query:
+                if exact_idx >= 0:
+                    # A second exact hit makes the name ambiguous; stop scanning.
+                    return None, -1
+                exact_idx = idx
+        if exact_idx >= 0:
+            return tracks[exact_idx], exact_idx
 
         scored: List[Tuple[float, int, Any]] = []
         query_norm = "".join(self._normalize_track_tokens(query))
-        for idx, tr in enumerate(tracks):
-            name = str(getattr(tr, "name", ""))
-            score = self._score_track_name_match(query_norm, name)
+        query_set = frozenset(_TOKEN_FINDALL(query_norm))
+        for idx, name in enumerate(names):
+            score = self._score_track_name_match(query_norm, name, query_set)
             if score > 0:
-                scored.append((score, idx, tr))
+                scored.append((score, idx, tracks[idx]))
 
         if not scored:
             return None, -1
@@ -318,34 +388,43 @@ class ChainTools:
         return best[2], best[1]
 
     def _normalize_track_tokens(self, text: str) -> List[str]:
-        drop = {"a", "an", "the", "track", "to", "on", "for", "my", "this", "that"}
-        tokens = [t for t in self._TOKEN_RE.findall(str(text or "").lower()) if t not in drop]
-        return tokens or self._TOKEN_RE.findall(str(text or "").lower())
+        tokens = _TOKEN_FINDALL((text if isinstance(text, str) else str(text or "")).lower())
+        return [t for t in tokens if t not in _TRACK_DROP_TOKENS] or tokens
 
-    def _score_track_name_match(self, query_norm: str, candidate_name: str) -> float:
+    def _score_track_name_match(
+        self, query_norm: str, candidate_name: str, query_set: Optional[frozenset] = None
+    ) -> float:
         candidate_tokens = self._normalize_track_tokens(candidate_name)
         candidate_norm = "".join(candidate_tokens)
         if not candidate_norm:
             return 0.0
-        if query_norm == candidate_norm:
-            return 5.0
-        if query_norm in candidate_norm:
-            return 2.5
-        if candidate_norm in query_norm:
+        # Only the shorter string can be contained in the longer one, so the
+        # lengths decide which single containment test is worth running.
+        query_len = len(query_norm)
+        candidate_len = len(candidate_norm)
+        if query_len == candidate_len:
+            if query_norm == candidate_norm:
+                return 5.0
+        elif query_len < candidate_len:
+            if query_norm in candidate_norm:
+                return 2.5
+        elif candidate_norm in query_norm:
             return 2.0
 
-        query_set = set(self._TOKEN_RE.findall(query_norm))
-        candidate_set = set(candidate_tokens)
-        if not query_set or not candidate_set:
+        if query_set is None:
+            query_set = frozenset(_TOKEN_FINDALL(query_norm))
+        if not query_set:
             return 0.0
-        overlap = len(query_set & candidate_set)
-        return float(overlap)
+        return float(len(query_set.intersection(candidate_tokens)))
 
     def _track_index(self, track: Any) -> int:
         try:
-            return list(getattr(self.song, "tracks", []) or []).index(track)
+            for idx, candidate in enumerate(getattr(self.song, "tracks", None) or ()):
+                if candidate is track or candidate == track:
+                    return idx
         except Exception:
-            return -1
+            pass
+        return -1
 
     def _track_payload(self, track: Any, track_index: int) -> Dict[str, Any]:
         return {
@@ -360,28 +439,44 @@ class ChainTools:
         raw = str(device_name or "").strip()
         return self._DEVICE_ALIASES.get(raw.lower(), raw)
 
-    def _insert_device(self, track: Any, track_index: int, step: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[str]]:
+    def _insert_device(
+        self,
+        track: Any,
+        track_index: int,
+        step: Dict[str, Any],
+        browser_items: Optional[Dict[str, Tuple[str, Any]]] = None,
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
         browser = self._get_live_browser()
         if browser is None:
             return {}, "Browser API not available"
 
         requested_name = str(step.get("device_name") or "")
-        canonical_name = self._resolve_device_alias(requested_name)
-        browser_item = self._find_browser_device(browser, canonical_name)
-        if browser_item is None:
-            return {}, "Device '{}' not found".format(canonical_name)
+        # A chain often repeats a device (e.g. two EQ Eights); reuse the alias
+        # and browser lookup from earlier steps of the same build.
+        cached = browser_items.get(requested_name) if browser_items is not None else None
+        if cached is not None:
+            canonical_name, browser_item = cached
+        else:
+            canonical_name = self._resolve_device_alias(requested_name)
+            browser_item = self._find_browser_device(browser, canonical_name)
+            if browser_item is None:
+                return {}, "Device '{}' not found".format(canonical_name)
+            if browser_items is not None:
+                browser_items[requested_name] = (canonical_name, browser_item)
 
         try:
-            previous_count = len(list(getattr(track, "devices", []) or []))
+            previous_count = self._device_count(track)
             if hasattr(self.song.view, "selected_track"):
                 self.song.view.selected_track = track
             browser.load_item(browser_item)
 
-            for _ in range(20):
-                current_count = len(list(getattr(track, "devices", []) or []))
-                if current_count > previous_count:
-                    break
-                time.sleep(0.05)
+            # Back off from 2 ms up to 50 ms so fast loads return almost at once
+            # while keeping the previous one-second worst case.
+            deadline = time.monotonic() + 1.0
+            delay = 0.002
+            while self._device_count(track) <= previous_count and time.monotonic() < deadline:
+                time.sleep(delay)
+                delay = min(delay * 1.5, 0.05)
 
             devices = list(getattr(track, "devices", []) or [])
             if len(devices) <= previous_count:
@@ -400,6 +495,7 @@ class ChainTools:
                     current_index,
                     step.get("position"),
                     step.get("insert_index"),
+                    devices=devices,
                 )
 
             return {
@@ -412,6 +508,11 @@ class ChainTools:
         except Exception as exc:
             return {}, str(exc)
 
+    def _device_count(self, track: Any) -> int:
+        # The LOM device list supports len() directly; don't copy it to count.
+        devices = getattr(track, "devices", None)
+        return len(devices) if devices is not None else 0
+
     def _apply_device_position(
         self,
         track: Any,
@@ -419,8 +520,10 @@ class ChainTools:
         current_index: int,
         position: Optional[Dict[str, Any]],
         insert_index: Optional[int],
+        devices: Optional[Sequence[Any]] = None,
     ) -> Tuple[int, bool, Optional[str]]:
-        devices = list(getattr(track, "devices", []) or [])
+        if devices is None:
+            devices = list(getattr(track, "devices", []) or [])
         if not devices:
             return current_index, False, "No devices on track"
 
@@ -466,7 +569,7 @@ class ChainTools:
         matches = []
         for idx, dev in enumerate(devices):
             candidate = self._normalize_name(getattr(dev, "name", ""))
-            if target and (target == candidate or target in candidate or candidate in target):
+            if target and self._names_overlap(target, candidate):
                 matches.append(idx)
         if not matches:
             return None
@@ -480,8 +583,15 @@ class ChainTools:
                 pass
         return matches[0]
 
-    def _resolve_existing_device(self, track: Any, item: Dict[str, Any]) -> Tuple[Any, int, Optional[str]]:
-        devices = list(getattr(track, "devices", []) or [])
+    def _resolve_existing_device(
+        self,
+        track: Any,
+        item: Dict[str, Any],
+        devices: Optional[Sequence[Any]] = None,
+        device_keys: Optional[Sequence[str]] = None,
+    ) -> Tuple[Any, int, Optional[str]]:
+        if devices is None:
+            devices = list(getattr(track, "devices", []) or [])
         if not devices:
             return None, -1, "No devices on track"
 
@@ -505,10 +615,11 @@ class ChainTools:
         if not query:
             return None, -1, "invalid device_name"
 
+        if device_keys is None:
+            device_keys = [self._normalize_name(getattr(device, "name", "")) for device in devices]
         matches = []
-        for idx, device in enumerate(devices):
-            candidate = self._normalize_name(getattr(device, "name", ""))
-            if query == candidate or query in candidate or candidate in query:
+        for idx, (device, candidate) in enumerate(zip(devices, device_keys)):
+            if self._names_overlap(query, candidate):
                 matches.append((idx, device))
 
         if not matches:
@@ -536,6 +647,12 @@ class ChainTools:
         unmatched_details = []
         warnings = []
 
+        # Parameter names don't change while values are written, so the device's
+        # parameter list, name index and EQ8 check are built once for all updates.
+        parameters = list(getattr(device, "parameters", []) or [])
+        index = build_parameter_index(parameters)
+        is_eq8 = self._is_eq8_device(device)
+
         for update in parameter_updates:
             if not isinstance(update, dict):
                 unmatched.append("invalid update payload")
@@ -549,7 +666,9 @@ class ChainTools:
                 )
                 continue
 
-            target_param, resolution = self._resolve_parameter(device, update)
+            target_param, resolution = self._resolve_parameter(
+                device, update, parameters=parameters, index=index, is_eq8=is_eq8
+            )
             if target_param is None:
                 hint = update.get("param_name")
                 if hint is None and update.get("param_index") is not None:
@@ -565,7 +684,7 @@ class ChainTools:
                 )
                 continue
 
-            self._ensure_eq8_band_enabled(device, resolution)
+            self._ensure_eq8_band_enabled(device, resolution, parameters=parameters, is_eq8=is_eq8)
 
             if "target_display_text" in update:
                 apply_res = self._set_parameter_by_display_text(
@@ -624,8 +743,17 @@ class ChainTools:
             "warnings": warnings,
         }
 
-    def _resolve_parameter(self, device: Any, update: Dict[str, Any]) -> Tuple[Any, ResolutionTrace]:
-        parameters = list(getattr(device, "parameters", []) or [])
+    def _resolve_parameter(
+        self,
+        device: Any,
+        update: Dict[str, Any],
+        *,
+        parameters: Optional[List[Any]] = None,
+        index: Optional[Dict[str, Any]] = None,
+        is_eq8: Optional[bool] = None,
+    ) -> Tuple[Any, ResolutionTrace]:
+        if parameters is None:
+            parameters = list(getattr(device, "parameters", []) or [])
         if not parameters:
             return None, ResolutionTrace(
                 matched_by=None,
@@ -670,6 +798,9 @@ class ChainTools:
             device=device,
             query=update.get("param_name"),
             curated_aliases=self._CURATED_PARAMETER_ALIASES,
+            index=index,
+            eq_like=is_eq8,
+            alias_pairs=self._CURATED_ALIAS_PAIRS,
         )
 
     def _resolution_reason(self, resolution: ResolutionTrace) -> str:
@@ -678,22 +809,31 @@ class ChainTools:
         return "no_match"
 
     def _is_eq8_device(self, device: Any) -> bool:
-        device_name = self._normalize_name(getattr(device, "name", ""))
-        device_class = self._normalize_name(getattr(device, "class_name", ""))
-        return device_name == "eqeight" or device_class in {"eq8", "eqeight"}
+        return is_eq_like(device)
 
-    def _ensure_eq8_band_enabled(self, device: Any, resolution: ResolutionTrace) -> None:
-        if not self._is_eq8_device(device):
+    def _ensure_eq8_band_enabled(
+        self,
+        device: Any,
+        resolution: ResolutionTrace,
+        *,
+        parameters: Optional[List[Any]] = None,
+        is_eq8: Optional[bool] = None,
+    ) -> None:
+        if is_eq8 is None:
+            is_eq8 = self._is_eq8_device(device)
+        if not is_eq8:
             return
-        match = self._EQ_BAND_QUERY_RE.match(resolution.normalized_query)
+        match = _EQ_BAND_QUERY_RE.match(resolution.normalized_query)
         if not match:
             return
         band = match.group(1)
+        if parameters is None:
+            parameters = list(getattr(device, "parameters", []) or [])
         toggle_fragments = ("on", "active", "enabled", "enable")
-        for param in list(getattr(device, "parameters", []) or []):
+        for param in parameters:
             raw_name = str(getattr(param, "name", ""))
             pname = self._normalize_name(raw_name)
-            tokens = set(self._TOKEN_RE.findall(raw_name.lower()))
+            tokens = set(_TOKEN_FINDALL(raw_name.lower()))
             references_band = (
                 band in tokens
                 or "{}on".format(band) in pname
@@ -741,7 +881,7 @@ class ChainTools:
 
         return {
             "ok": True,
-            "mode": "absolute",
+            "mode": MODE_ABSOLUTE,
             "value": float(getattr(param, "value", v)),
             "display": self._safe_str_for_value(param, getattr(param, "value", v)),
             "exact_match": None,
@@ -767,19 +907,25 @@ class ChainTools:
         direct_mode = self._supports_direct_str_for_value(param, p_min, p_max)
         original_value = getattr(param, "value", None)
 
+        labels, label_steps = self._quantized_display_labels(param, p_min, steps, direct_mode)
+
         best_val = None
         best_score = 0.0
         best_exact = False
-        for i in range(steps):
-            candidate = p_min + i
-            display = self._display_for_backend_value(param, candidate, direct_mode)
-            score, exact = self._score_display_text_match(target_norm, self._normalize_display_text(display))
-            if score > best_score:
-                best_score = score
-                best_val = candidate
-                best_exact = exact
-                if exact:
-                    break
+        exact_step = label_steps.get(target_norm)
+        if exact_step is not None:
+            best_val = p_min + exact_step
+            best_score = 100.0
+            best_exact = True
+        else:
+            score_match = self._score_display_text_match
+            target_tokens = frozenset(target_norm.split())
+            for i, label in enumerate(labels):
+                score, exact = score_match(target_norm, label, target_tokens)
+                if score > best_score:
+                    best_score = score
+                    best_val = p_min + i
+                    best_exact = exact
 
         if best_val is not None and best_score > 0.0:
             try:
@@ -789,7 +935,7 @@ class ChainTools:
             current = float(getattr(param, "value", best_val))
             return {
                 "ok": True,
-                "mode": "display_text",
+                "mode": MODE_DISPLAY_TEXT,
                 "value": current,
                 "display": self._safe_str_for_value(param, current),
                 "exact_match": bool(best_exact),
@@ -801,7 +947,7 @@ class ChainTools:
                 return fallback
             return {
                 "ok": True,
-                "mode": "display_text_fallback",
+                "mode": MODE_DISPLAY_TEXT_FALLBACK,
                 "value": fallback.get("value"),
                 "display": fallback.get("display"),
                 "exact_match": False,
@@ -814,6 +960,34 @@ class ChainTools:
                 pass
         return {"ok": False, "error": "target_display_text did not match any quantized value"}
 
+    def _quantized_display_labels(
+        self, param: Any, p_min: float, steps: int, direct_mode: bool
+    ) -> Tuple[List[str], Dict[str, int]]:
+        """Return the normalized display label of every quantized step.
+
+        Labels are fixed per parameter, so the sweep (which writes the
+        parameter when str_for_value isn't usable) runs once per parameter.
+        The cached entry holds a reference to `param` so its id can't be
+        reused by another object while cached.
+        """
+        cache = self._quantized_display_cache
+        entry = cache.get(id(param))
+        if entry is not None and entry[0] is param and entry[1] == p_min and entry[2] == steps:
+            return entry[3], entry[4]
+
+        labels = [
+            self._normalize_display_text(self._display_for_backend_value(param, p_min + i, direct_mode))
+            for i in range(steps)
+        ]
+        label_steps: Dict[str, int] = {}
+        for i, label in enumerate(labels):
+            label_steps.setdefault(label, i)
+
+        if len(cache) >= self._DISPLAY_CACHE_LIMIT:
+            cache.clear()
+        cache[id(param)] = (param, p_min, steps, labels, label_steps)
+        return labels, label_steps
+
     def _set_parameter_with_verify(
         self,
         param: Any,
@@ -834,30 +1008,27 @@ class ChainTools:
         p_max = float(getattr(param, "max", 1.0) or 1.0)
         direct_mode = self._supports_direct_str_for_value(param, p_min, p_max)
 
+        # Probes repeat as the search narrows (and the final read usually lands
+        # on a probed point), so each backend value crosses into Live once.
+        probes: Dict[float, Tuple[str, Optional[float]]] = {}
+
         def read_display(backend: float) -> Tuple[str, Optional[float]]:
+            key = round(backend, 6)
+            hit = probes.get(key)
+            if hit is not None:
+                return hit
             display = self._display_for_backend_value(param, backend, direct_mode)
             parsed = self._parse_display_number(display)
             converted = self._convert_display_number_for_unit(parsed, display, unit)
-            return display, converted
+            probes[key] = hit = (display, converted)
+            return hit
 
         is_quantized = bool(getattr(param, "is_quantized", False))
         used_fallback = False
 
         if is_quantized:
-            best_val = p_min
-            best_diff = float("inf")
             steps = int(max(1, (p_max - p_min) + 1))
-            for i in range(steps):
-                candidate = p_min + i
-                _, num = read_display(candidate)
-                if num is None:
-                    continue
-                diff = abs(num - target)
-                if diff < best_diff:
-                    best_diff = diff
-                    best_val = candidate
-                    if diff < 0.001:
-                        break
+            best_val = self._search_quantized_steps(read_display, p_min, steps, target)
             param.value = best_val
             display, final_num = read_display(float(getattr(param, "value", best_val)))
             exact = final_num is not None and abs(final_num - target) < 0.01
@@ -866,46 +1037,69 @@ class ChainTools:
             best_val = (low + high) / 2.0
             best_diff = float("inf")
 
-            _, low_num = read_display(low)
-            _, high_num = read_display(high)
-            ascending = True
-            if low_num is not None and high_num is not None:
-                ascending = high_num > low_num
-
-            for _ in range(max(1, int(max_iterations))):
-                mid = (low + high) / 2.0
-                _, mid_num = read_display(mid)
-                if mid_num is None:
-                    break
+            # Warm start: a parameter's value->display mapping is fixed, so the
+            # point solved on its previous write (and the mapping's direction)
+            # still bracket the target without re-reading the endpoints.
+            solved = False
+            low_num: Optional[float] = None
+            high_num: Optional[float] = None
+            warm = self._verify_warm_start.get(id(param))
+            if warm is not None and warm[0] is param and warm[1] == unit and p_min <= warm[2] <= p_max:
+                _, _, warm_val, warm_num, ascending = warm
+                best_val = warm_val
+                best_diff = abs(warm_num - target)
+                if target != 0:
+                    solved = best_diff / abs(target) < float(tolerance)
+                else:
+                    solved = best_diff < 0.01
+                if (warm_num < target) == ascending:
+                    low, low_num = warm_val, warm_num
+                else:
+                    high, high_num = warm_val, warm_num
+            else:
+                _, low_num = read_display(low)
+                _, high_num = read_display(high)
+                ascending = True
+                if low_num is not None and high_num is not None:
+                    ascending = high_num > low_num
+
+            if not solved:
+                for iteration in range(max(1, int(max_iterations))):
+                    # Even steps interpolate between the bracket's displays (most
+                    # mappings are near-linear there); odd steps bisect, which
+                    # keeps the worst case logarithmic on curved mappings.
+                    if iteration % 2 == 0 and low_num is not None and high_num is not None and high_num != low_num:
+                        frac = (target - low_num) / (high_num - low_num)
+                        mid = low + max(0.05, min(0.95, frac)) * (high - low)
+                    else:
+                        mid = (low + high) / 2.0
+                    _, mid_num = read_display(mid)
+                    if mid_num is None:
+                        break
 
-                diff = abs(mid_num - target)
-                if diff < best_diff:
-                    best_diff = diff
-                    best_val = mid
+                    diff = abs(mid_num - target)
+                    if diff < best_diff:
+                        best_diff = diff
+                        best_val = mid
 
-                if target != 0:
-                    if diff / abs(target) < float(tolerance):
+                    if target != 0:
+                        if diff / abs(target) < float(tolerance):
+                            break
+                    elif diff < 0.01:
                         break
-                elif diff < 0.01:
-                    break
 
-                if ascending:
-                    if mid_num < target:
-                        low = mid
-                    else:
-                        high = mid
-                else:
-                    if mid_num > target:
-                        low = mid
+                    if (mid_num < target) == ascending:
+                        low, low_num = mid, mid_num
                     else:
-                        high = mid
+                        high, high_num = mid, mid_num
 
-                if abs(high - low) < 0.0001:
-                    break
+                    if abs(high - low) < 0.0001:
+                        break
 
             best_val = max(p_min, min(p_max, best_val))
             param.value = best_val
-            display, final_num = read_display(float(getattr(param, "value", best_val)))
+            final_val = float(getattr(param, "value", best_val))
+            display, final_num = read_display(final_val)
             if final_num is None:
                 exact = False
             elif target != 0:
@@ -913,6 +1107,12 @@ class ChainTools:
             else:
                 exact = abs(final_num - target) < 0.01
 
+            if final_num is not None:
+                cache = self._verify_warm_start
+                if len(cache) >= self._DISPLAY_CACHE_LIMIT:
+                    cache.clear()
+                cache[id(param)] = (param, unit, final_val, final_num, ascending)
+
         if not exact and fallback_value is not None:
             try:
                 fb = max(p_min, min(p_max, float(fallback_value)))
@@ -924,12 +1124,89 @@ class ChainTools:
 
         return {
             "ok": True,
-            "mode": "display_verify",
+            "mode": MODE_DISPLAY_VERIFY,
             "value": float(getattr(param, "value", p_min)),
             "display": display,
             "exact_match": bool(exact) and not used_fallback,
         }
 
+    def _search_quantized_steps(self, read_display: Any, p_min: float, steps: int, target: float) -> float:
+        """Return the quantized step whose display number is closest to target.
+
+        Monotonic step ranges are searched by interpolating between the
+        bracketing displays (midpoint when a guess lands outside them); any
+        unparseable or non-monotonic probe falls back to the full scan (already
+        probed steps are free via the caller's memo).
+        """
+        best_val = p_min
+        best_diff = float("inf")
+        probed: Dict[int, float] = {}
+
+        def consider(step: int) -> Optional[float]:
+            nonlocal best_val, best_diff
+            _, num = read_display(p_min + step)
+            if num is not None:
+                probed[step] = num
+                diff = abs(num - target)
+                if diff < best_diff:
+                    best_diff = diff
+                    best_val = p_min + step
+            return num
+
+        lo, hi = 0, steps - 1
+        lo_num = consider(lo)
+        hi_num = consider(hi) if hi > lo else lo_num
+        monotonic = lo_num is not None and hi_num is not None and lo_num != hi_num
+        while monotonic and hi - lo > 1 and best_diff >= 0.001:
+            span = hi_num - lo_num
+            guess = lo + int(round((target - lo_num) / span * (hi - lo)))
+            guess = max(lo + 1, min(hi - 1, guess))
+            num = consider(guess)
+            if num is None or not (min(lo_num, hi_num) <= num <= max(lo_num, hi_num)):
+                monotonic = False
+                break
+            if (num < target) == (span > 0):
+                lo, lo_num = guess, num
+            elif num == target:
+                break
+            else:
+                hi, hi_num = guess, num
+            mid = (lo + hi) // 2
+            if hi - lo > 2 and mid not in (lo, hi):
+                # Interleave a midpoint probe so skewed display curves still
+                # shrink the bracket geometrically.
+                num = consider(mid)
+                if num is None or not (min(lo_num, hi_num) <= num <= max(lo_num, hi_num)):
+                    monotonic = False
+                    break
+                if (num < target) == (span > 0):
+                    lo, lo_num = mid, num
+                elif num == target:
+                    break
+                else:
+                    hi, hi_num = mid, num
+
+        if monotonic and best_diff >= 0.001:
+            # The bracket only compared each probe with its current ends, so
+            # shuffled labels can pass it. Every probe, plus the steps just
+            # outside the final bracket and the quartiles, must follow step
+            # order before the bracket's answer is trusted.
+            last = steps - 1
+            for step in (lo - 1, hi + 1, last // 4, last // 2, 3 * last // 4):
+                if 0 <= step < steps and step not in probed:
+                    consider(step)
+            ordered = [probed[step] for step in sorted(probed)]
+            if ordered[-1] < ordered[0]:
+                ordered.reverse()
+            monotonic = all(a < b for a, b in zip(ordered, ordered[1:]))
+
+        if not monotonic and best_diff >= 0.001:
+            for step in range(steps):
+                consider(step)
+                if best_diff < 0.001:
+                    break
+        return best_val
+
     def _supports_direct_str_for_value(self, param: Any, sample_a: float, sample_b: float) -> bool:
         if not hasattr(param, "str_for_value"):
             return False
@@ -955,31 +1232,47 @@ class ChainTools:
         return str(self._safe_str_for_value(param, current) or "")
 
     def _normalize_display_text(self, value: Any) -> str:
-        return " ".join(self._TOKEN_RE.findall(str(value or "").lower()))
+        text = value if isinstance(value, str) else str(value or "")
+        return " ".join(_TOKEN_FINDALL(text.lower()))
 
-    def _score_display_text_match(self, target_norm: str, candidate_norm: str) -> Tuple[float, bool]:
+    def _score_display_text_match(
+        self, target_norm: str, candidate_norm: str, target_tokens: Optional[frozenset] = None
+    ) -> Tuple[float, bool]:
+        """Score a normalized display label against the normalized target.
+
+        Ranking loops pass the target's `target_tokens` once so each candidate
+        costs a single intersection instead of building two sets.
+        """
         if not target_norm or not candidate_norm:
             return 0.0, False
         if target_norm == candidate_norm:
             return 100.0, True
         if target_norm in candidate_norm or candidate_norm in target_norm:
             return 10.0, False
-        target_tokens = set(target_norm.split())
-        candidate_tokens = set(candidate_norm.split())
-        overlap = target_tokens & candidate_tokens
-        return float(len(overlap)), False
+        if target_tokens is None:
+            target_tokens = frozenset(target_norm.split())
+        return float(len(target_tokens.intersection(candidate_norm.split()))), False
 
     def _parameter_payload(self, param: Any, index: int, include_value: bool) -> Dict[str, Any]:
+        safe_float = self._safe_float
+        # LOM parameters report floats and str names already; only other
+        # types go through the coercing helpers.
+        name = getattr(param, "name", "")
+        p_min = getattr(param, "min", None)
+        p_max = getattr(param, "max", None)
+        default = getattr(param, "default_value", None)
         payload: Dict[str, Any] = {
-            "index": int(index),
-            "name": str(getattr(param, "name", "")),
-            "min": self._safe_float(getattr(param, "min", None)),
-            "max": self._safe_float(getattr(param, "max", None)),
-            "default": self._safe_float(getattr(param, "default_value", None)),
+            "index": index if isinstance(index, int) else int(index),
+            "name": name if isinstance(name, str) else str(name),
+            "min": p_min if isinstance(p_min, float) else safe_float(p_min),
+            "max": p_max if isinstance(p_max, float) else safe_float(p_max),
+            "default": default if isinstance(default, float) else safe_float(default),
             "is_quantized": bool(getattr(param, "is_quantized", False)),
         }
         if include_value:
-            current = self._safe_float(getattr(param, "value", None))
+            current = getattr(param, "value", None)
+            if not isinstance(current, float):
+                current = safe_float(current)
             payload["value"] = current
             payload["display"] = self._safe_str_for_value(param, current)
         return payload
@@ -988,12 +1281,20 @@ class ChainTools:
     # Browser helpers
     # ------------------------------------------------------------------
     def _get_live_browser(self) -> Any:
+        app = ChainTools._live_application
+        if app is None:
+            if Live is None:
+                return None
+            try:
+                app = Live.Application.get_application()
+            except Exception:
+                return None
+            ChainTools._live_application = app
         try:
-            import Live  # type: ignore
-
-            app = Live.Application.get_application()
-            return getattr(app, "browser", None)
+            return app.browser
         except Exception:
+            # Stale application handle; fetch it again on the next lookup.
+            ChainTools._live_application = None
             return None
 
     def _find_browser_device(self, browser: Any, device_name: str) -> Any:
@@ -1017,8 +1318,18 @@ class ChainTools:
         return None
 
     def _search_browser_node(self, node: Any, normalized_target: str) -> Any:
+        """Depth-first search for a loadable item named `normalized_target`.
+
+        An exact name match returns immediately; the first substring match is
+        kept as the fallback if the tree has no exact match.
+        """
+        if not normalized_target:
+            return None
+        normalize = self._normalize_name
+        target_len = len(normalized_target)
         stack = [node]
         visited = set()
+        best_partial = None
 
         while stack:
             current = stack.pop()
@@ -1027,12 +1338,17 @@ class ChainTools:
                 continue
             visited.add(marker)
 
-            name = self._normalize_name(getattr(current, "name", ""))
-            if normalized_target and (normalized_target == name or normalized_target in name):
-                if bool(getattr(current, "is_loadable", True)):
-                    return current
+            raw_name = getattr(current, "name", "")
+            # Normalizing never lengthens a name, so raw names shorter than the
+            # target cannot match and are not normalized at all.
+            if not isinstance(raw_name, str) or len(raw_name) >= target_len:
+                name = normalize(raw_name)
+                if normalized_target in name and bool(getattr(current, "is_loadable", True)):
+                    if normalized_target == name:
+                        return current
+                    if best_partial is None:
+                        best_partial = current
 
-            children = []
             for child_attr in ("children", "items"):
                 try:
                     values = getattr(current, child_attr, None)
@@ -1040,26 +1356,35 @@ class ChainTools:
                     values = None
                 if values:
                     try:
-                        children.extend(list(values))
+                        stack.extend(values)
                     except Exception:
                         pass
-            stack.extend(children)
 
-        return None
+        return best_partial
 
     # ------------------------------------------------------------------
     # Small utilities
     # ------------------------------------------------------------------
     def _device_class_name(self, device: Any) -> str:
-        return str(getattr(device, "class_name", "") or type(device).__name__)
+        # A handful of class names repeat across every device payload; intern
+        # them so large inspect results share one string per class.
+        return sys.intern(str(getattr(device, "class_name", "") or type(device).__name__))
+
+    def _names_overlap(self, left: str, right: str) -> bool:
+        """True when either normalized name contains the other (or they are equal)."""
+        if len(left) <= len(right):
+            return left in right
+        return right in left
 
     def _normalize_name(self, text: Any) -> str:
-        return "".join(self._TOKEN_RE.findall(str(text or "").lower()))
+        return normalize_query(text)
 
     def _safe_float(self, value: Any) -> Optional[float]:
+        if value is None:
+            return None
+        if isinstance(value, float):
+            return value
         try:
-            if value is None:
-                return None
             return float(value)
         except Exception:
             return None
@@ -1068,19 +1393,23 @@ class ChainTools:
         if backend_value is None:
             return None
         try:
-            if hasattr(param, "str_for_value"):
-                return str(param.str_for_value(float(backend_value)))
+            number = backend_value if isinstance(backend_value, float) else float(backend_value)
         except Exception:
-            pass
+            return None
         try:
-            return str(float(backend_value))
+            # One attribute fetch instead of hasattr() followed by a second lookup.
+            str_for_value = getattr(param, "str_for_value", None)
+            if str_for_value is not None:
+                display = str_for_value(number)
+                return display if isinstance(display, str) else str(display)
         except Exception:
-            return None
+            pass
+        return str(number)
 
     def _parse_display_number(self, display: Any) -> Optional[float]:
         if display is None:
             return None
-        match = re.search(r"[-+]?\d+\.?\d*", str(display))
+        match = _DISPLAY_NUMBER_SEARCH(display if isinstance(display, str) else str(display))
         if not match:
             return None
         try:
@@ -1115,33 +1444,11 @@ class ChainTools:
     ) -> Optional[float]:
         if number is None or not unit_hint:
             return number
-        display = str(display_str or "").lower()
-
-        if unit_hint == "s":
-            if "ms" in display:
-                return float(number) / 1000.0
-            return float(number)
-
-        if unit_hint == "ms":
-            if "ms" in display:
-                return float(number)
-            if "sec" in display or "seconds" in display:
-                return float(number) * 1000.0
-            return float(number)
-
-        if unit_hint == "%":
-            if "%" in display:
-                return float(number)
-            if -1.0 <= float(number) <= 1.0:
-                return float(number) * 100.0
-            return float(number)
-
-        if unit_hint == "hz":
-            if "khz" in display or "k hz" in display:
-                return float(number) * 1000.0
-            return float(number)
-
-        return float(number)
+        value = float(number)
+        convert = _UNIT_CONVERTERS.get(unit_hint)
+        if convert is None:
+            return value
+        return convert(value, str(display_str or "").lower())
 
     def _error(self, message: str, elapsed_ms: float, **extra: Any) -> Dict[str, Any]:
         payload = {
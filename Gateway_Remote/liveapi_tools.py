@@ -8,4 +8,9 @@ from .chain_tools import ChainTools
 class LiveAPITools(ChainTools):
     """Gateway surface for chain builder actions only."""
 
-    pass
+    # Explicit action surface read by build_registry instead of scanning dir().
+    __exported_actions__ = (
+        "build_device_chain",
+        "inspect_track_chain",
+        "update_device_parameters",
+    )
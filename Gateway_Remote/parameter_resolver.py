@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Sequence, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 _TOKEN_RE = re.compile(r"[a-z0-9]+")
 _EQ_BAND_RE = re.compile(r"^(?:band)?([1-8])(?:filter)?(type|frequency|freq|gain|q)$")
@@ -17,19 +18,40 @@ class ResolutionTrace:
     resolved_param_name: str | None
 
 
+_TOKEN_FINDALL = _TOKEN_RE.findall
+# Deletes every non-alphanumeric ASCII character; applied to lowercased text
+# it keeps exactly what _TOKEN_RE would.
+_ASCII_NON_TOKEN_TABLE = {c: None for c in range(128) if not chr(c).isalnum()}
+
+
+@lru_cache(maxsize=1024)
+def _normalize_text(text: str) -> str:
+    # Parameter names recur across devices and resolves ("1 Frequency A",
+    # "Gain", ...), so most lookups hit this cache.
+    lowered = text.lower()
+    if lowered.isascii():
+        return lowered.translate(_ASCII_NON_TOKEN_TABLE)
+    return "".join(_TOKEN_FINDALL(lowered))
+
+
 def normalize_query(text: Any) -> str:
-    return "".join(_TOKEN_RE.findall(str(text or "").lower()))
+    return _normalize_text(text if isinstance(text, str) else str(text or ""))
 
 
 def build_parameter_index(parameters: Sequence[Any]) -> Dict[str, Any]:
     index: Dict[str, Any] = {}
+    setdefault = index.setdefault
     for param in parameters:
-        key = normalize_query(getattr(param, "name", ""))
-        if key and key not in index:
-            index[key] = param
+        name = getattr(param, "name", "")
+        key = _normalize_text(name if isinstance(name, str) else str(name or ""))
+        if key:
+            setdefault(key, param)
     return index
 
 
+_EQ_CLASS_NAMES = frozenset({"Eq8", "EqEight"})
+_EQ_NORMALIZED_CLASS_NAMES = frozenset({"eq8", "eqeight"})
+
 def eq_band_rule_candidates(normalized_query: str) -> List[str]:
     if not normalized_query:
         return []
@@ -63,12 +85,37 @@ def eq_band_rule_candidates(normalized_query: str) -> List[str]:
     return []
 
 
+@lru_cache(maxsize=64)
+def _eq_band_rule_pairs(normalized_query: str) -> Tuple[Tuple[str, str], ...]:
+    # Rule candidates are fixed strings per band/field, so their normalized
+    # keys are computed once instead of on every resolve.
+    return tuple((candidate, normalize_query(candidate)) for candidate in eq_band_rule_candidates(normalized_query))
+
+
+def precompute_aliases(curated_aliases: Dict[str, Tuple[str, ...]]) -> Dict[str, Tuple[Tuple[str, str], ...]]:
+    """Pair every curated alias candidate with its normalized index key."""
+    return {
+        query: tuple((candidate, normalize_query(candidate)) for candidate in candidates)
+        for query, candidates in curated_aliases.items()
+    }
+
+
 def resolve_parameter(
     parameters: Sequence[Any],
     device: Any,
     query: Any,
     curated_aliases: Dict[str, Tuple[str, ...]],
+    index: Optional[Dict[str, Any]] = None,
+    eq_like: Optional[bool] = None,
+    alias_pairs: Optional[Dict[str, Tuple[Tuple[str, str], ...]]] = None,
 ) -> Tuple[Any, ResolutionTrace]:
+    """Resolve `query` against a device's parameters.
+
+    Callers resolving several queries against the same device can pass a
+    prebuilt `index` and `eq_like` flag to skip rebuilding them per query, and
+    `alias_pairs` from `precompute_aliases(curated_aliases)` to skip
+    normalizing alias candidates per resolve.
+    """
     query_text = str(query or "")
     normalized_query = normalize_query(query_text)
     if not normalized_query:
@@ -80,7 +127,15 @@ def resolve_parameter(
             resolved_param_name=None,
         )
 
-    index = build_parameter_index(parameters)
+    if eq_like is None:
+        eq_like = is_eq_like(device)
+    if alias_pairs is not None:
+        aliases = alias_pairs.get(normalized_query, ())
+    else:
+        candidates = curated_aliases.get(normalized_query, ())
+        aliases = tuple((candidate, normalize_query(candidate)) for candidate in candidates)
+    if index is None:
+        index = build_parameter_index(parameters)
     candidate_chain: List[str] = [query_text]
 
     exact = index.get(normalized_query)
@@ -93,10 +148,10 @@ def resolve_parameter(
             resolved_param_name=str(getattr(exact, "name", "")),
         )
 
-    if _is_eq_like(device):
-        for candidate in eq_band_rule_candidates(normalized_query):
+    if eq_like:
+        for candidate, candidate_key in _eq_band_rule_pairs(normalized_query):
             candidate_chain.append(candidate)
-            matched = index.get(normalize_query(candidate))
+            matched = index.get(candidate_key)
             if matched is not None:
                 return matched, ResolutionTrace(
                     matched_by="rule",
@@ -106,9 +161,9 @@ def resolve_parameter(
                     resolved_param_name=str(getattr(matched, "name", "")),
                 )
 
-    for candidate in curated_aliases.get(normalized_query, ()):
+    for candidate, candidate_key in aliases:
         candidate_chain.append(candidate)
-        matched = index.get(normalize_query(candidate))
+        matched = index.get(candidate_key)
         if matched is not None:
             return matched, ResolutionTrace(
                 matched_by="alias",
@@ -127,7 +182,10 @@ def resolve_parameter(
     )
 
 
-def _is_eq_like(device: Any) -> bool:
+def is_eq_like(device: Any) -> bool:
+    class_name = getattr(device, "class_name", "")
+    # Live reports EQ Eight as "Eq8"; match the raw class name before normalizing.
+    if isinstance(class_name, str) and class_name in _EQ_CLASS_NAMES:
+        return True
     device_name = normalize_query(getattr(device, "name", ""))
-    device_class = normalize_query(getattr(device, "class_name", ""))
-    return device_name == "eqeight" or device_class in {"eq8", "eqeight"}
+    return device_name == "eqeight" or normalize_query(class_name) in _EQ_NORMALIZED_CLASS_NAMES
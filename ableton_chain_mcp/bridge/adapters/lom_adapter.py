@@ -18,6 +18,11 @@ from ...policy import is_action_read_only
 from ...schema_loader import ActionSchema
 from ..gateway_client import GatewayClientError, GatewayTCPClient, GatewayTimeoutError
 
+# Base delay before each retry of a read-only action, plus up to 50ms jitter.
+_RETRY_BACKOFFS = (0.2, 0.4)
+_RETRY_JITTER = 0.05
+_random = random.random
+
 
 class LOMAdapter:
     def __init__(self, gateway: GatewayTCPClient, schema: ActionSchema) -> None:
@@ -44,13 +49,15 @@ class LOMAdapter:
         is_read_only = is_action_read_only(action, spec)
 
         max_attempts = 3 if is_read_only else 1
+        timeout_sec = timeout / 1000.0
+        request = {"action": action, **payload}
         attempts = 0
         last_error: Dict[str, Any] | None = None
 
         while attempts < max_attempts:
             attempts += 1
             try:
-                response = self._gateway.send_payload({"action": action, **payload}, timeout_sec=timeout / 1000.0)
+                response = self._gateway.send_payload(request, timeout_sec=timeout_sec)
                 if response.get("ok"):
                     return {
                         "ok": True,
@@ -88,8 +95,8 @@ class LOMAdapter:
                 }
 
             if attempts < max_attempts:
-                delay = (0.2 if attempts == 1 else 0.4) + random.uniform(0.0, 0.05)
-                time.sleep(delay)
+                backoff = _RETRY_BACKOFFS[min(attempts, len(_RETRY_BACKOFFS)) - 1]
+                time.sleep(backoff + _random() * _RETRY_JITTER)
 
         return last_error or {
             "ok": False,
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
-import json
 import socket
-from typing import Any, Dict, Optional
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from ..json_codec import JSONDecodeError, dumps_line, loads
+from ..line_socket import IDLE_REUSE_SEC, RECV_CHUNK_SIZE, StaleConnectionError, peer_closed, send_line
+
+POOL_SIZE = 4
 
 
 class GatewayClientError(RuntimeError):
@@ -15,37 +21,75 @@ class GatewayTimeoutError(GatewayClientError):
     """Gateway timeout failure."""
 
 
+class _PooledConnection:
+    """One kept-alive gateway socket plus its receive buffer."""
+
+    __slots__ = ("sock", "buf", "view", "last_used")
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.buf = bytearray(RECV_CHUNK_SIZE)
+        self.view = memoryview(self.buf)
+        self.last_used = time.monotonic()
+
+    def close(self) -> None:
+        try:
+            self.sock.close()
+        except Exception:
+            pass
+
+
 class GatewayTCPClient:
-    def __init__(self, host: str, port: int, timeout_sec: float = 3.0) -> None:
+    """Newline-delimited JSON client backed by a small gateway connection pool.
+
+    Each request checks out the most recently used idle connection (or opens
+    one), so concurrent callers never share a socket and sequential callers
+    reuse a warm one. A connection goes back to the pool only after a clean
+    reply; errors, timeouts and malformed replies close it.
+    """
+
+    def __init__(self, host: str, port: int, timeout_sec: float = 3.0, pool_size: int = POOL_SIZE) -> None:
         self.host = host
         self.port = int(port)
         self.timeout_sec = float(timeout_sec)
+        self.pool_size = max(1, int(pool_size))
+        self._lock = threading.Lock()
+        self._idle: List[_PooledConnection] = []
 
     def send_payload(self, payload: Dict[str, Any], timeout_sec: Optional[float] = None) -> Dict[str, Any]:
         timeout = float(timeout_sec if timeout_sec is not None else self.timeout_sec)
-        raw = json.dumps(payload, ensure_ascii=True) + "\n"
-
-        try:
-            sock = socket.create_connection((self.host, self.port), timeout=timeout)
-        except OSError as exc:
-            raise GatewayClientError(f"unable to connect to gateway {self.host}:{self.port}: {exc}")
+        raw = dumps_line(payload)
 
+        conn = self._checkout()
         try:
-            sock.settimeout(timeout)
-            sock.sendall(raw.encode("utf-8"))
-            response = _recv_line(sock)
-            return json.loads(response)
+            try:
+                if conn is None:
+                    conn = self._connect(timeout)
+                    response = self._exchange(conn, raw, timeout, reused=False)
+                else:
+                    try:
+                        response = self._exchange(conn, raw, timeout, reused=True)
+                    except StaleConnectionError:
+                        # Only raised before the request was fully written, so
+                        # the gateway never saw it and resending is safe.
+                        conn.close()
+                        conn = self._connect(timeout)
+                        response = self._exchange(conn, raw, timeout, reused=False)
+                decoded = loads(response)
+            except BaseException:
+                if conn is not None:
+                    conn.close()
+                raise
+            self._checkin(conn)
+            return decoded
         except socket.timeout as exc:
             raise GatewayTimeoutError(f"gateway request timed out after {timeout:.2f}s") from exc
-        except json.JSONDecodeError as exc:
+        except JSONDecodeError as exc:
             raise GatewayClientError(f"gateway returned invalid json: {exc}") from exc
+        except GatewayClientError:
+            raise
         except OSError as exc:
             raise GatewayClientError(f"gateway io error: {exc}") from exc
-        finally:
-            try:
-                sock.close()
-            except Exception:
-                pass
 
     def ping(self) -> bool:
         try:
@@ -54,19 +98,71 @@ class GatewayTCPClient:
         except GatewayClientError:
             return False
 
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def _checkout(self) -> Optional[_PooledConnection]:
+        cutoff = time.monotonic() - IDLE_REUSE_SEC
+        while True:
+            with self._lock:
+                if not self._idle:
+                    return None
+                conn = self._idle.pop()
+            if conn.last_used > cutoff and not peer_closed(conn.sock):
+                return conn
+            conn.close()
+
+    def _checkin(self, conn: _PooledConnection) -> None:
+        if conn.sock.fileno() < 0:
+            return
+        conn.last_used = time.monotonic()
+        with self._lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def _connect(self, timeout: float) -> _PooledConnection:
+        try:
+            sock = socket.create_connection((self.host, self.port), timeout=timeout)
+        except OSError as exc:
+            raise GatewayClientError(f"unable to connect to gateway {self.host}:{self.port}: {exc}")
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError:
+            pass
+        return _PooledConnection(sock)
+
+    def _exchange(self, conn: _PooledConnection, raw: bytes, timeout: float, reused: bool) -> bytes:
+        send_line(conn.sock, raw, timeout, reused)
+        return self._recv_line(conn)
+
+    def _recv_line(self, conn: _PooledConnection) -> bytes:
+        sock = conn.sock
+        view = conn.view
+        count = sock.recv_into(view)
+        if count:
+            newline = conn.buf.find(b"\n", 0, count)
+            if newline >= 0:
+                # Common case: the whole reply arrived in one read.
+                return bytes(view[:newline])
+
+        received = bytearray()
+        while count:
+            received += view[:count]
+            newline = received.find(b"\n", len(received) - count)
+            if newline >= 0:
+                del received[newline:]
+                return bytes(received)
+            count = sock.recv_into(view)
 
-def _recv_line(sock: socket.socket) -> str:
-    chunks = []
-    while True:
-        chunk = sock.recv(4096)
-        if not chunk:
-            break
-        chunks.append(chunk)
-        if b"\n" in chunk:
-            break
-    if not chunks:
+        # The gateway closed the stream; whatever arrived is the reply, and
+        # the closed socket keeps the connection out of the pool.
+        conn.close()
+        if received:
+            return bytes(received)
         raise GatewayClientError("gateway returned empty response")
-    payload = b"".join(chunks)
-    if b"\n" in payload:
-        payload = payload.split(b"\n", 1)[0]
-    return payload.decode("utf-8")
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
+import selectors
 import socket
 import threading
 import time
-from typing import Any, Dict, Optional, Set, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional, Set, Tuple
 
 from ..constants import (
+    BRIDGE_MONITOR_INTERVAL_SEC,
+    BRIDGE_MONITOR_MIN_INTERVAL_SEC,
+    BRIDGE_MONITOR_RECENT_SUCCESS_SEC,
     DEFAULT_GATEWAY_HOST,
     DEFAULT_GATEWAY_PORT,
     ERROR_ABLETON_UNAVAILABLE,
@@ -27,12 +32,45 @@ from ..constants import (
     ROUTE_BRIDGE,
     SCHEMA_PATH,
 )
-from ..envelope import envelope_error, envelope_ok
+from ..envelope import envelope_error_fast, envelope_ok_fast
 from ..feature_flags import FeatureFlags
+from ..json_codec import JSONDecodeError, dumps_line, loads
+from ..logging_utils import env_float
 from ..schema_loader import ActionSchema
 from .adapters.lom_adapter import LOMAdapter
 from .gateway_client import GatewayClientError, GatewayTCPClient
 
+RECV_CHUNK_SIZE = 65536
+CAPABILITIES_TTL_NS = 5_000_000_000
+# Discovery tries two gateway methods with a 2s timeout each.
+CAPABILITIES_REFRESH_WAIT_SEC = 4.0
+ACCEPT_POLL_SEC = 0.5
+# Workers only run request dispatch; idle kept-alive connections stay on the
+# selector and hold none.
+CLIENT_WORKERS = max(8, min(32, (os.cpu_count() or 2) * 4))
+CLIENT_IDLE_TIMEOUT_SEC = 30.0
+
+_now_ns = time.monotonic_ns
+
+_REQUIRED_ACTIONS_SORTED = tuple(sorted(REQUIRED_GATEWAY_ACTIONS))
+_HEALTH_EQUIV_SORTED = tuple(sorted(GATEWAY_HEALTH_EQUIVALENTS))
+
+
+class _ClientConnection:
+    """Read buffer and in-order request queue for one kept-alive client."""
+
+    __slots__ = ("sock", "buffer", "scan_from", "lock", "pending", "busy", "closing", "last_active")
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.buffer = bytearray()
+        self.scan_from = 0
+        self.lock = threading.Lock()
+        self.pending: Deque[bytes] = deque()
+        self.busy = False
+        self.closing = False
+        self.last_active = time.monotonic()
+
 
 class BridgeServer:
     def __init__(
@@ -53,21 +91,40 @@ class BridgeServer:
         self._state_lock = threading.Lock()
         self._state = HEALTH_STARTING
         self._last_gateway_success_epoch = 0.0
+        # Interval logic uses this; the epoch above is only reported.
+        self._last_gateway_success_mono: Optional[float] = None
         self._consecutive_gateway_failures = 0
         self._running = False
+        self._stop_event = threading.Event()
+        self._monitor_interval = env_float(
+            "BRIDGE_MONITOR_INTERVAL_SEC", BRIDGE_MONITOR_INTERVAL_SEC, minimum=BRIDGE_MONITOR_MIN_INTERVAL_SEC
+        )
         self._listener_socket: Optional[socket.socket] = None
         self._monitor_thread: Optional[threading.Thread] = None
+        self._client_executor = ThreadPoolExecutor(max_workers=CLIENT_WORKERS, thread_name_prefix="BridgeClient")
+        self._clients_lock = threading.Lock()
+        self._clients: Set[_ClientConnection] = set()
+        self._dispatch: Dict[str, Callable[[Dict[str, Any], str], Dict[str, Any]]] = {
+            "ping": self._ping_response,
+            "health_check": self._health_check_response,
+            "bridge_capabilities": self._capabilities_response,
+            "ableton_connection_status": self._connection_status_response,
+            "live_version": self._live_version_response,
+            "execute": self._execute_action_request,
+        }
 
-        self._compat_lock = threading.Lock()
+        self._capabilities_checked_ns: Optional[int] = None
+        self._refresh_lock = threading.Lock()
+        self._compatible_flag = False
         self._capabilities: Dict[str, Any] = {
             "checked_at_epoch": 0.0,
             "strict_mode": bool(self.flags.strict_gateway_compat),
             "compatible": False,
             "message": "not yet evaluated",
-            "required_actions": sorted(REQUIRED_GATEWAY_ACTIONS),
-            "health_equivalents": sorted(GATEWAY_HEALTH_EQUIVALENTS),
+            "required_actions": list(_REQUIRED_ACTIONS_SORTED),
+            "health_equivalents": list(_HEALTH_EQUIV_SORTED),
             "available_actions": [],
-            "missing_actions": sorted(REQUIRED_GATEWAY_ACTIONS),
+            "missing_actions": list(_REQUIRED_ACTIONS_SORTED),
             "health_equivalent_found": False,
             "discovery_method": None,
         }
@@ -82,24 +139,56 @@ class BridgeServer:
 
         listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         listener.bind(self.socket_path)
-        listener.listen(16)
+        listener.listen(socket.SOMAXCONN)
         os.chmod(self.socket_path, 0o600)
         self._listener_socket = listener
 
         self.logger.info("bridge listening", extra={"extra_fields": {"socket_path": self.socket_path}})
 
-        while self._running:
-            try:
-                client, _ = listener.accept()
-            except OSError:
-                if self._running:
-                    self.logger.exception("bridge accept failed")
-                break
-            t = threading.Thread(target=self._handle_client, args=(client,), daemon=True)
-            t.start()
+        # One selector owns the listener and every client socket: reads and
+        # line framing happen on this thread and only complete request lines
+        # go to the pool, so idle kept-alive connections hold no worker. The
+        # timeout lets stop() end the loop and lets idle clients be expired.
+        listener.setblocking(False)
+        selector = selectors.DefaultSelector()
+        selector.register(listener, selectors.EVENT_READ)
+        view = memoryview(bytearray(RECV_CHUNK_SIZE))
+        try:
+            while self._running:
+                for key, _ in selector.select(timeout=ACCEPT_POLL_SEC):
+                    if key.data is not None:
+                        self._read_client(key.data, selector, view)
+                        continue
+                    try:
+                        client, _ = listener.accept()
+                    except BlockingIOError:
+                        continue
+                    except OSError:
+                        if self._running:
+                            self.logger.exception("bridge accept failed")
+                        self._running = False
+                        break
+                    # The timeout bounds sendall on pool workers; selector
+                    # reads only happen once the socket is readable.
+                    client.settimeout(CLIENT_IDLE_TIMEOUT_SEC)
+                    connection = _ClientConnection(client)
+                    with self._clients_lock:
+                        self._clients.add(connection)
+                    selector.register(client, selectors.EVENT_READ, connection)
+                self._expire_idle_clients(selector)
+        finally:
+            selector.close()
+            # The loop no longer submits, so shutting the pool down here
+            # cannot race a submit() from this thread.
+            self._client_executor.shutdown(wait=False, cancel_futures=True)
+            with self._clients_lock:
+                clients = list(self._clients)
+            for connection in clients:
+                self._close_client(connection)
 
     def stop(self) -> None:
         self._running = False
+        self._stop_event.set()
         sock = self._listener_socket
         if sock is not None:
             try:
@@ -111,14 +200,23 @@ class BridgeServer:
                 os.unlink(self.socket_path)
             except Exception:
                 pass
+        self._gateway.close()
 
     def _monitor_gateway_loop(self) -> None:
         self._set_state(HEALTH_CONNECTING)
         while self._running:
-            ok = self._gateway.ping()
+            # A successful execute a moment ago already proved the gateway up.
+            with self._state_lock:
+                last_success = self._last_gateway_success_mono
+                recent = (
+                    last_success is not None and time.monotonic() - last_success < BRIDGE_MONITOR_RECENT_SUCCESS_SEC
+                )
+            ok = recent or self._gateway.ping()
             with self._state_lock:
                 if ok:
-                    self._last_gateway_success_epoch = time.time()
+                    if not recent:
+                        self._last_gateway_success_mono = time.monotonic()
+                        self._last_gateway_success_epoch = time.time()
                     self._consecutive_gateway_failures = 0
                     self._state = HEALTH_READY
                 else:
@@ -130,64 +228,130 @@ class BridgeServer:
 
             if ok:
                 self._refresh_capabilities(force=False)
-            time.sleep(2.0)
+            self._stop_event.wait(self._monitor_interval)
 
     def _set_state(self, state: str) -> None:
         with self._state_lock:
             self._state = state
 
-    def _handle_client(self, client: socket.socket) -> None:
-        buffer = ""
+    def _read_client(self, connection: _ClientConnection, selector: selectors.BaseSelector, view: memoryview) -> None:
+        # Lines are assembled in one bytearray filled with recv_into; only the
+        # unscanned tail is searched for newlines and each complete line is
+        # handed to the decoder as bytes, so no str is built per chunk.
         try:
-            client.settimeout(30.0)
-            while self._running:
-                chunk = client.recv(4096)
-                if not chunk:
+            count = connection.sock.recv_into(view)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            count = 0
+        if not count:
+            # Replies to lines already queued are still sent after a
+            # half-close; the worker closes the socket once it drains.
+            selector.unregister(connection.sock)
+            with connection.lock:
+                connection.closing = True
+                idle = not connection.busy
+            if idle:
+                self._close_client(connection)
+            return
+
+        connection.last_active = time.monotonic()
+        buffer = connection.buffer
+        buffer += view[:count]
+        lines = []
+        start = 0
+        newline = buffer.find(b"\n", connection.scan_from)
+        while newline >= 0:
+            # The decoder tolerates surrounding whitespace (including a
+            # trailing \r), so lines are only checked, never stripped.
+            line = bytes(buffer[start:newline])
+            start = newline + 1
+            if line and not line.isspace():
+                lines.append(line)
+            newline = buffer.find(b"\n", start)
+        if start:
+            del buffer[:start]
+        connection.scan_from = len(buffer)
+        if not lines:
+            return
+
+        # At most one worker serves a connection at a time, so pipelined
+        # requests are answered in order.
+        with connection.lock:
+            connection.pending.extend(lines)
+            if connection.busy:
+                return
+            connection.busy = True
+        try:
+            self._client_executor.submit(self._serve_client, connection)
+        except RuntimeError:
+            # The pool is shut down once stop() has begun.
+            selector.unregister(connection.sock)
+            self._close_client(connection)
+
+    def _serve_client(self, connection: _ClientConnection) -> None:
+        while True:
+            with connection.lock:
+                if not connection.pending:
+                    connection.busy = False
+                    closing = connection.closing
                     break
-                buffer += chunk.decode("utf-8")
-                while "\n" in buffer:
-                    line, buffer = buffer.split("\n", 1)
-                    line = line.strip()
-                    if not line:
-                        continue
-                    response = self._handle_request_line(line)
-                    client.sendall((json.dumps(response, ensure_ascii=True) + "\n").encode("utf-8"))
-        except socket.timeout:
-            pass
-        except Exception:
-            self.logger.exception("bridge client handler failed")
-        finally:
+                line = connection.pending.popleft()
             try:
-                client.close()
-            except Exception:
-                pass
+                response = self._handle_request_line(line)
+                connection.sock.sendall(dumps_line(response))
+            except Exception as exc:
+                if not isinstance(exc, OSError):
+                    self.logger.exception("bridge client handler failed")
+                with connection.lock:
+                    connection.pending.clear()
+                    connection.busy = False
+                    closing = connection.closing
+                if closing:
+                    self._close_client(connection)
+                else:
+                    # Only the selector thread unregisters; shutting the
+                    # socket down makes it readable at EOF so it does so.
+                    try:
+                        connection.sock.shutdown(socket.SHUT_RDWR)
+                    except OSError:
+                        pass
+                return
+            connection.last_active = time.monotonic()
+        if closing:
+            self._close_client(connection)
+
+    def _expire_idle_clients(self, selector: selectors.BaseSelector) -> None:
+        deadline = time.monotonic() - CLIENT_IDLE_TIMEOUT_SEC
+        expired = [
+            key.data
+            for key in selector.get_map().values()
+            if key.data is not None and not key.data.busy and key.data.last_active < deadline
+        ]
+        for connection in expired:
+            selector.unregister(connection.sock)
+            self._close_client(connection)
 
-    def _handle_request_line(self, line: str) -> Dict[str, Any]:
+    def _close_client(self, connection: _ClientConnection) -> None:
+        with self._clients_lock:
+            self._clients.discard(connection)
         try:
-            request = json.loads(line)
-        except json.JSONDecodeError as exc:
+            connection.sock.close()
+        except Exception:
+            pass
+
+    def _handle_request_line(self, line: str | bytes) -> Dict[str, Any]:
+        try:
+            request = loads(line)
+        except JSONDecodeError as exc:
             return {"ok": False, "error_code": ERROR_INVALID_ACTION_PAYLOAD, "message": f"invalid json: {exc}"}
 
         request_type = str(request.get("type") or "")
         correlation_id = str(request.get("correlation_id") or "")
 
-        if request_type == "ping":
-            return {"ok": True, "message": "pong", "state": self._state_snapshot()}
-
-        if request_type == "health_check":
-            return self._health_check_response(correlation_id)
-
-        if request_type == "bridge_capabilities":
-            return self._capabilities_response(correlation_id)
-
-        if request_type == "ableton_connection_status":
-            return self._connection_status_response(correlation_id)
-
-        if request_type == "live_version":
-            return self._live_version_response(correlation_id)
-
-        if request_type == "execute":
-            return self._execute_action_request(request, correlation_id)
+        handler = self._dispatch.get(request_type)
+        if handler is not None:
+            return handler(request, correlation_id)
 
         return {
             "ok": False,
@@ -195,36 +359,39 @@ class BridgeServer:
             "message": f"unsupported request type '{request_type}'",
         }
 
+    def _ping_response(self, request: Dict[str, Any], correlation_id: str) -> Dict[str, Any]:
+        return {"ok": True, "message": "pong", "state": self._state_snapshot()}
+
     def _execute_action_request(self, request: Dict[str, Any], correlation_id: str) -> Dict[str, Any]:
-        started = time.perf_counter()
+        started_ns = _now_ns()
         action = str(request.get("action") or "").strip()
         payload = request.get("payload") or {}
 
         if not action:
-            return envelope_error(
+            return envelope_error_fast(
                 error_code=ERROR_INVALID_ACTION_PAYLOAD,
                 message="missing action",
                 route_used=ROUTE_API,
-                duration_ms=(time.perf_counter() - started) * 1000.0,
+                duration_ms=(_now_ns() - started_ns) / 1_000_000,
                 correlation_id=correlation_id,
                 payload={},
             )
         if not isinstance(payload, dict):
-            return envelope_error(
+            return envelope_error_fast(
                 error_code=ERROR_INVALID_ACTION_PAYLOAD,
                 message="payload must be an object",
                 route_used=ROUTE_API,
-                duration_ms=(time.perf_counter() - started) * 1000.0,
+                duration_ms=(_now_ns() - started_ns) / 1_000_000,
                 correlation_id=correlation_id,
                 payload={},
             )
 
         if not self._is_gateway_compatible():
-            return envelope_error(
+            return envelope_error_fast(
                 error_code=ERROR_GATEWAY_INCOMPATIBLE,
                 message="gateway is incompatible with strict chain-only contract",
                 route_used=ROUTE_API,
-                duration_ms=(time.perf_counter() - started) * 1000.0,
+                duration_ms=(_now_ns() - started_ns) / 1_000_000,
                 correlation_id=correlation_id,
                 payload={"capabilities": self._capabilities_snapshot()},
             )
@@ -232,9 +399,12 @@ class BridgeServer:
         timeout_ms = request.get("timeout_ms")
         result = self._lom_adapter.execute_action(action=action, payload=payload, timeout_ms=timeout_ms)
 
-        duration_ms = round((time.perf_counter() - started) * 1000.0, 2)
+        duration_ms = (_now_ns() - started_ns) / 1_000_000
         if result.get("ok"):
-            return envelope_ok(
+            with self._state_lock:
+                self._last_gateway_success_mono = time.monotonic()
+                self._last_gateway_success_epoch = time.time()
+            return envelope_ok_fast(
                 message=str(result.get("message") or "ok"),
                 route_used=ROUTE_API,
                 duration_ms=duration_ms,
@@ -243,7 +413,7 @@ class BridgeServer:
             )
 
         code = str(result.get("error_code") or ERROR_INTERNAL)
-        return envelope_error(
+        return envelope_error_fast(
             error_code=code,
             message=str(result.get("message") or "execution failed"),
             route_used=ROUTE_API,
@@ -252,8 +422,8 @@ class BridgeServer:
             payload=result.get("payload") or {},
         )
 
-    def _health_check_response(self, correlation_id: str) -> Dict[str, Any]:
-        started = time.perf_counter()
+    def _health_check_response(self, request: Dict[str, Any], correlation_id: str) -> Dict[str, Any]:
+        started_ns = _now_ns()
         self._refresh_capabilities(force=False)
 
         capabilities = self._capabilities_snapshot()
@@ -265,58 +435,58 @@ class BridgeServer:
         ready = bool(payload["lom_adapter"].get("ready"))
 
         if not ready:
-            return envelope_error(
+            return envelope_error_fast(
                 error_code=ERROR_ABLETON_UNAVAILABLE,
                 message="bridge unavailable",
                 route_used=ROUTE_BRIDGE,
-                duration_ms=(time.perf_counter() - started) * 1000.0,
+                duration_ms=(_now_ns() - started_ns) / 1_000_000,
                 correlation_id=correlation_id,
                 payload=payload,
             )
 
         if not self._is_gateway_compatible():
-            return envelope_error(
+            return envelope_error_fast(
                 error_code=ERROR_GATEWAY_INCOMPATIBLE,
                 message="gateway is reachable but incompatible with strict chain-only contract",
                 route_used=ROUTE_BRIDGE,
-                duration_ms=(time.perf_counter() - started) * 1000.0,
+                duration_ms=(_now_ns() - started_ns) / 1_000_000,
                 correlation_id=correlation_id,
                 payload=payload,
             )
 
-        return envelope_ok(
+        return envelope_ok_fast(
             message="bridge healthy",
             route_used=ROUTE_BRIDGE,
-            duration_ms=(time.perf_counter() - started) * 1000.0,
+            duration_ms=(_now_ns() - started_ns) / 1_000_000,
             correlation_id=correlation_id,
             payload=payload,
         )
 
-    def _capabilities_response(self, correlation_id: str) -> Dict[str, Any]:
-        started = time.perf_counter()
+    def _capabilities_response(self, request: Dict[str, Any], correlation_id: str) -> Dict[str, Any]:
+        started_ns = _now_ns()
         self._refresh_capabilities(force=True)
         payload = self._capabilities_snapshot()
 
         if payload.get("compatible"):
-            return envelope_ok(
+            return envelope_ok_fast(
                 message="gateway compatible",
                 route_used=ROUTE_BRIDGE,
-                duration_ms=(time.perf_counter() - started) * 1000.0,
+                duration_ms=(_now_ns() - started_ns) / 1_000_000,
                 correlation_id=correlation_id,
                 payload=payload,
             )
 
-        return envelope_error(
+        return envelope_error_fast(
             error_code=ERROR_GATEWAY_INCOMPATIBLE,
             message=str(payload.get("message") or "gateway incompatible"),
             route_used=ROUTE_BRIDGE,
-            duration_ms=(time.perf_counter() - started) * 1000.0,
+            duration_ms=(_now_ns() - started_ns) / 1_000_000,
             correlation_id=correlation_id,
             payload=payload,
         )
 
-    def _connection_status_response(self, correlation_id: str) -> Dict[str, Any]:
-        started = time.perf_counter()
+    def _connection_status_response(self, request: Dict[str, Any], correlation_id: str) -> Dict[str, Any]:
+        started_ns = _now_ns()
         ready = self._gateway.ping()
         payload = {
             "state": self._state_snapshot(),
@@ -325,39 +495,39 @@ class BridgeServer:
         }
 
         if ready:
-            return envelope_ok(
+            return envelope_ok_fast(
                 message="ableton connection reachable",
                 route_used=ROUTE_BRIDGE,
-                duration_ms=(time.perf_counter() - started) * 1000.0,
+                duration_ms=(_now_ns() - started_ns) / 1_000_000,
                 correlation_id=correlation_id,
                 payload=payload,
             )
 
-        return envelope_error(
+        return envelope_error_fast(
             error_code=ERROR_ABLETON_UNAVAILABLE,
             message="unable to reach gateway",
             route_used=ROUTE_BRIDGE,
-            duration_ms=(time.perf_counter() - started) * 1000.0,
+            duration_ms=(_now_ns() - started_ns) / 1_000_000,
             correlation_id=correlation_id,
             payload=payload,
         )
 
-    def _live_version_response(self, correlation_id: str) -> Dict[str, Any]:
-        started = time.perf_counter()
+    def _live_version_response(self, request: Dict[str, Any], correlation_id: str) -> Dict[str, Any]:
+        started_ns = _now_ns()
         result = self._lom_adapter.live_version()
         if result.get("ok"):
-            return envelope_ok(
+            return envelope_ok_fast(
                 message=str(result.get("message") or "live version"),
                 route_used=ROUTE_BRIDGE,
-                duration_ms=(time.perf_counter() - started) * 1000.0,
+                duration_ms=(_now_ns() - started_ns) / 1_000_000,
                 correlation_id=correlation_id,
                 payload=result.get("payload") or {},
             )
-        return envelope_error(
+        return envelope_error_fast(
             error_code=str(result.get("error_code") or ERROR_INTERNAL),
             message=str(result.get("message") or "failed to query live version"),
             route_used=ROUTE_BRIDGE,
-            duration_ms=(time.perf_counter() - started) * 1000.0,
+            duration_ms=(_now_ns() - started_ns) / 1_000_000,
             correlation_id=correlation_id,
             payload=result.get("payload") or {},
         )
@@ -371,26 +541,40 @@ class BridgeServer:
             }
 
     def _is_gateway_compatible(self) -> bool:
-        caps = self._capabilities_snapshot()
-        if not self.flags.strict_gateway_compat:
-            return True
-        return bool(caps.get("compatible"))
+        return self._compatible_flag if self.flags.strict_gateway_compat else True
 
     def _capabilities_snapshot(self) -> Dict[str, Any]:
-        with self._compat_lock:
-            return dict(self._capabilities)
+        # _refresh_capabilities publishes a new dict by rebinding the attribute
+        # and never mutates a published one, so callers can share it as-is;
+        # treat it as read-only.
+        return self._capabilities
 
     def _refresh_capabilities(self, *, force: bool) -> None:
-        now = time.time()
-        with self._compat_lock:
-            last = float(self._capabilities.get("checked_at_epoch", 0.0) or 0.0)
-        if not force and (now - last) < 5.0:
+        checked_ns = self._capabilities_checked_ns
+        if not force and checked_ns is not None and _now_ns() - checked_ns < CAPABILITIES_TTL_NS:
+            return
+
+        # Single-flight: concurrent callers wait for the discovery already in
+        # progress and use its result instead of issuing their own round trips.
+        if not self._refresh_lock.acquire(blocking=False):
+            if self._refresh_lock.acquire(timeout=CAPABILITIES_REFRESH_WAIT_SEC):
+                self._refresh_lock.release()
             return
+        try:
+            # Another caller may have published between the check above and
+            # taking the lock; its result is as fresh as ours would be.
+            if self._capabilities_checked_ns != checked_ns:
+                return
+            self._publish_capabilities()
+        finally:
+            self._refresh_lock.release()
 
+    def _publish_capabilities(self) -> None:
         available_actions, discovery_method, discovery_error = self._discover_gateway_actions()
-        missing_actions = sorted(REQUIRED_GATEWAY_ACTIONS - available_actions)
-        health_found = bool(available_actions & GATEWAY_HEALTH_EQUIVALENTS)
-        compatible = (not missing_actions) and health_found
+        has_required = REQUIRED_GATEWAY_ACTIONS.issubset(available_actions)
+        missing_actions = [] if has_required else sorted(REQUIRED_GATEWAY_ACTIONS - available_actions)
+        health_found = not GATEWAY_HEALTH_EQUIVALENTS.isdisjoint(available_actions)
+        compatible = has_required and health_found
 
         if discovery_error:
             message = f"capability discovery failed: {discovery_error}"
@@ -400,20 +584,21 @@ class BridgeServer:
             message = "gateway missing required actions for strict chain-only contract"
 
         payload = {
-            "checked_at_epoch": now,
+            "checked_at_epoch": time.time(),
             "strict_mode": bool(self.flags.strict_gateway_compat),
             "compatible": bool(compatible),
             "message": message,
-            "required_actions": sorted(REQUIRED_GATEWAY_ACTIONS),
-            "health_equivalents": sorted(GATEWAY_HEALTH_EQUIVALENTS),
+            "required_actions": list(_REQUIRED_ACTIONS_SORTED),
+            "health_equivalents": list(_HEALTH_EQUIV_SORTED),
             "available_actions": sorted(available_actions),
             "missing_actions": missing_actions,
             "health_equivalent_found": health_found,
             "discovery_method": discovery_method,
         }
 
-        with self._compat_lock:
-            self._capabilities = payload
+        self._capabilities = payload
+        self._compatible_flag = bool(compatible)
+        self._capabilities_checked_ns = _now_ns()
 
     def _discover_gateway_actions(self) -> Tuple[Set[str], Optional[str], Optional[str]]:
         for method in ("get_available_tools", "list_tools"):
@@ -434,18 +619,22 @@ class BridgeServer:
         return set(), None, "no supported capability discovery action succeeded"
 
     def _extract_action_names(self, response: Dict[str, Any]) -> Set[str]:
-        candidates = [
-            response.get("available_actions"),
-            response.get("actions"),
-            response.get("tools"),
-            (response.get("payload") or {}).get("available_actions") if isinstance(response.get("payload"), dict) else None,
-            (response.get("payload") or {}).get("actions") if isinstance(response.get("payload"), dict) else None,
-            (response.get("payload") or {}).get("tools") if isinstance(response.get("payload"), dict) else None,
-        ]
-
-        for candidate in candidates:
+        payload = response.get("payload")
+        if not isinstance(payload, dict):
+            payload = {}
+
+        # Sources in priority order; stop at the first non-empty list.
+        for source, key in (
+            (response, "available_actions"),
+            (response, "actions"),
+            (response, "tools"),
+            (payload, "available_actions"),
+            (payload, "actions"),
+            (payload, "tools"),
+        ):
+            candidate = source.get(key)
             if isinstance(candidate, list):
-                names = {str(item).strip() for item in candidate if str(item).strip()}
+                names = {name for name in (str(item).strip() for item in candidate) if name}
                 if names:
                     return names
         return set()
@@ -9,6 +9,9 @@ DEFAULT_BRIDGE_SOCKET_PATH = "/tmp/ableton_chain_bridge.sock"
 DEFAULT_GATEWAY_HOST = "127.0.0.1"
 DEFAULT_GATEWAY_PORT = 8001
 
+# Route, error and health values are identifier-shaped literals, which CPython
+# interns at compile time; keep new ones that way so envelope fields and dict
+# keys built from them share one object without explicit sys.intern calls.
 ROUTE_API = "api"
 ROUTE_BRIDGE = "bridge"
 
@@ -26,6 +29,10 @@ HEALTH_READY = "ready"
 HEALTH_DEGRADED = "degraded"
 
 BRIDGE_HEARTBEAT_INTERVAL_SEC = 2.0
+BRIDGE_MONITOR_INTERVAL_SEC = 2.0
+BRIDGE_MONITOR_MIN_INTERVAL_SEC = 0.25
+BRIDGE_MONITOR_RECENT_SUCCESS_SEC = 0.5
+BRIDGE_READINESS_CACHE_SEC = 1.0
 BRIDGE_HEARTBEAT_MISSES_BEFORE_RESTART = 3
 BRIDGE_RESTART_BUDGET_COUNT = 5
 BRIDGE_RESTART_BUDGET_WINDOW_SEC = 300
@@ -44,8 +44,53 @@ def envelope_error(
     }
 
 
-def ensure_normalized_envelope(result: Any, *, fallback_route: str, correlation_id: str) -> Dict[str, Any]:
-    if isinstance(result, dict) and {
+def envelope_ok_fast(
+    *,
+    message: str,
+    route_used: str,
+    duration_ms: float,
+    correlation_id: str,
+    payload: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Same shape as `envelope_ok` for callers whose arguments are already typed.
+
+    Skips the `str()`/`float()` coercions; pass a str message and correlation id
+    and a float duration.
+    """
+    return {
+        "ok": True,
+        "error_code": None,
+        "message": message,
+        "route_used": route_used,
+        "duration_ms": duration_ms,
+        "correlation_id": correlation_id,
+        "payload": payload or {},
+    }
+
+
+def envelope_error_fast(
+    *,
+    error_code: str,
+    message: str,
+    route_used: str,
+    duration_ms: float,
+    correlation_id: str,
+    payload: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Same shape as `envelope_error` for callers whose arguments are already typed."""
+    return {
+        "ok": False,
+        "error_code": error_code,
+        "message": message,
+        "route_used": route_used,
+        "duration_ms": duration_ms,
+        "correlation_id": correlation_id,
+        "payload": payload or {},
+    }
+
+
+_ENVELOPE_KEYS = frozenset(
+    {
         "ok",
         "error_code",
         "message",
@@ -53,7 +98,31 @@ def ensure_normalized_envelope(result: Any, *, fallback_route: str, correlation_
         "duration_ms",
         "correlation_id",
         "payload",
-    }.issubset(result.keys()):
+    }
+)
+
+
+def _is_normalized_envelope(result: Dict[str, Any]) -> bool:
+    # Bridge replies are produced by envelope_ok/envelope_error and decoded
+    # fresh from the wire, so they usually already have exactly these keys and
+    # types; such a dict can be returned as-is instead of being rebuilt.
+    return (
+        len(result) == 7
+        and result.keys() == _ENVELOPE_KEYS
+        and isinstance(result["ok"], bool)
+        and isinstance(result["message"], str)
+        and isinstance(result["route_used"], str)
+        and isinstance(result["duration_ms"], float)
+        and isinstance(result["correlation_id"], str)
+        and isinstance(result["payload"], dict)
+    )
+
+
+def ensure_normalized_envelope(result: Any, *, fallback_route: str, correlation_id: str) -> Dict[str, Any]:
+    if isinstance(result, dict) and _is_normalized_envelope(result):
+        return result
+
+    if isinstance(result, dict) and _ENVELOPE_KEYS.issubset(result.keys()):
         return {
             "ok": bool(result["ok"]),
             "error_code": result.get("error_code"),
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
 
-from .logging_utils import env_flag
+from .logging_utils import parse_flag
+
+_FLAG_ENV_NAMES = ("FF_BRIDGE_ENABLED", "FF_ENABLE_SSE_TRANSPORT", "FF_STRICT_GATEWAY_COMPAT")
 
 
 @dataclass(frozen=True)
@@ -15,8 +20,16 @@ class FeatureFlags:
 
     @classmethod
     def from_env(cls) -> "FeatureFlags":
-        return cls(
-            bridge_enabled=env_flag("FF_BRIDGE_ENABLED", True),
-            enable_sse_transport=env_flag("FF_ENABLE_SSE_TRANSPORT", True),
-            strict_gateway_compat=env_flag("FF_STRICT_GATEWAY_COMPAT", True),
-        )
+        # Several components resolve flags at startup; parse each distinct
+        # environment once. Keying on the raw values keeps later env changes visible.
+        return _flags_for_env(tuple(os.getenv(name) for name in _FLAG_ENV_NAMES))
+
+
+@lru_cache(maxsize=4)
+def _flags_for_env(raw_values: Tuple[Optional[str], ...]) -> FeatureFlags:
+    bridge_enabled, enable_sse_transport, strict_gateway_compat = raw_values
+    return FeatureFlags(
+        bridge_enabled=parse_flag(bridge_enabled, True),
+        enable_sse_transport=parse_flag(enable_sse_transport, True),
+        strict_gateway_compat=parse_flag(strict_gateway_compat, True),
+    )
@@ -0,0 +1,49 @@
+"""JSON codec for the bridge wire protocol, using orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+try:  # Optional C codec (`pip install .[speed]`); the stdlib path is always available.
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause
+# covers both decoders.
+JSONDecodeError = json.JSONDecodeError
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=True).encode("ascii")
+
+
+if orjson is not None:
+    _APPEND_NEWLINE = orjson.OPT_APPEND_NEWLINE
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize to UTF-8 JSON bytes."""
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # Non-str keys, oversized ints and similar inputs the stdlib accepts.
+            return _stdlib_dumps(obj)
+
+    def dumps_line(obj: Any) -> bytes:
+        """Serialize one newline-terminated protocol frame."""
+        try:
+            # orjson writes the newline into the same buffer: one allocation,
+            # no concatenation copy.
+            return orjson.dumps(obj, option=_APPEND_NEWLINE)
+        except TypeError:
+            return _stdlib_dumps(obj) + b"\n"
+
+    loads: Callable[[Any], Any] = orjson.loads
+else:
+    dumps = _stdlib_dumps
+    loads = json.loads
+
+    def dumps_line(obj: Any) -> bytes:
+        """Serialize one newline-terminated protocol frame."""
+        return (json.dumps(obj, ensure_ascii=True) + "\n").encode("ascii")
@@ -0,0 +1,41 @@
+"""Kept-alive socket helpers shared by the newline-delimited JSON clients."""
+
+from __future__ import annotations
+
+import socket
+
+RECV_CHUNK_SIZE = 65536
+# The bridge and the gateway both drop connections idle for 30s; reconnect
+# before reusing one that has sat long enough to race that close.
+IDLE_REUSE_SEC = 20.0
+
+
+class StaleConnectionError(OSError):
+    """Kept-alive socket failed before the request reached the server."""
+
+
+def peer_closed(sock: socket.socket) -> bool:
+    """Return True if an idle socket was closed by the server or has stray bytes."""
+    try:
+        sock.settimeout(0.0)
+        sock.recv(1, socket.MSG_PEEK)
+    except BlockingIOError:
+        return False
+    except OSError:
+        return True
+    # Either EOF or bytes no request asked for; both make the socket unusable.
+    return True
+
+
+def send_line(sock: socket.socket, raw: bytes, timeout: float, reused: bool) -> None:
+    """Write one request line, raising StaleConnectionError if a reused socket is dead."""
+    sock.settimeout(timeout)
+    try:
+        sock.sendall(raw)
+    except (BrokenPipeError, ConnectionResetError) as exc:
+        # A failed sendall never wrote the trailing newline, so the server
+        # cannot have dispatched the request. Failures after this point are
+        # not retried: the action may already have run.
+        if reused:
+            raise StaleConnectionError(str(exc)) from exc
+        raise
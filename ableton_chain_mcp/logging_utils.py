@@ -2,18 +2,37 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import sys
-from datetime import datetime, timezone
-from typing import Any, Dict
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from .json_codec import dumps
 
 
 class JsonFormatter(logging.Formatter):
+    # Records arrive many per second, so the seconds part of the timestamp is
+    # formatted once per second and only the microseconds are added per record.
+    # The (second, prefix) pair is swapped as one tuple so threads sharing the
+    # formatter never pair a prefix with the wrong second.
+    _second_cache: Tuple[int, str] = (-1, "")
+
+    def _timestamp(self, created: float) -> str:
+        second = int(created)
+        micros = round((created - second) * 1_000_000)
+        if micros >= 1_000_000:
+            second += 1
+            micros -= 1_000_000
+        cached_second, prefix = self._second_cache
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second_cache = (second, prefix)
+        return f"{prefix}.{micros:06d}+00:00"
+
     def format(self, record: logging.LogRecord) -> str:
         payload: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname.lower(),
             "logger": record.name,
             "message": record.getMessage(),
@@ -23,7 +42,7 @@ class JsonFormatter(logging.Formatter):
         extra = getattr(record, "extra_fields", None)
         if isinstance(extra, dict):
             payload.update(extra)
-        return json.dumps(payload, ensure_ascii=True)
+        return dumps(payload).decode("utf-8")
 
 
 def configure_logging(level: str = "INFO") -> None:
@@ -35,8 +54,25 @@ def configure_logging(level: str = "INFO") -> None:
     logger.setLevel(getattr(logging, level.upper(), logging.INFO))
 
 
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
 def env_flag(name: str, default: bool) -> bool:
+    return parse_flag(os.getenv(name), default)
+
+
+def parse_flag(raw: Optional[str], default: bool) -> bool:
+    if raw is None:
+        return default
+    return raw.strip().lower() in _TRUTHY
+
+
+def env_float(name: str, default: float, minimum: float = 0.0) -> float:
     raw = os.getenv(name)
     if raw is None:
         return default
-    return raw.strip().lower() in {"1", "true", "yes", "on"}
+    try:
+        value = float(raw.strip())
+    except ValueError:
+        return default
+    return max(minimum, value)
@@ -2,44 +2,140 @@
 
 from __future__ import annotations
 
-import json
+import itertools
+import os
 import socket
 import threading
+import time
 from typing import Any, Dict, Optional
 
+from ..json_codec import JSONDecodeError, dumps_line, loads
+from ..line_socket import IDLE_REUSE_SEC, RECV_CHUNK_SIZE, StaleConnectionError, peer_closed, send_line
+
+MAX_SHARDS = 8
+
 
 class BridgeClientError(RuntimeError):
     """Bridge RPC error."""
 
 
+class _BridgeConnection:
+    """One kept-alive bridge socket plus its line buffer."""
+
+    __slots__ = ("sock", "view", "pending", "last_used")
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.view = memoryview(bytearray(RECV_CHUNK_SIZE))
+        # Bytes received past the last newline, carried into the next read.
+        self.pending = bytearray()
+        self.last_used = time.monotonic()
+
+    def close(self) -> None:
+        try:
+            self.sock.close()
+        except Exception:
+            pass
+
+    def reusable(self) -> bool:
+        """Return True if nothing but this connection's next reply can arrive on it."""
+        # Leftover bytes past the last reply were never asked for; reading on
+        # would hand them to the next request as its reply.
+        if self.pending:
+            return False
+        return time.monotonic() - self.last_used < IDLE_REUSE_SEC and not peer_closed(self.sock)
+
+    def recv_line(self) -> bytes:
+        pending = self.pending
+        scan_from = 0
+        while True:
+            newline = pending.find(b"\n", scan_from)
+            if newline >= 0:
+                line = bytes(pending[:newline])
+                del pending[: newline + 1]
+                return line
+            scan_from = len(pending)
+            count = self.sock.recv_into(self.view)
+            if not count:
+                # The bridge closed the stream; whatever arrived is the reply.
+                self.close()
+                if pending:
+                    line = bytes(pending)
+                    pending.clear()
+                    return line
+                raise BridgeClientError("bridge returned empty response")
+            pending += self.view[:count]
+
+
+class _Shard:
+    """A lock guarding one kept-alive bridge connection."""
+
+    __slots__ = ("lock", "conn")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.conn: Optional[_BridgeConnection] = None
+
+    def drop(self) -> None:
+        conn, self.conn = self.conn, None
+        if conn is not None:
+            conn.close()
+
+
 class BridgeClient:
-    def __init__(self, socket_path: str, default_timeout_sec: float = 5.0) -> None:
+    """Newline-delimited JSON client over sharded kept-alive bridge connections.
+
+    Each calling thread is pinned round-robin to one of `shards` lock +
+    connection pairs, so concurrent MCP workers run in parallel instead of
+    queueing on one lock. Within a shard, traffic stays strictly
+    request/response. A connection is opened lazily, reused across requests
+    and dropped on any error, timeout or malformed reply.
+    """
+
+    def __init__(self, socket_path: str, default_timeout_sec: float = 5.0, shards: Optional[int] = None) -> None:
         self.socket_path = socket_path
         self.default_timeout_sec = default_timeout_sec
-        self._lock = threading.Lock()
+        count = shards if shards is not None else min(os.cpu_count() or 1, MAX_SHARDS)
+        self._shards = tuple(_Shard() for _ in range(max(1, int(count))))
+        self._thread_shard = threading.local()
+        self._next_shard = itertools.count()
 
     def request(self, payload: Dict[str, Any], timeout_sec: Optional[float] = None) -> Dict[str, Any]:
         timeout = float(timeout_sec if timeout_sec is not None else self.default_timeout_sec)
-        raw = json.dumps(payload, ensure_ascii=True) + "\n"
-        with self._lock:
+        raw = dumps_line(payload)
+        shard = self._shard_for_thread()
+        with shard.lock:
             try:
-                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-                sock.settimeout(timeout)
-                sock.connect(self.socket_path)
-                sock.sendall(raw.encode("utf-8"))
-                response = _recv_line(sock)
-                return json.loads(response)
+                conn = shard.conn
+                if conn is not None and conn.reusable():
+                    try:
+                        response = self._exchange(conn, raw, timeout, reused=True)
+                    except StaleConnectionError:
+                        # Only raised before the request was fully written, so
+                        # the bridge never saw it and resending is safe.
+                        conn = self._connect(shard, timeout)
+                        response = self._exchange(conn, raw, timeout, reused=False)
+                else:
+                    conn = self._connect(shard, timeout)
+                    response = self._exchange(conn, raw, timeout, reused=False)
+                decoded = loads(response)
+                if conn.sock.fileno() < 0:
+                    shard.drop()
+                else:
+                    conn.last_used = time.monotonic()
+                return decoded
             except socket.timeout as exc:
+                shard.drop()
                 raise BridgeClientError(f"bridge timeout after {timeout:.2f}s") from exc
+            except BridgeClientError:
+                shard.drop()
+                raise
             except OSError as exc:
+                shard.drop()
                 raise BridgeClientError(f"bridge io error: {exc}") from exc
-            except json.JSONDecodeError as exc:
+            except JSONDecodeError as exc:
+                shard.drop()
                 raise BridgeClientError(f"bridge invalid json response: {exc}") from exc
-            finally:
-                try:
-                    sock.close()
-                except Exception:
-                    pass
 
     def ping(self) -> bool:
         try:
@@ -48,19 +144,32 @@ class BridgeClient:
         except BridgeClientError:
             return False
 
+    def close(self) -> None:
+        for shard in self._shards:
+            with shard.lock:
+                shard.drop()
+
+    def _shard_for_thread(self) -> _Shard:
+        # Thread idents are aligned addresses, so `get_ident() % n` would pile
+        # every thread onto one shard; hand them out round-robin instead.
+        shard = getattr(self._thread_shard, "shard", None)
+        if shard is None:
+            shard = self._shards[next(self._next_shard) % len(self._shards)]
+            self._thread_shard.shard = shard
+        return shard
+
+    def _connect(self, shard: _Shard, timeout: float) -> _BridgeConnection:
+        shard.drop()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(timeout)
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        shard.conn = _BridgeConnection(sock)
+        return shard.conn
 
-def _recv_line(sock: socket.socket) -> str:
-    chunks = []
-    while True:
-        chunk = sock.recv(4096)
-        if not chunk:
-            break
-        chunks.append(chunk)
-        if b"\n" in chunk:
-            break
-    if not chunks:
-        raise BridgeClientError("bridge returned empty response")
-    payload = b"".join(chunks)
-    if b"\n" in payload:
-        payload = payload.split(b"\n", 1)[0]
-    return payload.decode("utf-8")
+    def _exchange(self, conn: _BridgeConnection, raw: bytes, timeout: float, reused: bool) -> bytes:
+        send_line(conn.sock, raw, timeout, reused)
+        return conn.recv_line()
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import logging
+import sys
 import time
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from ..constants import (
+    BRIDGE_READINESS_CACHE_SEC,
     ERROR_ABLETON_UNAVAILABLE,
     ERROR_BRIDGE_UNAVAILABLE,
     ERROR_GATEWAY_INCOMPATIBLE,
@@ -23,6 +25,10 @@ from ..schema_loader import ActionSchema
 from .bridge_client import BridgeClient, BridgeClientError
 from .supervisor import BridgeSupervisor
 
+_now_ns = time.monotonic_ns
+
+METRIC_KEY_CACHE_SIZE = 256
+
 
 class ExecutionOrchestrator:
     def __init__(
@@ -42,13 +48,20 @@ class ExecutionOrchestrator:
         self.traces = traces
         self.flags = feature_flags or FeatureFlags.from_env()
         self.logger = logging.getLogger("ableton_chain_mcp.orchestrator")
+        # (monotonic expiry, supervisor pid) of the last successful readiness probe.
+        self._readiness_cache: Tuple[float, Optional[int]] = (0.0, None)
+        self._metric_keys: Dict[Tuple[str, str, bool], Tuple[str, str]] = {}
 
     def execute_action(self, *, action_name: str, arguments: Dict[str, Any], correlation_id: str) -> Dict[str, Any]:
-        start = time.perf_counter() * 1000.0
+        start_ns = _now_ns()
         route = ROUTE_API
-        payload = dict(arguments)
         try:
-            dry_run = bool(payload.pop("dry_run", False))
+            # `arguments` is only read; a copy is made solely to drop dry_run.
+            payload = arguments
+            dry_run = False
+            if isinstance(arguments, dict) and "dry_run" in arguments:
+                payload = dict(arguments)
+                dry_run = bool(payload.pop("dry_run"))
 
             with SpanTimer(self.traces, correlation_id, "schema_validate", action=action_name):
                 self.schema.validate(action_name, payload, strict=True)
@@ -63,7 +76,7 @@ class ExecutionOrchestrator:
                     "error_code": None,
                     "message": "dry_run validation passed",
                     "route_used": route,
-                    "duration_ms": (time.perf_counter() * 1000.0 - start),
+                    "duration_ms": (_now_ns() - start_ns) / 1_000_000,
                     "correlation_id": correlation_id,
                     "payload": {
                         "action": action_name,
@@ -77,7 +90,7 @@ class ExecutionOrchestrator:
                     error_code=ERROR_ABLETON_UNAVAILABLE,
                     message="bridge disabled by FF_BRIDGE_ENABLED",
                     route_used=route,
-                    duration_ms=(time.perf_counter() * 1000.0 - start),
+                    duration_ms=(_now_ns() - start_ns) / 1_000_000,
                     correlation_id=correlation_id,
                     payload={},
                 )
@@ -100,6 +113,8 @@ class ExecutionOrchestrator:
                 )
 
             result = ensure_normalized_envelope(response, fallback_route=route, correlation_id=correlation_id)
+            if not result.get("ok"):
+                self._readiness_cache = (0.0, None)
             self._record_metrics(
                 action=f"action.{action_name}",
                 route=route,
@@ -112,18 +127,19 @@ class ExecutionOrchestrator:
                 error_code=ERROR_INVALID_ACTION_PAYLOAD,
                 message=str(exc),
                 route_used=route,
-                duration_ms=(time.perf_counter() * 1000.0 - start),
+                duration_ms=(_now_ns() - start_ns) / 1_000_000,
                 correlation_id=correlation_id,
                 payload={},
             )
             self._record_metrics(action=f"action.{action_name}", route=route, ok=False, duration_ms=float(result["duration_ms"]))
             return result
         except BridgeClientError as exc:
+            self._readiness_cache = (0.0, None)
             result = envelope_error(
                 error_code=ERROR_BRIDGE_UNAVAILABLE,
                 message=str(exc),
                 route_used=route,
-                duration_ms=(time.perf_counter() * 1000.0 - start),
+                duration_ms=(_now_ns() - start_ns) / 1_000_000,
                 correlation_id=correlation_id,
                 payload={},
             )
@@ -135,7 +151,7 @@ class ExecutionOrchestrator:
                 error_code=ERROR_INTERNAL,
                 message=str(exc),
                 route_used=route,
-                duration_ms=(time.perf_counter() * 1000.0 - start),
+                duration_ms=(_now_ns() - start_ns) / 1_000_000,
                 correlation_id=correlation_id,
                 payload={},
             )
@@ -143,13 +159,13 @@ class ExecutionOrchestrator:
             return result
 
     def execute_bridge_request(self, *, request_type: str, correlation_id: str) -> Dict[str, Any]:
-        start = time.perf_counter() * 1000.0
+        start_ns = _now_ns()
         if not self.flags.bridge_enabled:
             return envelope_error(
                 error_code=ERROR_ABLETON_UNAVAILABLE,
                 message="bridge disabled by FF_BRIDGE_ENABLED",
                 route_used=ROUTE_BRIDGE,
-                duration_ms=(time.perf_counter() * 1000.0 - start),
+                duration_ms=(_now_ns() - start_ns) / 1_000_000,
                 correlation_id=correlation_id,
                 payload={},
             )
@@ -168,7 +184,7 @@ class ExecutionOrchestrator:
                 error_code=ERROR_BRIDGE_UNAVAILABLE,
                 message=str(exc),
                 route_used=ROUTE_BRIDGE,
-                duration_ms=(time.perf_counter() * 1000.0 - start),
+                duration_ms=(_now_ns() - start_ns) / 1_000_000,
                 correlation_id=correlation_id,
                 payload={},
             )
@@ -187,8 +203,15 @@ class ExecutionOrchestrator:
                 payload={"supervisor": status.__dict__},
             )
 
+        # A recent successful probe of the same bridge process stands in for a
+        # fresh health_check; failures and a restarted bridge force a re-probe.
+        ready_until, ready_pid = self._readiness_cache
+        if ready_pid is not None and ready_pid == status.pid and time.monotonic() < ready_until:
+            return None
+
         health = self.execute_bridge_request(request_type="health_check", correlation_id=correlation_id)
         if not health.get("ok"):
+            self._readiness_cache = (0.0, None)
             code = str(health.get("error_code") or ERROR_ABLETON_UNAVAILABLE)
             if code not in {ERROR_ABLETON_UNAVAILABLE, ERROR_GATEWAY_INCOMPATIBLE}:
                 code = ERROR_ABLETON_UNAVAILABLE
@@ -200,9 +223,21 @@ class ExecutionOrchestrator:
                 correlation_id=correlation_id,
                 payload={"health": health.get("payload", {})},
             )
+        self._readiness_cache = (time.monotonic() + BRIDGE_READINESS_CACHE_SEC, status.pid)
         return None
 
     def _record_metrics(self, *, action: str, route: str, ok: bool, duration_ms: float) -> None:
-        status = "ok" if ok else "error"
-        self.metrics.inc(f"tool_calls_total|tool={action}|route={route}|result={status}", 1)
-        self.metrics.inc(f"tool_duration_ms|tool={action}|route={route}", float(duration_ms))
+        cache_key = (action, route, bool(ok))
+        keys = self._metric_keys.get(cache_key)
+        if keys is None:
+            status = "ok" if ok else "error"
+            keys = (
+                sys.intern(f"tool_calls_total|tool={action}|route={route}|result={status}"),
+                sys.intern(f"tool_duration_ms|tool={action}|route={route}"),
+            )
+            # Unknown action names come from callers; stop caching past a sane size.
+            if len(self._metric_keys) < METRIC_KEY_CACHE_SIZE:
+                self._metric_keys[cache_key] = keys
+        calls_key, duration_key = keys
+        self.metrics.inc(calls_key, 1)
+        self.metrics.inc(duration_key, float(duration_ms))
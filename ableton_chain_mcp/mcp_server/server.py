@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 import time
 import uuid
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from ..constants import (
     DEFAULT_BRIDGE_SOCKET_PATH,
@@ -56,6 +56,15 @@ class MCPServer:
             feature_flags=self.flags,
         )
         self.tools = ToolRegistry(self.orchestrator)
+        self._rpc_handlers: Dict[str, Callable[[Any, Dict[str, Any]], Dict[str, Any]]] = {
+            "initialize": self._rpc_initialize,
+            "tools/list": self._rpc_tools_list,
+            "tools/call": self._rpc_tools_call,
+            "ping": self._rpc_ping,
+            "metrics/get": self._rpc_metrics_get,
+            "traces/get": self._rpc_traces_get,
+            "server/status": self._rpc_server_status,
+        }
 
     def start(self) -> None:
         if self.flags.bridge_enabled:
@@ -65,85 +74,104 @@ class MCPServer:
         if self.flags.bridge_enabled:
             self.supervisor.stop()
 
-    def handle_jsonrpc(self, request: Dict[str, Any]) -> Dict[str, Any]:
+    def handle_jsonrpc(self, request: Any) -> Any:
+        """Handle one JSON-RPC request object or a JSON-RPC 2.0 batch array.
+
+        Batch entries run in order: tool calls in one batch usually depend on
+        each other (build a chain, then set its parameters) and the gateway
+        applies them serially on Live's main thread anyway.
+        """
+        if isinstance(request, list):
+            if not request:
+                return self._error(None, -32600, "Invalid Request: empty batch")
+            return [self._handle_one(entry) for entry in request]
+        return self._handle_one(request)
+
+    def _handle_one(self, request: Any) -> Dict[str, Any]:
+        if not isinstance(request, dict):
+            return self._error(None, -32600, "Invalid Request: expected an object")
+
         rid = request.get("id")
         method = str(request.get("method") or "")
         params = request.get("params") or {}
 
+        handler = self._rpc_handlers.get(method)
+        if handler is None:
+            return self._error(rid, -32601, f"Method not found: {method}")
         try:
-            if method == "initialize":
-                return self._response(
-                    rid,
-                    {
-                        "protocolVersion": "2025-02-01",
-                        "serverInfo": {
-                            "name": "ableton-chain-mcp-server",
-                            "version": "1.0.0",
-                        },
-                        "capabilities": {
-                            "tools": {"listChanged": False},
-                            "experimental": {
-                                "transports": ["stdio", "sse"],
-                                "bridgeSocket": self.bridge_client.socket_path,
-                                "featureFlags": self.flags.__dict__,
-                            },
-                        },
-                    },
-                )
-
-            if method == "tools/list":
-                return self._response(rid, {"tools": self.tools.list_tools()})
-
-            if method == "tools/call":
-                tool_name = str(params.get("name") or "")
-                tool_args = params.get("arguments") or {}
-                correlation_id = str(params.get("correlation_id") or uuid.uuid4())
-
-                with_span_start = time.perf_counter() * 1000.0
-                result = self.tools.call_tool(name=tool_name, arguments=tool_args, correlation_id=correlation_id)
-                with_span_end = time.perf_counter() * 1000.0
-                self.traces.add_span(
-                    correlation_id=correlation_id,
-                    name="mcp_request",
-                    start_ms=with_span_start,
-                    end_ms=with_span_end,
-                    attrs={"tool": tool_name, "ok": bool(result.get("ok"))},
-                )
-                self.events.publish(
-                    {
-                        "event": "tool_call",
-                        "correlation_id": correlation_id,
-                        "tool": tool_name,
-                        "ok": bool(result.get("ok")),
-                    }
-                )
-
-                return self._response(
-                    rid,
-                    {
-                        "content": [{"type": "json", "json": result}],
-                        "isError": not bool(result.get("ok")),
+            return handler(rid, params)
+        except Exception as exc:
+            self.logger.exception("jsonrpc handler failed")
+            return self._error(rid, -32000, str(exc))
+
+    def _rpc_initialize(self, rid: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._response(
+            rid,
+            {
+                "protocolVersion": "2025-02-01",
+                "serverInfo": {
+                    "name": "ableton-chain-mcp-server",
+                    "version": "1.0.0",
+                },
+                "capabilities": {
+                    "tools": {"listChanged": False},
+                    "experimental": {
+                        "transports": ["stdio", "sse"],
+                        "bridgeSocket": self.bridge_client.socket_path,
+                        "featureFlags": self.flags.__dict__,
                     },
-                )
+                },
+            },
+        )
 
-            if method == "ping":
-                return self._response(rid, {"ok": True})
+    def _rpc_tools_list(self, rid: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._response(rid, {"tools": self.tools.list_tools()})
+
+    def _rpc_tools_call(self, rid: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+        tool_name = str(params.get("name") or "")
+        tool_args = params.get("arguments") or {}
+        correlation_id = str(params.get("correlation_id") or uuid.uuid4())
+
+        span_start_ns = time.monotonic_ns()
+        result = self.tools.call_tool(name=tool_name, arguments=tool_args, correlation_id=correlation_id)
+        span_end_ns = time.monotonic_ns()
+        self.traces.add_span(
+            correlation_id=correlation_id,
+            name="mcp_request",
+            start_ms=span_start_ns / 1_000_000,
+            end_ms=span_end_ns / 1_000_000,
+            attrs={"tool": tool_name, "ok": bool(result.get("ok"))},
+        )
+        self.events.publish(
+            {
+                "event": "tool_call",
+                "correlation_id": correlation_id,
+                "tool": tool_name,
+                "ok": bool(result.get("ok")),
+            }
+        )
+
+        return self._response(
+            rid,
+            {
+                "content": [{"type": "json", "json": result}],
+                "isError": not bool(result.get("ok")),
+            },
+        )
 
-            if method == "metrics/get":
-                return self._response(rid, {"metrics": self.metrics.snapshot()})
+    def _rpc_ping(self, rid: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._response(rid, {"ok": True})
 
-            if method == "traces/get":
-                correlation_id = str(params.get("correlation_id") or "")
-                return self._response(rid, {"spans": self.traces.list_by_correlation(correlation_id)})
+    def _rpc_metrics_get(self, rid: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._response(rid, {"metrics": self.metrics.snapshot()})
 
-            if method == "server/status":
-                status = self.supervisor.status()
-                return self._response(rid, {"supervisor": status.__dict__, "featureFlags": self.flags.__dict__})
+    def _rpc_traces_get(self, rid: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+        correlation_id = str(params.get("correlation_id") or "")
+        return self._response(rid, {"spans": self.traces.list_by_correlation(correlation_id)})
 
-            return self._error(rid, -32601, f"Method not found: {method}")
-        except Exception as exc:
-            self.logger.exception("jsonrpc handler failed")
-            return self._error(rid, -32000, str(exc))
+    def _rpc_server_status(self, rid: Any, params: Dict[str, Any]) -> Dict[str, Any]:
+        status = self.supervisor.status()
+        return self._response(rid, {"supervisor": status.__dict__, "featureFlags": self.flags.__dict__})
 
     def _response(self, rid: Any, result: Dict[str, Any]) -> Dict[str, Any]:
         return {"jsonrpc": "2.0", "id": rid, "result": result}
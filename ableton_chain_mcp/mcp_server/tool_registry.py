@@ -28,7 +28,7 @@ class ToolRegistry:
         arguments: Dict[str, Any] | None,
         correlation_id: str | None = None,
     ) -> Dict[str, Any]:
-        payload = dict(arguments or {})
+        payload = arguments or {}
         cid = correlation_id or str(uuid.uuid4())
 
         if name.startswith("action."):
@@ -19,7 +19,7 @@ def run_stdio(server: MCPServer) -> int:
             try:
                 request = json.loads(line)
             except json.JSONDecodeError as exc:
-                response: dict[str, Any] = {
+                response: Any = {
                     "jsonrpc": "2.0",
                     "id": None,
                     "error": {"code": -32700, "message": f"Parse error: {exc}"},
@@ -5,29 +5,67 @@ from __future__ import annotations
 import queue
 import threading
 import time
-from collections import defaultdict
-from typing import Any, Dict, List
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, List, Tuple
 
 
 class MetricsStore:
+    """Counters sharded per thread.
+
+    Each thread adds into its own dict, so `inc` never takes a lock; `snapshot`
+    sums the shards. Shards of finished threads are folded into `_retired` so
+    thread-per-request servers do not accumulate them.
+    """
+
     def __init__(self) -> None:
         self._lock = threading.Lock()
-        self._counters: Dict[str, float] = defaultdict(float)
+        self._local = threading.local()
+        self._shards: List[Tuple[threading.Thread, Dict[str, float]]] = []
+        self._retired: Dict[str, float] = defaultdict(float)
 
     def inc(self, name: str, value: float = 1.0) -> None:
-        with self._lock:
-            self._counters[name] += float(value)
+        counters = getattr(self._local, "counters", None)
+        if counters is None:
+            counters = self._register_shard()
+        counters[name] = counters.get(name, 0.0) + float(value)
 
     def snapshot(self) -> Dict[str, float]:
         with self._lock:
-            return dict(self._counters)
+            self._fold_finished_shards()
+            totals = defaultdict(float, self._retired)
+            shards = [counters for _, counters in self._shards]
+        for counters in shards:
+            # dict() copies in one step, so a concurrent inc() cannot resize it mid-iteration.
+            for name, value in dict(counters).items():
+                totals[name] += value
+        return dict(totals)
+
+    def _register_shard(self) -> Dict[str, float]:
+        counters: Dict[str, float] = {}
+        with self._lock:
+            self._fold_finished_shards()
+            self._shards.append((threading.current_thread(), counters))
+        self._local.counters = counters
+        return counters
+
+    def _fold_finished_shards(self) -> None:
+        live = []
+        for thread, counters in self._shards:
+            if thread.is_alive():
+                live.append((thread, counters))
+                continue
+            for name, value in counters.items():
+                self._retired[name] += value
+        self._shards = live
 
 
 class TraceStore:
     def __init__(self, max_traces: int = 2000) -> None:
         self._max_traces = max_traces
         self._lock = threading.Lock()
-        self._spans: List[Dict[str, Any]] = []
+        self._spans: Deque[Dict[str, Any]] = deque(maxlen=max_traces)
+        # Spans per correlation id in arrival order, kept in step with evictions.
+        self._by_correlation: Dict[str, Deque[Dict[str, Any]]] = {}
 
     def add_span(self, *, correlation_id: str, name: str, start_ms: float, end_ms: float, attrs: Dict[str, Any]) -> None:
         span = {
@@ -39,13 +77,26 @@ class TraceStore:
             "attrs": dict(attrs),
         }
         with self._lock:
-            self._spans.append(span)
-            if len(self._spans) > self._max_traces:
-                self._spans = self._spans[-self._max_traces :]
+            spans = self._spans
+            if spans and len(spans) == self._max_traces:
+                self._unindex(spans[0])
+            spans.append(span)
+            indexed = self._by_correlation.get(correlation_id)
+            if indexed is None:
+                indexed = self._by_correlation[correlation_id] = deque()
+            indexed.append(span)
 
     def list_by_correlation(self, correlation_id: str) -> List[Dict[str, Any]]:
         with self._lock:
-            return [s for s in self._spans if s["correlation_id"] == correlation_id]
+            return list(self._by_correlation.get(correlation_id, ()))
+
+    def _unindex(self, span: Dict[str, Any]) -> None:
+        # Evictions are oldest-first, so the evicted span heads its id's deque.
+        correlation_id = span["correlation_id"]
+        indexed = self._by_correlation[correlation_id]
+        indexed.popleft()
+        if not indexed:
+            del self._by_correlation[correlation_id]
 
 
 class SpanTimer:
@@ -54,51 +105,53 @@ class SpanTimer:
         self._correlation_id = correlation_id
         self._name = name
         self._attrs = attrs
-        self._start = 0.0
+        self._start_ns = 0
 
     def __enter__(self) -> "SpanTimer":
-        self._start = time.perf_counter() * 1000.0
+        self._start_ns = time.monotonic_ns()
         return self
 
     def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
-        end = time.perf_counter() * 1000.0
+        end_ns = time.monotonic_ns()
         attrs = dict(self._attrs)
         if exc is not None:
             attrs["exception"] = str(exc)
         self._store.add_span(
             correlation_id=self._correlation_id,
             name=self._name,
-            start_ms=self._start,
-            end_ms=end,
+            start_ms=self._start_ns / 1_000_000,
+            end_ms=end_ns / 1_000_000,
             attrs=attrs,
         )
 
 
 class EventStream:
-    """Best-effort pub/sub queue for SSE clients."""
+    """Best-effort pub/sub queue for SSE clients.
+
+    Every subscriber receives the same event dict; treat it as read-only.
+    """
 
     def __init__(self, maxsize: int = 200) -> None:
         self._lock = threading.Lock()
-        self._subs: List[queue.Queue[Dict[str, Any]]] = []
+        self._subs: Dict[int, queue.Queue[Dict[str, Any]]] = {}
         self._maxsize = maxsize
 
     def subscribe(self) -> queue.Queue[Dict[str, Any]]:
         q: queue.Queue[Dict[str, Any]] = queue.Queue(maxsize=self._maxsize)
         with self._lock:
-            self._subs.append(q)
+            self._subs[id(q)] = q
         return q
 
     def unsubscribe(self, q: queue.Queue[Dict[str, Any]]) -> None:
         with self._lock:
-            if q in self._subs:
-                self._subs.remove(q)
+            self._subs.pop(id(q), None)
 
     def publish(self, event: Dict[str, Any]) -> None:
         with self._lock:
-            subscribers = list(self._subs)
+            subscribers = list(self._subs.values())
         for q in subscribers:
             try:
-                q.put_nowait(dict(event))
+                q.put_nowait(event)
             except queue.Full:
                 # Drop oldest event to keep stream alive under backpressure.
                 try:
@@ -106,6 +159,6 @@ class EventStream:
                 except queue.Empty:
                     pass
                 try:
-                    q.put_nowait(dict(event))
+                    q.put_nowait(event)
                 except queue.Full:
                     pass
@@ -5,7 +5,10 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+PayloadValidator = Callable[[Dict[str, Any]], None]
+ValueValidator = Callable[[str, Any], None]
 
 
 @dataclass
@@ -46,6 +49,7 @@ class ActionSpec:
 class ActionSchema:
     def __init__(self, actions: Dict[str, ActionSpec]) -> None:
         self._actions = dict(actions)
+        self._validators: Dict[Tuple[str, bool], PayloadValidator] = {}
 
     @classmethod
     def from_file(cls, path: Path) -> "ActionSchema":
@@ -83,24 +87,23 @@ class ActionSchema:
     def validate(self, action_name: str, payload: Dict[str, Any], *, strict: bool = True) -> None:
         if not isinstance(payload, dict):
             raise ValueError(f"Action '{action_name}' payload must be an object")
-
-        spec = self._actions.get(action_name)
-        if spec is None:
-            raise ValueError(f"Action '{action_name}' not defined")
-
-        for field in spec.required:
-            if field not in payload:
-                raise ValueError(f"Action '{action_name}' missing required field '{field}'")
-
-        for key, value in payload.items():
-            pspec = spec.properties.get(key)
-            if pspec is None:
-                if strict:
-                    raise ValueError(f"Action '{action_name}' includes unknown field '{key}'")
-                continue
-            _validate_value(key, value, pspec)
-
-        _validate_constraints_for_payload(f"Action '{spec.name}'", spec.constraints, payload)
+        self.compile(action_name, strict=strict)(payload)
+
+    def compile(self, action_name: str, *, strict: bool = True) -> PayloadValidator:
+        """Return a payload validator for one action, built once and cached.
+
+        The property tree is walked at compile time so each call only runs the
+        checks themselves; errors match `validate`.
+        """
+        key = (action_name, strict)
+        validator = self._validators.get(key)
+        if validator is None:
+            spec = self._actions.get(action_name)
+            if spec is None:
+                raise ValueError(f"Action '{action_name}' not defined")
+            validator = _compile_action(spec, strict)
+            self._validators[key] = validator
+        return validator
 
     def to_json(self) -> Dict[str, Any]:
         return {
@@ -201,47 +204,91 @@ def _validate_constraints_for_payload(context: str, constraints: ConstraintSpec
             raise ValueError(f"{context} failed forbid_together: fields cannot co-exist {group}")
 
 
-def _validate_value(field: str, value: Any, spec: PropertySpec) -> None:
-    type_checks = {
-        "string": lambda v: isinstance(v, str),
-        "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
-        "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
-        "boolean": lambda v: isinstance(v, bool),
-        "array": lambda v: isinstance(v, list),
-        "object": lambda v: isinstance(v, dict),
-    }
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda v: isinstance(v, str),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "array": lambda v: isinstance(v, list),
+    "object": lambda v: isinstance(v, dict),
+}
+
+
+def _compile_action(spec: ActionSpec, strict: bool) -> PayloadValidator:
+    action_name = spec.name
+    required = spec.required
+    properties = {key: _compile_value(pspec) for key, pspec in spec.properties.items()}
+    constraints = spec.constraints
+    context = f"Action '{action_name}'"
+
+    def validate(payload: Dict[str, Any]) -> None:
+        if not isinstance(payload, dict):
+            raise ValueError(f"Action '{action_name}' payload must be an object")
+
+        for field in required:
+            if field not in payload:
+                raise ValueError(f"Action '{action_name}' missing required field '{field}'")
+
+        for key, value in payload.items():
+            check = properties.get(key)
+            if check is None:
+                if strict:
+                    raise ValueError(f"Action '{action_name}' includes unknown field '{key}'")
+                continue
+            check(key, value)
+
+        _validate_constraints_for_payload(context, constraints, payload)
+
+    return validate
+
+
+def _compile_value(spec: PropertySpec) -> ValueValidator:
+    type_name = spec.type
+    checker = _TYPE_CHECKS.get(type_name)
+    enum_values = spec.enum
+    bounded = type_name in {"number", "integer"} and (spec.min is not None or spec.max is not None)
+    minimum = spec.min
+    maximum = spec.max
+    items = _compile_value(spec.items) if type_name == "array" and spec.items is not None else None
+    children: Optional[Dict[str, ValueValidator]] = None
+    if type_name == "object" and spec.properties is not None:
+        children = {name: _compile_value(child) for name, child in spec.properties.items()}
+    required = spec.required or []
+    constraints = spec.constraints
+
+    def validate(field: str, value: Any) -> None:
+        if checker and not checker(value):
+            raise ValueError(f"Field '{field}' expected {type_name}, got {type(value).__name__}")
 
-    checker = type_checks.get(spec.type)
-    if checker and not checker(value):
-        raise ValueError(f"Field '{field}' expected {spec.type}, got {type(value).__name__}")
+        if enum_values is not None and value not in enum_values:
+            raise ValueError(f"Field '{field}' must be one of {enum_values}")
 
-    if spec.enum is not None and value not in spec.enum:
-        raise ValueError(f"Field '{field}' must be one of {spec.enum}")
+        if bounded:
+            if minimum is not None and value < minimum:
+                raise ValueError(f"Field '{field}' below minimum {minimum}")
+            if maximum is not None and value > maximum:
+                raise ValueError(f"Field '{field}' above maximum {maximum}")
 
-    if spec.type in {"number", "integer"}:
-        if spec.min is not None and value < spec.min:
-            raise ValueError(f"Field '{field}' below minimum {spec.min}")
-        if spec.max is not None and value > spec.max:
-            raise ValueError(f"Field '{field}' above maximum {spec.max}")
+        if items is not None:
+            for i, item in enumerate(value):
+                items(f"{field}[{i}]", item)
 
-    if spec.type == "array" and spec.items is not None:
-        for i, item in enumerate(value):
-            _validate_value(f"{field}[{i}]", item, spec.items)
+        if children is not None:
+            for req in required:
+                if req not in value:
+                    raise ValueError(f"Field '{field}' missing required key '{req}'")
 
-    if spec.type == "object" and spec.properties is not None:
-        for req in spec.required or []:
-            if req not in value:
-                raise ValueError(f"Field '{field}' missing required key '{req}'")
+            for child_name, child_check in children.items():
+                if child_name in value:
+                    child_check(f"{field}.{child_name}", value[child_name])
 
-        for child_name, child_spec in spec.properties.items():
-            if child_name in value:
-                _validate_value(f"{field}.{child_name}", value[child_name], child_spec)
+            extras = [k for k in value.keys() if k not in children]
+            if extras:
+                raise ValueError(f"Field '{field}' has unknown keys {extras}")
 
-        extras = [k for k in value.keys() if k not in spec.properties]
-        if extras:
-            raise ValueError(f"Field '{field}' has unknown keys {extras}")
+            _validate_constraints_for_payload(f"Field '{field}'", constraints, value)
 
-        _validate_constraints_for_payload(f"Field '{field}'", spec.constraints, value)
+    return validate
 
 
 def _property_to_json(spec: PropertySpec) -> Dict[str, Any]:
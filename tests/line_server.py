@@ -0,0 +1,78 @@
+"""Newline-delimited JSON test server shared by the bridge and gateway client tests."""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import tempfile
+import threading
+
+
+class LineServer:
+    """Answers each JSON line with its `key` field and the connection number it arrived on.
+
+    Listens on loopback TCP, or on a Unix socket in a temporary directory when
+    `unix` is set. `close_after` closes a connection after that many replies,
+    `drop_after` closes it on the next request without replying, and `stray`
+    is sent right after every reply as bytes no request asked for.
+    """
+
+    def __init__(
+        self,
+        key: str = "action",
+        unix: bool = False,
+        close_after: int = 0,
+        drop_after: int = 0,
+        stray: bytes = b"",
+    ):
+        self._tmpdir = None
+        if unix:
+            self._tmpdir = tempfile.TemporaryDirectory()
+            self.path = os.path.join(self._tmpdir.name, "server.sock")
+            self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._listener.bind(self.path)
+        else:
+            self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._listener.bind(("127.0.0.1", 0))
+            self.port = self._listener.getsockname()[1]
+        self._listener.listen(8)
+        self.accepted = 0
+        self.received = []
+        self.closed = threading.Event()
+        self._key = key
+        self._close_after = close_after
+        self._drop_after = drop_after
+        self._stray = stray
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self._listener.accept()
+            except OSError:
+                return
+            self.accepted += 1
+            threading.Thread(target=self._handle, args=(conn, self.accepted), daemon=True).start()
+
+    def _handle(self, conn, number):
+        served = 0
+        with conn, conn.makefile("rb") as reader:
+            for line in reader:
+                request = json.loads(line)
+                self.received.append(request.get(self._key))
+                if self._drop_after and served >= self._drop_after:
+                    break
+                reply = {"ok": True, self._key: request.get(self._key), "connection": number}
+                if "pad" in request:
+                    reply["pad"] = "x" * int(request["pad"])
+                conn.sendall((json.dumps(reply) + "\n").encode("ascii") + self._stray)
+                served += 1
+                if self._close_after and served >= self._close_after:
+                    break
+        self.closed.set()
+
+    def close(self):
+        self._listener.close()
+        if self._tmpdir is not None:
+            self._tmpdir.cleanup()
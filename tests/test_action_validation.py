@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import inspect
+import unittest
+
+from Gateway_Remote.action_registry import ActionSpec, _signature_contract
+from Gateway_Remote.action_validation import validate_payload
+from Gateway_Remote.liveapi_tools import LiveAPITools
+
+
+def _handler(**kwargs):
+    return {"ok": True}
+
+
+class ActionValidationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.spec = ActionSpec(
+            name="build_device_chain",
+            handler=_handler,
+            required=("devices", "track_name"),
+            optional=("position",),
+        )
+
+    def test_accepts_known_fields(self) -> None:
+        payload = {"action": "build_device_chain", "devices": [], "track_name": "Bass", "position": "end"}
+        self.assertIsNone(validate_payload(self.spec, payload))
+
+    def test_reports_all_missing_fields_sorted(self) -> None:
+        result = validate_payload(self.spec, {"action": "build_device_chain"})
+        self.assertFalse(result["ok"])
+        self.assertEqual(result["error"], "Missing required fields: ['devices', 'track_name']")
+
+    def test_reports_all_unexpected_fields_sorted(self) -> None:
+        payload = {"devices": [], "track_name": "Bass", "zeta": 1, "alpha": 2}
+        result = validate_payload(self.spec, payload)
+        self.assertEqual(result["error"], "Unexpected fields: ['alpha', 'zeta']")
+
+    def test_allow_extra_skips_unexpected_field_check(self) -> None:
+        spec = ActionSpec(name="free", handler=_handler, required=("devices",), allow_extra=True)
+        self.assertIsNone(validate_payload(spec, {"devices": [], "anything": 1}))
+
+
+class ActionContractTests(unittest.TestCase):
+    def test_declared_contracts_match_handler_signatures(self) -> None:
+        tools = LiveAPITools(song=None, c_instance=None)
+        for name in LiveAPITools.__exported_actions__:
+            handler = getattr(tools, name)
+            with self.subTest(action=name):
+                signature = inspect.signature(handler)
+                required, optional, allow_extra = _signature_contract(signature)
+                self.assertEqual(handler._action_contract, (required, optional, allow_extra))
+
+
+if __name__ == "__main__":
+    unittest.main()
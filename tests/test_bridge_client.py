@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import unittest
+
+from ableton_chain_mcp.mcp_server.bridge_client import BridgeClient, BridgeClientError
+from line_server import LineServer
+
+
+class TestBridgeClient(unittest.TestCase):
+    def test_reuses_one_connection_across_requests(self):
+        server = LineServer(key="type", unix=True)
+        self.addCleanup(server.close)
+        client = BridgeClient(server.path)
+        self.addCleanup(client.close)
+
+        replies = [client.request({"type": "ping", "n": i}) for i in range(5)]
+
+        self.assertEqual({reply["connection"] for reply in replies}, {1})
+        self.assertEqual(server.accepted, 1)
+
+    def test_reconnects_when_bridge_drops_kept_alive_connection(self):
+        server = LineServer(key="type", unix=True, close_after=1)
+        self.addCleanup(server.close)
+        client = BridgeClient(server.path)
+        self.addCleanup(client.close)
+
+        first = client.request({"type": "ping"})
+        self.assertTrue(server.closed.wait(2.0))
+        second = client.request({"type": "health_check"})
+
+        self.assertEqual(first["connection"], 1)
+        self.assertEqual(second["connection"], 2)
+        self.assertEqual(second["type"], "health_check")
+
+    def test_stray_bytes_after_reply_are_not_read_as_next_reply(self):
+        server = LineServer(key="type", unix=True, stray=b'{"ok": false, "type": "stray"}\n')
+        self.addCleanup(server.close)
+        client = BridgeClient(server.path)
+        self.addCleanup(client.close)
+
+        first = client.request({"type": "ping"})
+        second = client.request({"type": "health_check"})
+
+        self.assertEqual(first["type"], "ping")
+        self.assertEqual(second["type"], "health_check")
+        self.assertEqual(second["connection"], 2)
+
+    def test_request_lost_after_write_is_not_resent(self):
+        server = LineServer(key="type", unix=True, drop_after=1)
+        self.addCleanup(server.close)
+        client = BridgeClient(server.path)
+        self.addCleanup(client.close)
+
+        client.request({"type": "ping"})
+        with self.assertRaises(BridgeClientError):
+            client.request({"type": "execute"})
+
+        self.assertEqual(server.received, ["ping", "execute"])
+        self.assertEqual(server.accepted, 1)
+
+    def test_threads_are_spread_across_shard_connections(self):
+        server = LineServer(key="type", unix=True)
+        self.addCleanup(server.close)
+        client = BridgeClient(server.path, shards=2)
+        self.addCleanup(client.close)
+        connections = []
+
+        def call():
+            for _ in range(3):
+                connections.append(client.request({"type": "ping"})["connection"])
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(connections), 12)
+        self.assertEqual(server.accepted, 2)
+        self.assertEqual(len(set(connections)), 2)
+
+    def test_missing_socket_raises_client_error(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = BridgeClient(os.path.join(tmpdir, "missing.sock"))
+            with self.assertRaises(BridgeClientError):
+                client.request({"type": "ping"})
+            self.assertFalse(client.ping())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 import json
+import os
+import socket
+import tempfile
+import threading
+import time
 import unittest
 
 from ableton_chain_mcp.bridge.adapters.lom_adapter import LOMAdapter
 from ableton_chain_mcp.bridge.server import BridgeServer
-from ableton_chain_mcp.constants import ERROR_GATEWAY_INCOMPATIBLE, SCHEMA_PATH
+from ableton_chain_mcp.constants import ERROR_GATEWAY_INCOMPATIBLE, HEALTH_READY, SCHEMA_PATH
+from ableton_chain_mcp.mcp_server.bridge_client import BridgeClient
 from ableton_chain_mcp.schema_loader import ActionSchema
 
 
@@ -14,8 +20,13 @@ class _FakeGateway:
         self.available_actions = list(available_actions)
         self.host = "127.0.0.1"
         self.port = 8001
+        self.closed = False
+
+    def close(self):
+        self.closed = True
 
     def ping(self):
+        self.pings = getattr(self, "pings", 0) + 1
         return True
 
     def send_payload(self, payload, timeout_sec=None):
@@ -90,6 +101,144 @@ class TestBridgeServerCompatibility(unittest.TestCase):
         )
         self.assertTrue(execute["ok"])
 
+    def _start_server(self, server: BridgeServer) -> threading.Thread:
+        socket_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(socket_dir.cleanup)
+        server.socket_path = os.path.join(socket_dir.name, "bridge.sock")
+        server._monitor_gateway_loop = lambda: None  # type: ignore[method-assign]
+        runner = threading.Thread(target=server.start, daemon=True)
+        runner.start()
+        self.addCleanup(server.stop)
+        for _ in range(50):
+            if os.path.exists(server.socket_path):
+                break
+            time.sleep(0.02)
+        return runner
+
+    def _connect(self, server: BridgeServer) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.addCleanup(sock.close)
+        sock.settimeout(5.0)
+        sock.connect(server.socket_path)
+        return sock
+
+    def test_client_lines_are_answered_pipelined_and_split(self) -> None:
+        gateway = _FakeGateway(["inspect_track_chain", "health_check", "build_device_chain", "update_device_parameters"])
+        server = self._make_server_with_gateway(gateway)
+        self._start_server(server)
+        ours = self._connect(server)
+
+        first = json.dumps({"type": "health_check", "correlation_id": "a"})
+        second = json.dumps({"type": "bridge_capabilities", "correlation_id": "b"})
+        ours.sendall((first + "\r\n \n" + second[:10]).encode("utf-8"))
+        time.sleep(0.05)
+        ours.sendall((second[10:] + "\n").encode("utf-8"))
+        ours.shutdown(socket.SHUT_WR)
+        replies = [json.loads(line) for line in ours.makefile("rb")]
+
+        self.assertEqual([reply["correlation_id"] for reply in replies], ["a", "b"])
+
+    def test_idle_clients_do_not_hold_workers(self) -> None:
+        server = self._make_server_with_gateway(_FakeGateway(["inspect_track_chain", "health_check"]))
+        self._start_server(server)
+        idle = [self._connect(server) for _ in range(server._client_executor._max_workers + 2)]
+        for sock in idle:
+            sock.sendall(b'{"type": "ping"}\n')
+            self.assertTrue(json.loads(sock.makefile("rb").readline())["ok"])
+
+        late = self._connect(server)
+        late.sendall(b'{"type": "ping"}\n')
+
+        self.assertTrue(json.loads(late.makefile("rb").readline())["ok"])
+
+    def test_stop_closes_kept_alive_clients(self) -> None:
+        server = self._make_server_with_gateway(_FakeGateway(["inspect_track_chain", "health_check"]))
+        runner = self._start_server(server)
+        ours = self._connect(server)
+        reader = ours.makefile("rb")
+        ours.sendall(b'{"type": "ping"}\n')
+        self.assertTrue(json.loads(reader.readline())["ok"])
+
+        server.stop()
+        runner.join(2.0)
+
+        self.assertFalse(runner.is_alive())
+        self.assertEqual(reader.readline(), b"")
+        self.assertEqual(server._clients, set())
+        self.assertTrue(server._gateway.closed)
+
+    def test_start_returns_after_stop(self) -> None:
+        server = self._make_server_with_gateway(_FakeGateway(["inspect_track_chain", "health_check"]))
+        runner = self._start_server(server)
+        client = BridgeClient(server.socket_path)
+        self.addCleanup(client.close)
+
+        self.assertTrue(client.request({"type": "ping"})["ok"])
+        server.stop()
+        runner.join(2.0)
+
+        self.assertFalse(runner.is_alive())
+
+    def test_monitor_skips_ping_after_recent_success_and_stops_promptly(self) -> None:
+        gateway = _FakeGateway(["inspect_track_chain", "health_check"])
+        server = self._make_server_with_gateway(gateway)
+        server._running = True  # type: ignore[attr-defined]
+        server._last_gateway_success_mono = time.monotonic()  # type: ignore[attr-defined]
+        monitor = threading.Thread(target=server._monitor_gateway_loop, daemon=True)
+        monitor.start()
+        time.sleep(0.05)
+
+        server.stop()
+        monitor.join(1.0)
+
+        self.assertFalse(monitor.is_alive())
+        self.assertEqual(getattr(gateway, "pings", 0), 0)
+        self.assertEqual(server._state_snapshot()["state"], HEALTH_READY)
+
+    def test_concurrent_capability_refreshes_share_one_discovery(self) -> None:
+        gateway = _FakeGateway(["inspect_track_chain", "health_check", "build_device_chain", "update_device_parameters"])
+        send_payload = gateway.send_payload
+        discoveries = []
+
+        def slow_send_payload(payload, timeout_sec=None):
+            discoveries.append(payload["action"])
+            time.sleep(0.1)
+            return send_payload(payload, timeout_sec)
+
+        gateway.send_payload = slow_send_payload
+        server = self._make_server_with_gateway(gateway)
+        threads = [threading.Thread(target=server._refresh_capabilities, kwargs={"force": True}) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(discoveries, ["get_available_tools"])
+        self.assertTrue(server._capabilities_snapshot()["compatible"])
+
+    def test_capability_refresh_skips_when_published_before_lock(self) -> None:
+        gateway = _FakeGateway(["inspect_track_chain", "health_check", "build_device_chain", "update_device_parameters"])
+        server = self._make_server_with_gateway(gateway)
+        discoveries = []
+        lock = server._refresh_lock
+
+        class _LockTakenAfterOtherRefresh:
+            # Another thread finishes a refresh just before this caller
+            # takes the lock.
+            def acquire(self, *args, **kwargs):
+                server._capabilities_checked_ns = time.monotonic_ns()
+                return lock.acquire(*args, **kwargs)
+
+            def release(self):
+                lock.release()
+
+        server._refresh_lock = _LockTakenAfterOtherRefresh()  # type: ignore[assignment]
+        server._discover_gateway_actions = lambda: discoveries.append(1) or (set(), None, None)  # type: ignore[method-assign]
+
+        server._refresh_capabilities(force=False)
+
+        self.assertEqual(discoveries, [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -313,6 +313,55 @@ class TestChainTools(unittest.TestCase):
         self.assertEqual(int(mode_param.value), 2)
         self.assertEqual(result["steps_executed"][0]["parameters_applied"][0]["mode"], "display_text_fallback")
 
+    def test_build_device_chain_reuses_browser_lookup_for_repeated_device(self):
+        tools, song = self._build_tools()
+        lookups = []
+        original = tools._find_browser_device
+
+        def counting_find(browser, name):
+            lookups.append(name)
+            return original(browser, name)
+
+        tools._find_browser_device = counting_find
+        result = tools.build_device_chain(steps=[{"device_name": "eq8"}, {"device_name": "eq8"}])
+
+        self.assertTrue(result["ok"])
+        self.assertEqual(len(song.tracks[0].devices), 2)
+        self.assertEqual(lookups, ["EQ Eight"])
+
+    def test_browser_search_prefers_exact_name_over_earlier_partial(self):
+        tools, _ = self._build_tools()
+        exact = _BrowserItem("Compressor", lambda: None)
+        partial = _BrowserItem("Glue Compressor", lambda: None)
+        # The stack pops the last child first, so the partial match is seen first.
+        found = tools._search_browser_node(_BrowserGroup([exact, partial]), "compressor")
+        self.assertIs(found, exact)
+
+        found = tools._search_browser_node(_BrowserGroup([partial]), "compressor")
+        self.assertIs(found, partial)
+
+    def test_display_text_sweep_is_cached_per_parameter(self):
+        tools, _ = self._build_tools()
+        param = _Param("Filter Type", value=0.0, p_min=0.0, p_max=2.0, is_quantized=True, unit="mode")
+        calls = []
+        original = param.str_for_value
+
+        def counting_str_for_value(value):
+            calls.append(value)
+            return original(value)
+
+        param.str_for_value = counting_str_for_value
+        first = tools._set_parameter_by_display_text(param, target_display_text="band pass", fallback_value=None)
+        swept = len(calls)
+        second = tools._set_parameter_by_display_text(param, target_display_text="high pass", fallback_value=None)
+
+        self.assertTrue(first["ok"])
+        self.assertEqual(int(param.value), 1)
+        self.assertTrue(second["exact_match"])
+        # The second write skips the sweep: only the mode probe and final readback run.
+        self.assertLessEqual(len(calls) - swept, 3)
+        self.assertGreater(swept, 3)
+
     def test_build_device_chain_handles_unknown_parameter(self):
         tools, _ = self._build_tools()
         result = tools.build_device_chain(
@@ -348,6 +397,99 @@ class TestChainTools(unittest.TestCase):
         assert parsed is not None
         self.assertGreater(parsed, 6000.0)
 
+    def test_display_verify_warm_starts_repeated_writes(self):
+        tools, _ = self._build_tools()
+        calls = []
+
+        class _CountingHzParam(_Param):
+            def str_for_value(self, value):
+                calls.append(value)
+                return super().str_for_value(value)
+
+        param = _CountingHzParam("Frequency", value=0.0, unit="hz")
+        first = tools._set_parameter_with_verify(
+            param, target_display_value=550.0, target_unit="hz", fallback_value=None
+        )
+        cold_calls = len(calls)
+        second = tools._set_parameter_with_verify(
+            param, target_display_value=550.0, target_unit="hz", fallback_value=None
+        )
+
+        self.assertTrue(first["exact_match"])
+        self.assertTrue(second["exact_match"])
+        self.assertAlmostEqual(second["value"], first["value"])
+        self.assertLess(len(calls) - cold_calls, cold_calls)
+
+    def test_display_verify_interpolates_linear_mappings(self):
+        tools, _ = self._build_tools()
+        calls = []
+
+        class _CountingDbParam(_Param):
+            def str_for_value(self, value):
+                calls.append(value)
+                return super().str_for_value(value)
+
+        param = _CountingDbParam("Gain", value=0.0, unit="db")
+        result = tools._set_parameter_with_verify(
+            param, target_display_value=-40.0, target_unit="db", fallback_value=None
+        )
+
+        self.assertTrue(result["exact_match"])
+        self.assertEqual(result["display"], "-40.0 dB")
+        self.assertLessEqual(len(calls), 6)
+
+    def test_display_verify_searches_quantized_steps(self):
+        tools, _ = self._build_tools()
+        calls = []
+
+        class _SemitoneParam(_Param):
+            def str_for_value(self, value):
+                calls.append(value)
+                return f"{int(round(float(value))) - 48} st"
+
+        param = _SemitoneParam("Transpose", value=0.0, p_min=0.0, p_max=96.0, is_quantized=True)
+        result = tools._set_parameter_with_verify(
+            param, target_display_value=7.0, target_unit=None, fallback_value=None
+        )
+
+        self.assertTrue(result["exact_match"])
+        self.assertEqual(int(param.value), 55)
+        self.assertLess(len(calls), 12)
+
+    def test_display_verify_scans_non_monotonic_quantized_steps(self):
+        tools, _ = self._build_tools()
+        displays = ["1", "8", "3", "5", "2", "9"]
+
+        class _ShuffledParam(_Param):
+            def str_for_value(self, value):
+                return displays[int(round(float(value)))]
+
+        param = _ShuffledParam("Ratio", value=0.0, p_min=0.0, p_max=5.0, is_quantized=True)
+        result = tools._set_parameter_with_verify(
+            param, target_display_value=5.0, target_unit=None, fallback_value=None
+        )
+
+        self.assertTrue(result["exact_match"])
+        self.assertEqual(int(param.value), 3)
+
+    def test_display_verify_rejects_bracket_on_shuffled_quantized_steps(self):
+        tools, _ = self._build_tools()
+        # Every bisection probe lands inside its bracket, so only the step
+        # order check exposes that the table is not monotonic.
+        displays = ["14", "21", "16", "3", "24"]
+
+        class _ShuffledParam(_Param):
+            def str_for_value(self, value):
+                return displays[int(round(float(value)))]
+
+        param = _ShuffledParam("Ratio", value=0.0, p_min=0.0, p_max=4.0, is_quantized=True)
+        result = tools._set_parameter_with_verify(
+            param, target_display_value=5.0, target_unit=None, fallback_value=None
+        )
+
+        self.assertFalse(result["exact_match"])
+        self.assertEqual(int(param.value), 3)
+
     def test_convert_display_number_for_unit_khz_to_hz(self):
         tools, _ = self._build_tools()
         converted = tools._convert_display_number_for_unit(8.0, "8.00 kHz", "hz")
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+import unittest
+
+from ableton_chain_mcp.envelope import envelope_ok, ensure_normalized_envelope
+
+
+class TestEnsureNormalizedEnvelope(unittest.TestCase):
+    def test_decoded_bridge_envelope_is_returned_unchanged(self) -> None:
+        wire = json.dumps(envelope_ok(message="ok", route_used="api", duration_ms=1.5, correlation_id="cid", payload={"a": 1}))
+        response = json.loads(wire)
+
+        self.assertIs(ensure_normalized_envelope(response, fallback_route="bridge", correlation_id="cid"), response)
+
+    def test_loosely_typed_envelope_is_coerced(self) -> None:
+        response = {
+            "ok": 1,
+            "error_code": None,
+            "message": "ok",
+            "route_used": "api",
+            "duration_ms": 3,
+            "correlation_id": "cid",
+            "payload": None,
+        }
+
+        result = ensure_normalized_envelope(response, fallback_route="bridge", correlation_id="cid")
+
+        self.assertIsNot(result, response)
+        self.assertIs(result["ok"], True)
+        self.assertEqual(result["duration_ms"], 3.0)
+        self.assertIsInstance(result["duration_ms"], float)
+        self.assertEqual(result["payload"], {})
+
+    def test_extra_keys_are_dropped(self) -> None:
+        response = envelope_ok(message="ok", route_used="api", duration_ms=0.0, correlation_id="cid")
+        response["debug"] = True
+
+        result = ensure_normalized_envelope(response, fallback_route="bridge", correlation_id="cid")
+
+        self.assertNotIn("debug", result)
+
+
+if __name__ == "__main__":
+    unittest.main()
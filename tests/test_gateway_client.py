@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import socket
+import threading
+import unittest
+
+from ableton_chain_mcp.bridge.gateway_client import GatewayClientError, GatewayTCPClient
+from line_server import LineServer
+
+
+class TestGatewayTCPClient(unittest.TestCase):
+    def test_reuses_one_connection_across_requests(self):
+        server = LineServer()
+        self.addCleanup(server.close)
+        client = GatewayTCPClient("127.0.0.1", server.port)
+        self.addCleanup(client.close)
+
+        replies = [client.send_payload({"action": "ping", "n": i}) for i in range(5)]
+
+        self.assertEqual({reply["connection"] for reply in replies}, {1})
+        self.assertEqual(server.accepted, 1)
+
+    def test_reads_replies_larger_than_one_receive(self):
+        server = LineServer()
+        self.addCleanup(server.close)
+        client = GatewayTCPClient("127.0.0.1", server.port)
+        self.addCleanup(client.close)
+
+        large = client.send_payload({"action": "inspect_track_chain", "pad": 200000})
+        small = client.send_payload({"action": "ping"})
+
+        self.assertEqual(len(large["pad"]), 200000)
+        self.assertEqual(small["action"], "ping")
+        self.assertEqual(server.accepted, 1)
+
+    def test_concurrent_requests_use_separate_pooled_connections(self):
+        server = LineServer()
+        self.addCleanup(server.close)
+        client = GatewayTCPClient("127.0.0.1", server.port, pool_size=2)
+        self.addCleanup(client.close)
+        replies = []
+        barrier = threading.Barrier(4)
+
+        def call(index):
+            barrier.wait()
+            replies.append(client.send_payload({"action": "ping", "n": index}))
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        accepted = server.accepted
+        follow_up = client.send_payload({"action": "ping"})
+
+        self.assertEqual(len(replies), 4)
+        self.assertTrue(all(reply["ok"] for reply in replies))
+        self.assertEqual(server.accepted, accepted)
+        self.assertLessEqual(len(client._idle), 2)
+        self.assertTrue(follow_up["ok"])
+
+    def test_reconnects_when_gateway_drops_kept_alive_connection(self):
+        server = LineServer(close_after=1)
+        self.addCleanup(server.close)
+        client = GatewayTCPClient("127.0.0.1", server.port)
+        self.addCleanup(client.close)
+
+        first = client.send_payload({"action": "ping"})
+        self.assertTrue(server.closed.wait(2.0))
+        second = client.send_payload({"action": "health_check"})
+
+        self.assertEqual(first["connection"], 1)
+        self.assertEqual(second["connection"], 2)
+        self.assertEqual(second["action"], "health_check")
+
+    def test_stray_bytes_after_reply_are_not_read_as_next_reply(self):
+        server = LineServer(stray=b'{"ok": false, "action": "stray"}\n')
+        self.addCleanup(server.close)
+        client = GatewayTCPClient("127.0.0.1", server.port)
+        self.addCleanup(client.close)
+
+        first = client.send_payload({"action": "ping"})
+        second = client.send_payload({"action": "health_check"})
+
+        self.assertEqual(first["action"], "ping")
+        self.assertEqual(second["action"], "health_check")
+
+    def test_request_lost_after_write_is_not_resent(self):
+        server = LineServer(drop_after=1)
+        self.addCleanup(server.close)
+        client = GatewayTCPClient("127.0.0.1", server.port)
+        self.addCleanup(client.close)
+
+        client.send_payload({"action": "ping"})
+        with self.assertRaises(GatewayClientError):
+            client.send_payload({"action": "build_device_chain"})
+
+        self.assertEqual(server.received, ["ping", "build_device_chain"])
+        self.assertEqual(server.accepted, 1)
+
+    def test_connection_refused_raises_client_error(self):
+        probe = socket.socket()
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+        probe.close()
+
+        client = GatewayTCPClient("127.0.0.1", port, timeout_sec=0.5)
+        with self.assertRaises(GatewayClientError):
+            client.send_payload({"action": "ping"})
+        self.assertFalse(client.ping())
+
+
+if __name__ == "__main__":
+    unittest.main()
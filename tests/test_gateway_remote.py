@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import json
+import selectors
+import socket
+import time
+import unittest
+
+import Gateway_Remote
+from Gateway_Remote import MAX_OUTBUF_BYTES, MAX_PENDING_REQUESTS, GatewayRemote
+from Gateway_Remote.action_registry import ActionSpec
+
+
+class _Song:
+    pass
+
+
+class _CInstance:
+    def __init__(self):
+        self.messages = []
+
+    def song(self):
+        return _Song()
+
+    def log_message(self, message):
+        self.messages.append(message)
+
+
+class TestGatewayRemote(unittest.TestCase):
+    def setUp(self) -> None:
+        self.gateway = GatewayRemote(_CInstance(), port=0)
+        self.addCleanup(self.gateway.disconnect)
+        self.calls = []
+
+        def echo(**payload):
+            self.calls.append(payload)
+            return {"ok": True, "echo": payload.get("n"), "pad": "x" * int(payload.get("pad", 0))}
+
+        self.gateway.action_registry["echo"] = ActionSpec(name="echo", handler=echo, allow_extra=True)
+        port = self.gateway.server_socket.getsockname()[1]
+        self.client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # A small receive window lets unread replies back up into the gateway.
+        self.client.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+        self.client.settimeout(5.0)
+        self.client.connect(("127.0.0.1", port))
+        self.addCleanup(self.client.close)
+        self.reader = self.client.makefile("rb")
+        self.addCleanup(self.reader.close)
+
+    def _send(self, *commands) -> None:
+        self.client.sendall(b"".join(json.dumps(command).encode("ascii") + b"\n" for command in commands))
+
+    def _run_main_thread(self, until, timeout: float = 5.0) -> None:
+        # Stands in for Live calling update_display once per frame.
+        deadline = time.monotonic() + timeout
+        while not until():
+            self.assertLess(time.monotonic(), deadline)
+            self.gateway.update_display()
+            time.sleep(0.005)
+
+    def _connection(self):
+        deadline = time.monotonic() + 5.0
+        while not self.gateway._connections:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.005)
+        return next(iter(self.gateway._connections.values()))
+
+    def test_builtin_reply_does_not_overtake_queued_request(self) -> None:
+        self._send({"action": "echo", "n": 1}, {"action": "ping"}, {"action": "echo", "n": 2})
+
+        replies = []
+        self._run_main_thread(lambda: len(self.calls) == 2)
+        for _ in range(3):
+            replies.append(json.loads(self.reader.readline()))
+
+        self.assertEqual(replies[0]["echo"], 1)
+        self.assertEqual(replies[1]["message"], "GatewayRemote online")
+        self.assertEqual(replies[2]["echo"], 2)
+
+    def test_unanswered_request_times_out(self) -> None:
+        timeout = Gateway_Remote.COMMAND_TIMEOUT
+        Gateway_Remote.COMMAND_TIMEOUT = 0.05
+        self.addCleanup(setattr, Gateway_Remote, "COMMAND_TIMEOUT", timeout)
+
+        self._send({"action": "echo", "n": 1})
+        reply = json.loads(self.reader.readline())
+
+        self.assertFalse(reply["ok"])
+        self.assertIn("timeout", reply["error"])
+
+    def test_pipelined_requests_pause_reads_until_backlog_drains(self) -> None:
+        total = MAX_PENDING_REQUESTS * 4
+        conn = self._connection()
+        self._send(*({"action": "echo", "n": n} for n in range(total)))
+        deadline = time.monotonic() + 5.0
+        while len(self.gateway.command_queue) < MAX_PENDING_REQUESTS:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.005)
+        time.sleep(0.05)
+
+        self.assertEqual(len(self.gateway.command_queue), MAX_PENDING_REQUESTS)
+        self.assertEqual(conn.events, 0)
+        self.assertTrue(conn.inbuf)
+
+        self._run_main_thread(lambda: len(self.calls) == total)
+        replies = [json.loads(self.reader.readline()) for _ in range(total)]
+
+        self.assertEqual([reply["echo"] for reply in replies], list(range(total)))
+
+    def test_unread_responses_pause_reads_and_flush_in_order(self) -> None:
+        pad = MAX_OUTBUF_BYTES // 2
+        total = 32
+        conn = self._connection()
+        conn.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+        self._send(*({"action": "echo", "n": n, "pad": pad} for n in range(total)))
+
+        self._run_main_thread(lambda: len(conn.outbuf) >= MAX_OUTBUF_BYTES)
+
+        self.assertEqual(conn.events, selectors.EVENT_WRITE)
+        self.assertLess(len(self.calls), total)
+
+        replies = []
+        while len(replies) < total:
+            self.gateway.update_display()
+            replies.append(json.loads(self.reader.readline()))
+
+        self.assertEqual([reply["echo"] for reply in replies], list(range(total)))
+        self.assertTrue(all(len(reply["pad"]) == pad for reply in replies))
+
+    def test_invalid_json_is_answered_in_order(self) -> None:
+        self.client.sendall(b'{"action": "echo", "n": 1}\nnot json\n')
+
+        self._run_main_thread(lambda: self.calls)
+        first = json.loads(self.reader.readline())
+        second = json.loads(self.reader.readline())
+
+        self.assertEqual(first["echo"], 1)
+        self.assertEqual(second["error_code"], "ERR_INVALID_PARAMS")
+
+
+if __name__ == "__main__":
+    unittest.main()
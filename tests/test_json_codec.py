@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import json
+import unittest
+
+from ableton_chain_mcp.json_codec import JSONDecodeError, dumps, dumps_line, loads
+
+
+class TestJsonCodec(unittest.TestCase):
+    def test_dumps_line_round_trips_as_one_frame(self) -> None:
+        frame = dumps_line({"type": "execute", "payload": {"name": "Délai", "values": [1, 2.5, None]}})
+
+        self.assertTrue(frame.endswith(b"\n"))
+        self.assertEqual(frame.count(b"\n"), 1)
+        self.assertEqual(loads(frame), {"type": "execute", "payload": {"name": "Délai", "values": [1, 2.5, None]}})
+
+    def test_dumps_accepts_inputs_only_the_stdlib_handles(self) -> None:
+        self.assertEqual(json.loads(dumps({1: "a"})), {"1": "a"})
+
+    def test_invalid_input_raises_stdlib_decode_error(self) -> None:
+        with self.assertRaises(JSONDecodeError):
+            loads(b"{not json")
+
+
+if __name__ == "__main__":
+    unittest.main()
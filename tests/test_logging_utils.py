@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import json
+import logging
+import unittest
+from datetime import datetime, timezone
+
+from ableton_chain_mcp.logging_utils import JsonFormatter
+
+
+class TestJsonFormatter(unittest.TestCase):
+    def test_timestamp_matches_utc_isoformat_of_record_time(self) -> None:
+        formatter = JsonFormatter()
+        for created in (1760566071.967034, 1760566071.5, 1760566072.000001):
+            record = logging.LogRecord("bridge", logging.INFO, __file__, 1, "hello", None, None)
+            record.created = created
+            with self.subTest(created=created):
+                line = json.loads(formatter.format(record))
+                self.assertEqual(line["timestamp"], datetime.fromtimestamp(created, timezone.utc).isoformat(timespec="microseconds"))
+                self.assertEqual(line["message"], "hello")
+
+    def test_extra_fields_are_merged(self) -> None:
+        record = logging.LogRecord("bridge", logging.WARNING, __file__, 1, "listening", None, None)
+        record.extra_fields = {"socket_path": "/tmp/bridge.sock"}
+
+        line = json.loads(JsonFormatter().format(record))
+
+        self.assertEqual(line["level"], "warning")
+        self.assertEqual(line["socket_path"], "/tmp/bridge.sock")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -41,6 +41,28 @@ class TestMcpServer(unittest.TestCase):
         self.assertIn("ok", content)
         self.assertEqual(content.get("correlation_id"), "cid")
 
+    def test_batch_returns_one_response_per_entry_in_order(self) -> None:
+        server = MCPServer(log_level="ERROR")
+        responses = server.handle_jsonrpc(
+            [
+                {"jsonrpc": "2.0", "id": "a", "method": "ping"},
+                "not-an-object",
+                {"jsonrpc": "2.0", "id": "b", "method": "missing/method"},
+                {"jsonrpc": "2.0", "id": "c", "method": "tools/list"},
+            ]
+        )
+
+        self.assertEqual([response.get("id") for response in responses], ["a", None, "b", "c"])
+        self.assertEqual(responses[0]["result"], {"ok": True})
+        self.assertEqual(responses[1]["error"]["code"], -32600)
+        self.assertEqual(responses[2]["error"]["code"], -32601)
+        self.assertIn("tools", responses[3]["result"])
+
+    def test_empty_batch_is_invalid_request(self) -> None:
+        server = MCPServer(log_level="ERROR")
+        response = server.handle_jsonrpc([])
+        self.assertEqual(response["error"]["code"], -32600)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import threading
+import unittest
+
+from ableton_chain_mcp.observability import EventStream, MetricsStore, TraceStore
+
+
+class TestMetricsStore(unittest.TestCase):
+    def test_snapshot_sums_increments_from_live_and_finished_threads(self) -> None:
+        metrics = MetricsStore()
+        started = threading.Barrier(5)
+        counted = threading.Barrier(3)
+        release = threading.Event()
+
+        def bump(hold: bool) -> None:
+            started.wait()
+            for _ in range(1000):
+                metrics.inc("tool_calls_total")
+            metrics.inc("tool_duration_ms", 2.5)
+            if hold:
+                counted.wait()
+                release.wait()
+
+        finished = [threading.Thread(target=bump, args=(False,)) for _ in range(2)]
+        held = [threading.Thread(target=bump, args=(True,)) for _ in range(2)]
+        for thread in finished + held:
+            thread.start()
+        started.wait()
+        for thread in finished:
+            thread.join()
+        counted.wait()
+        metrics.inc("tool_calls_total")
+
+        snapshot = metrics.snapshot()
+        release.set()
+        for thread in held:
+            thread.join()
+
+        self.assertEqual(snapshot["tool_calls_total"], 4001.0)
+        self.assertEqual(snapshot["tool_duration_ms"], 10.0)
+        self.assertEqual(metrics.snapshot(), snapshot)
+
+    def test_finished_thread_shards_are_folded(self) -> None:
+        metrics = MetricsStore()
+        for _ in range(10):
+            thread = threading.Thread(target=metrics.inc, args=("requests",))
+            thread.start()
+            thread.join()
+
+        self.assertEqual(metrics.snapshot(), {"requests": 10.0})
+        self.assertEqual(metrics._shards, [])
+
+
+class TestTraceStore(unittest.TestCase):
+    def test_keeps_only_the_newest_spans(self) -> None:
+        traces = TraceStore(max_traces=3)
+        for index in range(5):
+            traces.add_span(correlation_id=f"cid-{index % 2}", name=f"span-{index}", start_ms=0.0, end_ms=1.0, attrs={})
+
+        self.assertEqual([span["name"] for span in traces.list_by_correlation("cid-0")], ["span-2", "span-4"])
+        self.assertEqual([span["name"] for span in traces.list_by_correlation("cid-1")], ["span-3"])
+
+    def test_correlation_index_drops_evicted_spans(self) -> None:
+        traces = TraceStore(max_traces=4)
+        for index in range(20):
+            traces.add_span(correlation_id=f"cid-{index // 3}", name=f"span-{index}", start_ms=0.0, end_ms=1.0, attrs={})
+
+        self.assertEqual(traces.list_by_correlation("cid-0"), [])
+        self.assertEqual([span["name"] for span in traces.list_by_correlation("cid-5")], ["span-16", "span-17"])
+        self.assertEqual([span["name"] for span in traces.list_by_correlation("cid-6")], ["span-18", "span-19"])
+        self.assertEqual(sorted(traces._by_correlation), ["cid-5", "cid-6"])
+
+
+class TestEventStream(unittest.TestCase):
+    def test_unsubscribed_queues_stop_receiving_events(self) -> None:
+        events = EventStream()
+        kept = events.subscribe()
+        dropped = events.subscribe()
+
+        events.unsubscribe(dropped)
+        events.unsubscribe(dropped)
+        events.publish({"event": "tool_call", "ok": True})
+
+        self.assertEqual(kept.get_nowait(), {"event": "tool_call", "ok": True})
+        self.assertTrue(dropped.empty())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,9 +13,11 @@ class _FakeBridgeClient:
     def __init__(self, *, health_ok: bool = True, health_error_code: str | None = None):
         self._health_ok = health_ok
         self._health_error_code = health_error_code
+        self.request_types = []
 
     def request(self, payload, timeout_sec=None):
         _ = timeout_sec
+        self.request_types.append(payload.get("type"))
         if payload.get("type") == "health_check":
             if self._health_ok:
                 return {
@@ -48,9 +50,9 @@ class _FakeBridgeClient:
 
 
 class _FakeSupervisorStatus:
-    def __init__(self, running=True):
+    def __init__(self, running=True, pid=123):
         self.running = running
-        self.pid = 123 if running else None
+        self.pid = pid if running else None
         self.missed_heartbeats = 0
         self.restart_count_window = 0
         self.circuit_break_until_epoch = 0
@@ -59,9 +61,10 @@ class _FakeSupervisorStatus:
 class _FakeSupervisor:
     def __init__(self, running=True):
         self._running = running
+        self.pid = 123
 
     def status(self):
-        return _FakeSupervisorStatus(self._running)
+        return _FakeSupervisorStatus(self._running, self.pid)
 
 
 class TestOrchestrator(unittest.TestCase):
@@ -119,6 +122,60 @@ class TestOrchestrator(unittest.TestCase):
         self.assertFalse(result["ok"])
         self.assertEqual(result["error_code"], ERROR_GATEWAY_INCOMPATIBLE)
 
+    def test_recent_readiness_probe_is_reused_until_bridge_restarts(self) -> None:
+        client = _FakeBridgeClient()
+        supervisor = _FakeSupervisor(running=True)
+        orch = ExecutionOrchestrator(
+            schema=self.schema,
+            bridge_client=client,
+            bridge_supervisor=supervisor,
+            metrics=MetricsStore(),
+            traces=TraceStore(),
+            feature_flags=FeatureFlags(bridge_enabled=True),
+        )
+        arguments = {"steps": [{"device_name": "EQ Eight"}]}
+
+        for _ in range(3):
+            self.assertTrue(orch.execute_action(action_name="build_device_chain", arguments=arguments, correlation_id="cid")["ok"])
+        supervisor.pid = 456
+        self.assertTrue(orch.execute_action(action_name="build_device_chain", arguments=arguments, correlation_id="cid")["ok"])
+
+        self.assertEqual(client.request_types.count("health_check"), 2)
+        self.assertEqual(client.request_types.count("execute"), 4)
+
+    def test_metrics_keys_are_stable_across_calls(self) -> None:
+        metrics = MetricsStore()
+        orch = ExecutionOrchestrator(
+            schema=self.schema,
+            bridge_client=_FakeBridgeClient(),
+            bridge_supervisor=_FakeSupervisor(running=True),
+            metrics=metrics,
+            traces=TraceStore(),
+            feature_flags=FeatureFlags(bridge_enabled=True),
+        )
+        for _ in range(2):
+            orch.execute_action(action_name="inspect_track_chain", arguments={}, correlation_id="cid")
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["tool_calls_total|tool=action.inspect_track_chain|route=api|result=ok"], 2.0)
+        self.assertEqual(snapshot["tool_duration_ms|tool=action.inspect_track_chain|route=api"], 4.0)
+
+    def test_dry_run_leaves_caller_arguments_untouched(self) -> None:
+        orch = ExecutionOrchestrator(
+            schema=self.schema,
+            bridge_client=_FakeBridgeClient(),
+            bridge_supervisor=_FakeSupervisor(running=True),
+            metrics=MetricsStore(),
+            traces=TraceStore(),
+            feature_flags=FeatureFlags(bridge_enabled=True),
+        )
+        arguments = {"dry_run": True, "steps": [{"device_name": "EQ Eight"}]}
+
+        result = orch.execute_action(action_name="build_device_chain", arguments=arguments, correlation_id="cid")
+
+        self.assertTrue(result["ok"])
+        self.assertEqual(arguments, {"dry_run": True, "steps": [{"device_name": "EQ Eight"}]})
+
 
 if __name__ == "__main__":
     unittest.main()
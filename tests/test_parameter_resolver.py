@@ -5,7 +5,9 @@ import unittest
 from Gateway_Remote.parameter_resolver import (
     build_parameter_index,
     eq_band_rule_candidates,
+    is_eq_like,
     normalize_query,
+    precompute_aliases,
     resolve_parameter,
 )
 
@@ -33,6 +35,17 @@ class TestParameterResolver(unittest.TestCase):
         self.assertIs(index["1gaina"], params[0])
         self.assertIs(index["8frequencya"], params[1])
 
+    def test_normalize_query_matches_token_regex_for_non_ascii(self) -> None:
+        self.assertEqual(normalize_query("Ünïcode Gain"), "ncodegain")
+        self.assertEqual(normalize_query(None), "")
+        self.assertEqual(normalize_query(3.5), "35")
+
+    def test_build_parameter_index_keeps_first_duplicate(self) -> None:
+        params = [_Param("Gain"), _Param("GAIN"), _Param("")]
+        index = build_parameter_index(params)
+        self.assertIs(index["gain"], params[0])
+        self.assertEqual(list(index), ["gain"])
+
     def test_eq_band_rule_candidates(self) -> None:
         self.assertIn("8 Gain A", eq_band_rule_candidates("band8gain"))
         self.assertIn("8 Frequency A", eq_band_rule_candidates("8frequency"))
@@ -92,6 +105,46 @@ class TestParameterResolver(unittest.TestCase):
         self.assertIsNone(param)
         self.assertIsNone(trace.matched_by)
 
+    def test_resolve_with_precomputed_alias_pairs(self) -> None:
+        device = _Device("EQ Eight", "Eq8")
+        params = [_Param("1 Gain A")]
+        aliases = {"lowshelfgain": ("1 Gain", "1 Gain A")}
+        pairs = precompute_aliases(aliases)
+        self.assertEqual(pairs["lowshelfgain"], (("1 Gain", "1gain"), ("1 Gain A", "1gaina")))
+
+        param, trace = resolve_parameter(params, device, "Low Shelf Gain", aliases, alias_pairs=pairs)
+        self.assertIs(param, params[0])
+        self.assertEqual(trace.matched_by, "alias")
+        self.assertEqual(trace.candidate_chain, ["Low Shelf Gain", "1 Gain", "1 Gain A"])
+
+    def test_is_eq_like_matches_class_or_name(self) -> None:
+        self.assertTrue(is_eq_like(_Device("My EQ", "Eq8")))
+        self.assertTrue(is_eq_like(_Device("EQ Eight", "AudioEffectGroupDevice")))
+        self.assertTrue(is_eq_like(_Device("Tone", "eq-eight")))
+        self.assertFalse(is_eq_like(_Device("Compressor", "Compressor2")))
+
+    def test_resolve_uses_prebuilt_index(self) -> None:
+        device = _Device("EQ Eight", "Eq8")
+        params = [_Param("8 Gain A")]
+        index = build_parameter_index(params)
+
+        param, trace = resolve_parameter([], device, "Band 8 Gain", {}, index=index, eq_like=True)
+        self.assertIs(param, params[0])
+        self.assertEqual(trace.matched_by, "rule")
+
+    def test_resolve_sees_renamed_parameters_without_a_count_change(self) -> None:
+        device = _Device("Instrument Rack", "InstrumentGroupDevice")
+        params = [_Param("Macro 1"), _Param("Macro 2")]
+        param, _ = resolve_parameter(params, device, "Macro 1", {})
+        self.assertIs(param, params[0])
+
+        params[0].name = "Cutoff"
+        param, trace = resolve_parameter(params, device, "Cutoff", {})
+        self.assertIs(param, params[0])
+        self.assertEqual(trace.matched_by, "exact")
+        param, _ = resolve_parameter(params, device, "Macro 1", {})
+        self.assertIsNone(param)
+
 
 if __name__ == "__main__":
     unittest.main()
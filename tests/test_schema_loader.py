@@ -147,6 +147,17 @@ class TestActionSchema(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.schema.validate("inspect_track_chain", {"include_parameters": True, "extra": 1}, strict=True)
 
+    def test_compiled_validator_is_cached_and_matches_validate(self) -> None:
+        validator = self.schema.compile("inspect_track_chain")
+
+        self.assertIs(self.schema.compile("inspect_track_chain"), validator)
+        self.assertIsNot(self.schema.compile("inspect_track_chain", strict=False), validator)
+        validator({"include_parameters": True})
+        with self.assertRaisesRegex(ValueError, "unknown field 'extra'"):
+            validator({"include_parameters": True, "extra": 1})
+        with self.assertRaisesRegex(ValueError, "not defined"):
+            self.schema.compile("missing_action")
+
 
 if __name__ == "__main__":
     unittest.main()